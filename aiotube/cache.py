@@ -0,0 +1,247 @@
+import os
+import time
+import zlib
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+
+__all__ = ['ResponseCache', 'CachedResponse', 'enable_cache', 'disable_cache', 'get_cache', 'cache_stats']
+
+
+class CachedResponse:
+
+    def __init__(self, url: str, text: str, etag: Optional[str], last_modified: Optional[str], fresh: bool):
+        self.url = url
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh = fresh
+
+    def __repr__(self):
+        return f'<CachedResponse {self.url} fresh={self.fresh}>'
+
+    def validators(self) -> Dict[str, str]:
+        """Headers that ask the server to answer 304 if the page did not change"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+
+    # seconds a page stays fresh, per aiotube.https endpoint; endpoints
+    # missing here (search results, trending feeds) are never cached
+    DEFAULT_TTLS = {
+        'channel_about': 7 * 24 * 3600,
+        'channel_playlists': 24 * 3600,
+        'playlist_data': 3600,
+        'video_data': 3600,
+        'uploads_data': 300,
+        'channel_feed': 300,
+        'upcoming_videos': 300,
+        'streams_data': 120,
+    }
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024, ttls: Optional[Dict[str, float]] = None):
+        """
+        A persistent, size-bounded cache of fetched pages
+
+        Parameters
+        ----------
+        path : str
+            The sqlite file the pages are stored in
+        max_bytes : int
+            The budget for compressed bodies, least recently used pages are evicted past it
+        ttls : Dict[str, float] | None
+            Per-endpoint freshness in seconds, merged over `DEFAULT_TTLS`
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at)')
+        self._bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def __repr__(self):
+        return f'<ResponseCache {self.path}>'
+
+    def ttl(self, endpoint: Optional[str]) -> float:
+        return self.ttls.get(endpoint, 0) if endpoint else 0
+
+    def get(self, url: str, endpoint: str) -> Optional[CachedResponse]:
+        """
+        Looks up a stored page, fresh or stale
+
+        A stale entry is still returned so its validators can be sent; it is
+        only counted as a hit once it is served.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, etag, last_modified, stored_at FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            body, etag, last_modified, stored_at = row
+            fresh = time.time() - stored_at < self.ttl(endpoint)
+            if fresh:
+                self.hits += 1
+                self._conn.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (time.time(), url))
+            else:
+                self.misses += 1
+        return CachedResponse(url, zlib.decompress(body).decode('utf-8'), etag, last_modified, fresh)
+
+    def refresh(self, url: str):
+        """Marks a stale page fresh again after the server answered 304 Not Modified"""
+        now = time.time()
+        with self._lock:
+            self.revalidated += 1
+            self._conn.execute('UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?', (now, now, url))
+
+    def put(self, url: str, endpoint: str, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        body = zlib.compress(text.encode('utf-8'))
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute('SELECT size FROM responses WHERE url = ?', (url,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, endpoint, body, len(body), etag, last_modified, now, now)
+            )
+            self._bytes += len(body) - (old[0] if old else 0)
+            self.stores += 1
+            self._evict()
+
+    def _evict(self):
+        """Drops least recently used pages until the budget is met (lock held)"""
+        while self._bytes > self.max_bytes:
+            rows = self._conn.execute(
+                'SELECT url, size FROM responses ORDER BY accessed_at LIMIT 32'
+            ).fetchall()
+            if not rows:
+                self._bytes = 0
+                return
+            for url, size in rows:
+                self._conn.execute('DELETE FROM responses WHERE url = ?', (url,))
+                self._bytes -= size
+                self.evictions += 1
+                if self._bytes <= self.max_bytes:
+                    return
+
+    def expire(self, *endpoints: str):
+        """
+        Marks the stored pages of `endpoints` stale
+
+        They are kept, so the next request for them still sends their
+        validators and a 304 Not Modified is all that has to be downloaded.
+        """
+        if not endpoints:
+            return
+        with self._lock:
+            self._conn.execute(
+                f'UPDATE responses SET stored_at = 0 WHERE endpoint IN ({", ".join("?" * len(endpoints))})',
+                endpoints
+            )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+            self._bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'revalidated': self.revalidated,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'entries': entries,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def enable_cache(
+        path: Optional[str] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None
+) -> ResponseCache:
+    """
+    Turns on the process-wide response cache used by aiotube requests
+
+    Parameters
+    ----------
+    path : str | None
+        The sqlite file to store pages in, defaults to ~/.cache/aiotube/responses.sqlite3
+    max_bytes : int
+        The budget for compressed bodies
+    ttls : Dict[str, float] | None
+        Per-endpoint freshness in seconds, e.g. {'uploads_data': 60}
+
+    Returns
+    -------
+    ResponseCache
+        The cache now in use
+    """
+    global _cache
+    if path is None:
+        path = os.path.join(os.path.expanduser('~/.cache/aiotube'), 'responses.sqlite3')
+    disable_cache()
+    _cache = ResponseCache(path, max_bytes, ttls)
+    return _cache
+
+
+def disable_cache():
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+
+def get_cache() -> Optional[ResponseCache]:
+    return _cache
+
+
+def cache_stats() -> Optional[Dict[str, Any]]:
+    """Returns hit/miss/eviction counters, or None while the cache is disabled"""
+    return _cache.stats() if _cache else None
@@ -1,35 +1,97 @@
 import json
 import re
+import time
+import asyncio
+import functools
 
 from .https import (
     channel_about,
     streams_data,
     uploads_data,
+    uploads_scan,
+    channel_feed,
     channel_playlists,
-    upcoming_videos
+    upcoming_videos,
+    achannel_about,
+    astreams_data,
+    auploads_data,
+    auploads_scan,
+    achannel_feed,
+    achannel_playlists,
+    aupcoming_videos
 )
 from .video import Video
-from .pool import collect
+from .feed import FeedParser, ParseError
+from .errors import AIOError, InvalidURL
+from .pool import amap_unordered, run
+from .transport import on_io_loop, run_sync
+from .initial_data import InitialData
 from .utils import dup_filter
 from urllib.parse import unquote
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple, Union, Iterable, AsyncIterator
 from .patterns import _ChannelPatterns as Patterns
 
 
+class _MetadataField:
+    """A Channel attribute read from the about page, which is fetched on first access"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        meta = instance.metadata
+        return meta.get(self.name) if meta else None
+
+
 class Channel:
 
     _HEAD = 'https://www.youtube.com/channel/'
     _CUSTOM = 'https://www.youtube.com/c/'
     _USER = 'https://www.youtube.com/'
 
-    def __init__(self, channel_id: str):
+    id = _MetadataField()
+    name = _MetadataField()
+    subscribers = _MetadataField()
+    views = _MetadataField()
+    country = _MetadataField()
+    custom_url = _MetadataField()
+    avatar = _MetadataField()
+    banner = _MetadataField()
+    url = _MetadataField()
+    description = _MetadataField()
+    socials = _MetadataField()
+    created_at = _MetadataField()
+    video_count = _MetadataField()
+    verified = _MetadataField()
+
+    # tab name -> (sync fetcher, async fetcher) of the memoized pages
+    _PAGES = {
+        'about': (channel_about, achannel_about),
+        'uploads': (uploads_data, auploads_data),
+        'streams': (streams_data, astreams_data),
+        'upcoming': (upcoming_videos, aupcoming_videos),
+        'playlists': (channel_playlists, achannel_playlists),
+    }
+
+    def __init__(self, channel_id: str, max_age: Optional[float] = None):
         """
         Represents a YouTube channel
 
+        Nothing is downloaded until it is needed: the about page on the first
+        metadata access (name, avatar, ...), the other tabs by the properties
+        that read them. Each tab is then kept and shared by every property
+        derived from it, e.g. live, streaming_now and last_streamed cost one
+        download of /streams together.
+
         Parameters
         ----------
         channel_id : str
             The id or url or custom url or user id of the channel
+        max_age : float | None
+            Seconds a downloaded tab is reused before it is fetched again,
+            None keeps it until `refresh()` is called
         """
         pattern = re.compile("UC(.+)|c/(.+)|@(.+)")
         results = pattern.findall(channel_id)
@@ -45,89 +107,251 @@ class Channel:
         elif results[0][2]:
             self._usable_id = results[0][2]
             self._target_url = self._USER + '@' + results[0][2]
-        self.id = None
-        self.name = None
-        self.subscribers = None
-        self.views = None
-        self.country = None
-        self.custom_url = None
-        self.avatar = None
-        self.banner = None
-        self.url = None
-        self.description = None
-        self.socials = None
+        self.max_age = max_age
+        self._pages: Dict[str, Tuple[float, str]] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
         self.__meta = None
-        self._about_page = channel_about(self._target_url)
-        self.__populate()
+        self.__meta_page = None
+
+    @classmethod
+    @on_io_loop
+    async def fetch(cls, channel_id: str, max_age: Optional[float] = None) -> 'Channel':
+        """
+        Asynchronously creates a Channel without blocking the calling event loop
+
+        Parameters
+        ----------
+        channel_id : str
+            The id or url or custom url or user id of the channel
+        max_age : float | None
+            Seconds a downloaded tab is reused before it is fetched again
+
+        Returns
+        -------
+        Channel
+            The channel with its metadata already loaded
+        """
+        self = cls(channel_id, max_age)
+        await self.ametadata()
+        return self
+
+    @classmethod
+    def latest_uploads_many(
+            cls,
+            channel_ids: Iterable[str],
+            concurrency: int = 16
+    ) -> Dict[str, Union[str, None, Exception]]:
+        """
+        Fetches the last uploaded video of many channels concurrently
+
+        Parameters
+        ----------
+        channel_ids : Iterable[str]
+            Channel ids, urls or handles; repeated entries are fetched once
+        concurrency : int
+            The number of channels fetched at a time; requests to one host
+            are also capped by `aiotube.transport.configure(max_connections_per_host)`
+
+        Returns
+        -------
+        Dict[str, str | None | Exception]
+            The latest video id of every channel in input order, None if
+            it has no uploads, or the exception its fetch raised
+        """
+        return run_sync(cls.alatest_uploads_many(channel_ids, concurrency))
+
+    @classmethod
+    async def alatest_uploads_many(
+            cls,
+            channel_ids: Iterable[str],
+            concurrency: int = 16
+    ) -> Dict[str, Union[str, None, Exception]]:
+        """Async `latest_uploads_many`"""
+        unique = list(dict.fromkeys(channel_ids))
+        results = {channel_id: result async for channel_id, result in cls.aiter_latest_uploads(unique, concurrency)}
+        return {channel_id: results[channel_id] for channel_id in unique}
+
+    @classmethod
+    async def aiter_latest_uploads(
+            cls,
+            channel_ids: Iterable[str],
+            concurrency: int = 16
+    ) -> AsyncIterator[Tuple[str, Union[str, None, Exception]]]:
+        """
+        Streams the last uploaded video of many channels as each fetch finishes
+
+        Parameters
+        ----------
+        channel_ids : Iterable[str]
+            Channel ids, urls or handles; repeated entries are fetched once
+        concurrency : int
+            The number of channels fetched at a time
+
+        Yields
+        ------
+        Tuple[str, str | None | Exception]
+            (channel_id, latest video id, None or the exception raised)
+        """
+        async for channel_id, result in amap_unordered(
+                lambda channel_id: cls(channel_id).alast_uploaded(),
+                dict.fromkeys(channel_ids),
+                concurrency
+        ):
+            yield channel_id, result
+
+    @classmethod
+    async def aiter_recent_uploads(
+            cls,
+            channel_ids: Iterable[str],
+            limit: int = 1,
+            concurrency: int = 16,
+            semaphore: Optional[asyncio.Semaphore] = None
+    ) -> AsyncIterator[Tuple[str, Union[List[Dict[str, Any]], Exception]]]:
+        """
+        Streams the most recent uploads of many channels as each fetch finishes
 
-    def __populate(self):
-        """Populate channel attributes with metadata"""
-        self.__meta = self.__prepare_metadata()
-        if self.__meta:
-            for k, v in self.__meta.items():
-                setattr(self, k, v)
+        Like `aiter_latest_uploads`, but reads the channel feeds, so titles and
+        publish dates come along with the ids (see `recent_uploads`)
+
+        Parameters
+        ----------
+        channel_ids : Iterable[str]
+            Channel ids, urls or handles; repeated entries are fetched once
+        limit : int
+            The number of uploads wanted per channel
+        concurrency : int
+            The number of channels fetched at a time
+        semaphore : asyncio.Semaphore | None
+            A limit shared with the caller's other requests, used instead
+            of `concurrency`
+
+        Yields
+        ------
+        Tuple[str, List[Dict[str, Any]] | Exception]
+            (channel_id, its entries newest first or the exception raised)
+        """
+        async for channel_id, result in amap_unordered(
+                lambda channel_id: cls(channel_id).arecent_uploads(limit),
+                dict.fromkeys(channel_ids),
+                concurrency,
+                semaphore
+        ):
+            yield channel_id, result
+
+    def _cached_page(self, tab: str) -> Optional[str]:
+        entry = self._pages.get(tab)
+        if entry is None:
+            return None
+        fetched_at, page = entry
+        if self.max_age is not None and time.monotonic() - fetched_at > self.max_age:
+            del self._pages[tab]
+            return None
+        return page
+
+    def _page(self, tab: str) -> str:
+        """Returns a tab's page, downloading it only if it is not memoized or too old"""
+        page = self._cached_page(tab)
+        if page is None:
+            page = self._PAGES[tab][0](self._target_url)
+            self._pages[tab] = (time.monotonic(), page)
+        return page
+
+    async def _apage(self, tab: str) -> str:
+        page = self._cached_page(tab)
+        if page is not None:
+            return page
+        # concurrent callers (e.g. acurrent_streams and aold_streams gathered)
+        # wait for the same download instead of starting their own
+        pending = self._pending.get(tab)
+        if pending is None:
+            pending = asyncio.ensure_future(self._PAGES[tab][1](self._target_url))
+            self._pending[tab] = pending
+            pending.add_done_callback(functools.partial(self._page_done, tab))
+        # shielded for every caller: one of them being cancelled must not
+        # cancel the download the others are still waiting for
+        return await asyncio.shield(pending)
+
+    def _page_done(self, tab: str, pending: asyncio.Future):
+        if self._pending.get(tab) is pending:
+            del self._pending[tab]
+        # exception() also marks a failure as seen when every waiter was cancelled
+        if not pending.cancelled() and pending.exception() is None:
+            self._pages[tab] = (time.monotonic(), pending.result())
+
+    def refresh(self, *tabs: str):
+        """
+        Forgets downloaded pages so the next access fetches them again
+
+        Parameters
+        ----------
+        *tabs : str
+            Any of about, uploads, streams, upcoming, playlists; all when omitted
+        """
+        for tab in tabs or list(self._pages):
+            if tab not in self._PAGES:
+                raise ValueError(f'unknown channel tab: {tab}')
+            self._pages.pop(tab, None)
+
+    @property
+    def _about_page(self) -> str:
+        return self._page('about')
 
     def __repr__(self):
         return f'<Channel `{self._target_url}`>'
 
-    def __prepare_metadata(self) -> Optional[Dict[str, any]]:
-        patterns = [
-            Patterns.name,
-            Patterns.avatar,
-            Patterns.banner,
-            Patterns.verified,
-            # Remove socials pattern since it's not defined
-        ]
-        extracted = collect(lambda x: x.findall(self._about_page) or None, patterns)
-        # Update to match the new number of patterns
-        name, avatar, banner, verified = [e[0] if e else None for e in extracted]
-        
+    def __prepare_metadata(self, page: str) -> Optional[Dict[str, any]]:
+        # ytInitialData is located and decoded once, every field is read from it
+        data = InitialData.from_page(page)
+        verified = bool(Patterns.verified.search(page))
+        if data is None:
+            return self.__fallback_metadata(None, None, None, verified)
+        name = data.title
+        avatar = data.avatar
+        banner = data.banner
+
         try:
-            # Extract individual pieces of information using regex
-            description = re.search(r'"description":"(.*?)"', self._about_page)
-            subscriber_count = re.search(r'"subscriberCountText":"(.*?)"', self._about_page)
-            view_count = re.search(r'"viewCountText":"(.*?)"', self._about_page)
-            channel_id = re.search(r'"channelId":"(.*?)"', self._about_page)
-            joined_date = re.search(r'"joinedDateText":\{"content":"(.*?)"', self._about_page)
-            video_count = re.search(r'"videoCountText":"(.*?)"', self._about_page)
-            canonical_url = re.search(r'"canonicalChannelUrl":"(.*?)"', self._about_page)
-            country = re.search(r'"country":"(.*?)"', self._about_page)
-            
+            channel_id = data.channel_id
+            subscriber_count = data.subscriber_count_text
+            view_count = data.view_count_text
+            joined_date = data.joined_date_text
+            video_count = data.video_count_text
+
             return {
-                "id": channel_id.group(1) if channel_id else "Unknown",
+                "id": channel_id or "Unknown",
                 "name": name or "Unknown",
-                "url": f"https://www.youtube.com/channel/{channel_id.group(1) if channel_id else ''}",
-                "description": description.group(1) if description else "",
-                "country": country.group(1) if country else None,
-                "custom_url": canonical_url.group(1) if canonical_url else "",
-                "subscribers": subscriber_count.group(1).split(' ')[0] if subscriber_count else "0",
-                "views": view_count.group(1).replace(' views', '') if view_count else "0",
-                "created_at": joined_date.group(1).replace('Joined ', '') if joined_date else "Unknown",
-                "video_count": video_count.group(1).split(' ')[0] if video_count else "0",
+                "url": f"https://www.youtube.com/channel/{channel_id or ''}",
+                "description": data.description or "",
+                "country": data.country,
+                "custom_url": data.canonical_url or "",
+                "subscribers": subscriber_count.split(' ')[0] if subscriber_count else "0",
+                "views": view_count.replace(' views', '') if view_count else "0",
+                "created_at": joined_date.replace('Joined ', '') if joined_date else "Unknown",
+                "video_count": video_count.split(' ')[0] if video_count else "0",
                 "avatar": avatar,
                 "banner": banner,
-                "verified": bool(verified),
-                # Remove socials from return dict since we're not extracting it
+                "verified": verified,
             }
-            
+
         except Exception as e:
             print(f"Error processing channel metadata: {str(e)}")
-            return {
-                "id": "Unknown",
-                "name": name or "Unknown",
-                "url": self._target_url,
-                "description": "",
-                "country": None,
-                "custom_url": "",
-                "subscribers": "0",
-                "views": "0",
-                "created_at": "Unknown",
-                "video_count": "0",
-                "avatar": avatar,
-                "banner": banner,
-                "verified": bool(verified),
-                # Remove socials from fallback dict as well
-            }
+            return self.__fallback_metadata(name, avatar, banner, verified)
+
+    def __fallback_metadata(self, name, avatar, banner, verified) -> Dict[str, any]:
+        return {
+            "id": "Unknown",
+            "name": name or "Unknown",
+            "url": self._target_url,
+            "description": "",
+            "country": None,
+            "custom_url": "",
+            "subscribers": "0",
+            "views": "0",
+            "created_at": "Unknown",
+            "video_count": "0",
+            "avatar": avatar,
+            "banner": banner,
+            "verified": verified,
+        }
 
     @property
     def metadata(self) -> Optional[Dict[str, any]]:
@@ -140,8 +364,37 @@ class Channel:
             Channel metadata containing the following keys:
             id, name, subscribers, views, country, custom_url, avatar, banner, url, description, socials etc.
         """
+        return self.__metadata_from(self._page('about'))
+
+    @on_io_loop
+    async def ametadata(self) -> Optional[Dict[str, any]]:
+        """Async `metadata`: downloads the about page without blocking if it is not loaded yet"""
+        page = await self._apage('about')
+        if self.__meta_page is page:
+            return self.__meta
+        # parsed on the shared executor so the I/O loop keeps serving other transfers
+        return await run(self.__metadata_from, page)
+
+    def __metadata_from(self, page: str) -> Optional[Dict[str, any]]:
+        # parsed again only when the about page itself was fetched again
+        if self.__meta_page is not page:
+            self.__meta = self.__prepare_metadata(page)
+            self.__meta_page = page
         return self.__meta
 
+    @staticmethod
+    def _parse_streams(raw: str, live: bool) -> Optional[List[str]]:
+        filtered_ids = dup_filter(Patterns.stream_ids.findall(raw))
+        if not filtered_ids:
+            return None
+        return [id_ for id_ in filtered_ids if (f"vi/{id_}/hqdefault_live.jpg" in raw) == live]
+
+    @staticmethod
+    def _parse_upcomings(raw: str) -> Optional[List[str]]:
+        if not Patterns.upcoming_check.search(raw):
+            return None
+        return Patterns.upcoming.findall(raw)
+
     @property
     def live(self) -> bool:
         """
@@ -177,11 +430,7 @@ class Channel:
         List[str] | None
             The ids of all ongoing streams or None
         """
-        raw = streams_data(self._target_url)
-        filtered_ids = dup_filter(Patterns.stream_ids.findall(raw))
-        if not filtered_ids:
-            return None
-        return [id_ for id_ in filtered_ids if f"vi/{id_}/hqdefault_live.jpg" in raw]
+        return self._parse_streams(self._page('streams'), live=True)
 
     @property
     def old_streams(self) -> Optional[List[str]]:
@@ -193,11 +442,7 @@ class Channel:
         List[str] | None
             The ids of all old or completed streams or None
         """
-        raw = streams_data(self._target_url)
-        filtered_ids = dup_filter(Patterns.stream_ids.findall(raw))
-        if not filtered_ids:
-            return None
-        return [id_ for id_ in filtered_ids if f"vi/{id_}/hqdefault_live.jpg" not in raw]
+        return self._parse_streams(self._page('streams'), live=False)
 
     @property
     def last_streamed(self) -> Optional[str]:
@@ -226,7 +471,7 @@ class Channel:
         List[str] | None
             The ids of uploaded videos or None
         """
-        return dup_filter(Patterns.upload_ids.findall(uploads_data(self._target_url)), limit)
+        return dup_filter(Patterns.upload_ids.findall(self._page('uploads')), limit)
 
     @property
     def last_uploaded(self) -> Optional[str]:
@@ -238,8 +483,64 @@ class Channel:
         str | None
             The id of the last uploaded video or None
         """
-        ids = self.uploads()
-        return ids[0] if ids else None
+        page = self._cached_page('uploads')
+        if page is not None:
+            ids = dup_filter(Patterns.upload_ids.findall(page), 1)
+            return ids[0] if ids else None
+        # only the first id is needed, so the page is read just far enough to find it
+        found = uploads_scan(self._target_url, {'video_id': Patterns.upload_ids})
+        return found['video_id'].group(1) if found and found['video_id'] else None
+
+    @property
+    def _feed_id(self) -> Optional[str]:
+        # the feed is only addressable by the UC... id, not by handles or custom urls
+        if self._target_url.startswith(self._HEAD):
+            return 'UC' + self._usable_id
+        return None
+
+    def recent_uploads(self, limit: int = 15) -> List[Dict[str, Any]]:
+        """
+        Fetches the most recent uploads from the channel's Atom feed
+
+        The feed is a few kilobytes against the hundreds of the /videos page
+        and carries each video's title, publish date and view count, so no
+        watch page has to be fetched for them. Channels addressed by handle
+        or custom url, or whose feed is unavailable, fall back to the
+        uploads page, whose entries only have `video_id` and `url` set.
+
+        Shorts are left out, as on the uploads page. Unlike the uploads
+        page, the feed also lists live streams and premieres, which can
+        not be told apart from regular uploads there.
+
+        Parameters
+        ----------
+        limit : int
+            The number of uploads to return, the feed lists at most 15
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Entries newest first with video_id, title, published, updated,
+            views, thumbnail and url
+        """
+        channel_id = self._feed_id
+        if channel_id is not None:
+            parser = FeedParser(limit)
+            try:
+                channel_feed(channel_id, self._feed_consumer(parser))
+                return parser.entries
+            except (AIOError, InvalidURL, ParseError):
+                pass
+        return [FeedParser.stub(video_id) for video_id in self.uploads(limit)]
+
+    @staticmethod
+    def _feed_consumer(parser: FeedParser):
+        def consume(text: str) -> bool:
+            parser.feed(text)
+            # the feed is small, reading it to the end keeps the connection
+            # reusable and lets the response cache store it
+            return False
+        return consume
 
     @property
     def upcoming(self) -> Optional[Video]:
@@ -251,10 +552,7 @@ class Channel:
         Video | None
             The upcoming video or None
         """
-        raw = upcoming_videos(self._target_url)
-        if not Patterns.upcoming_check.search(raw):
-            return None
-        upcoming = Patterns.upcoming.findall(raw)
+        upcoming = self._parse_upcomings(self._page('upcoming'))
         return Video(upcoming[0]) if upcoming else None
 
     @property
@@ -267,11 +565,7 @@ class Channel:
         List[str] | None
             The ids of upcoming videos or None
         """
-        raw = upcoming_videos(self._target_url)
-        if not Patterns.upcoming_check.search(raw):
-            return None
-        video_ids = Patterns.upcoming.findall(raw)
-        return video_ids
+        return self._parse_upcomings(self._page('upcoming'))
 
     @property
     def playlists(self) -> Optional[List[str]]:
@@ -283,4 +577,67 @@ class Channel:
         List[str] | None
             The ids of all playlists or None
         """
-        return dup_filter(Patterns.playlists.findall(channel_playlists(self._target_url)))
+        return dup_filter(Patterns.playlists.findall(self._page('playlists')))
+
+    # async counterparts of the fetching properties above
+
+    async def alive(self) -> bool:
+        return bool(await self.acurrent_streams())
+
+    async def astreaming_now(self) -> Optional[str]:
+        streams = await self.acurrent_streams()
+        return streams[0] if streams else None
+
+    @on_io_loop
+    async def acurrent_streams(self) -> Optional[List[str]]:
+        return await run(self._parse_streams, await self._apage('streams'), True)
+
+    @on_io_loop
+    async def aold_streams(self) -> Optional[List[str]]:
+        return await run(self._parse_streams, await self._apage('streams'), False)
+
+    async def alast_streamed(self) -> Optional[str]:
+        ids = await self.aold_streams()
+        return ids[0] if ids else None
+
+    @staticmethod
+    def _parse_uploads(raw: str, limit: Optional[int] = None) -> Optional[List[str]]:
+        return dup_filter(Patterns.upload_ids.findall(raw), limit)
+
+    @on_io_loop
+    async def auploads(self, limit: int = 20) -> Optional[List[str]]:
+        return await run(self._parse_uploads, await self._apage('uploads'), limit)
+
+    @on_io_loop
+    async def alast_uploaded(self) -> Optional[str]:
+        page = self._cached_page('uploads')
+        if page is not None:
+            ids = dup_filter(Patterns.upload_ids.findall(page), 1)
+            return ids[0] if ids else None
+        found = await auploads_scan(self._target_url, {'video_id': Patterns.upload_ids})
+        return found['video_id'].group(1) if found and found['video_id'] else None
+
+    @on_io_loop
+    async def arecent_uploads(self, limit: int = 15) -> List[Dict[str, Any]]:
+        channel_id = self._feed_id
+        if channel_id is not None:
+            parser = FeedParser(limit)
+            try:
+                await achannel_feed(channel_id, self._feed_consumer(parser))
+                return parser.entries
+            except (AIOError, InvalidURL, ParseError):
+                pass
+        return [FeedParser.stub(video_id) for video_id in await self.auploads(limit)]
+
+    async def aupcoming(self) -> Optional[Video]:
+        upcoming = await self.aupcomings()
+        return await Video.fetch(upcoming[0]) if upcoming else None
+
+    @on_io_loop
+    async def aupcomings(self) -> Optional[List[str]]:
+        return await run(self._parse_upcomings, await self._apage('upcoming'))
+
+    @on_io_loop
+    async def aplaylists(self) -> Optional[List[str]]:
+        page = await self._apage('playlists')
+        return await run(lambda: dup_filter(Patterns.playlists.findall(page)))
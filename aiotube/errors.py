@@ -11,3 +11,9 @@ class InvalidURL(Exception):
 class AIOError(Exception):
     def __init__(self, message):
         self.message = message
+
+
+class BlockingCallError(RuntimeError):
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
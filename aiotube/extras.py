@@ -5,8 +5,16 @@ from .https import (
     trending_feeds,
     trending_streams,
     _get_trending_learning_videos,
-    trending_sports
+    trending_sports,
+    atrending_videos,
+    atrending_songs,
+    atrending_games,
+    atrending_feeds,
+    atrending_streams,
+    _aget_trending_learning_videos,
+    atrending_sports
 )
+from .transport import on_io_loop
 from .video import Video
 from .utils import dup_filter
 from .patterns import _ExtraPatterns as Patterns
@@ -44,3 +52,40 @@ class Extras:
     @staticmethod
     def sport_videos() -> Optional[List[str]]:
         return dup_filter(Patterns.video_id.findall(trending_sports()))
+
+    @staticmethod
+    @on_io_loop
+    async def atrending_videos() -> Optional[List[str]]:
+        data = Patterns.video_id.findall(await atrending_videos())
+        return dup_filter(data) if data else None
+
+    @staticmethod
+    @on_io_loop
+    async def amusic_videos() -> Optional[List[str]]:
+        data = Patterns.video_id.findall(await atrending_songs())
+        return dup_filter(data) if data else None
+
+    @staticmethod
+    @on_io_loop
+    async def agaming_videos() -> Optional[List[str]]:
+        return dup_filter(Patterns.video_id.findall(await atrending_games()))
+
+    @staticmethod
+    @on_io_loop
+    async def anews_videos() -> Optional[List[str]]:
+        return dup_filter(Patterns.video_id.findall(await atrending_feeds()))
+
+    @staticmethod
+    @on_io_loop
+    async def alive_videos() -> Optional[List[str]]:
+        return dup_filter(Patterns.video_id.findall(await atrending_streams()))
+
+    @staticmethod
+    @on_io_loop
+    async def aeducational_videos() -> Optional[List[str]]:
+        return dup_filter(Patterns.video_id.findall(await _aget_trending_learning_videos()))
+
+    @staticmethod
+    @on_io_loop
+    async def asport_videos() -> Optional[List[str]]:
+        return dup_filter(Patterns.video_id.findall(await atrending_sports()))
@@ -0,0 +1,93 @@
+from xml.etree.ElementTree import XMLPullParser, ParseError
+from typing import Any, Dict, List, Optional
+
+
+__all__ = ['FeedParser', 'ParseError']
+
+
+_ATOM = '{http://www.w3.org/2005/Atom}'
+_YT = '{http://www.youtube.com/xml/schemas/2015}'
+_MEDIA = '{http://search.yahoo.com/mrss/}'
+
+
+class FeedParser:
+
+    def __init__(self, limit: Optional[int] = None, shorts: bool = False):
+        """
+        Incremental parser for a channel's Atom feed (feeds/videos.xml)
+
+        Text is fed as it arrives and every <entry> is turned into a dict as
+        soon as its closing tag is seen, so reading can stop after `limit`
+        entries without waiting for the rest of the document.
+
+        The feed lists every public video, Shorts and live streams included.
+        Shorts link to /shorts/ and are skipped unless `shorts` is set, so the
+        entries match the /videos tab; live streams and premieres carry no
+        mark in the feed and are kept.
+
+        Parameters
+        ----------
+        limit : int | None
+            The number of entries wanted, None reads them all
+        shorts : bool
+            Whether Shorts are kept as entries
+        """
+        self.limit = limit
+        self.shorts = shorts
+        self.entries: List[Dict[str, Any]] = []
+        self._parser = XMLPullParser(events=('end',))
+
+    @property
+    def done(self) -> bool:
+        return self.limit is not None and len(self.entries) >= self.limit
+
+    def feed(self, text: str) -> bool:
+        """
+        Parses the next piece of the document
+
+        Returns
+        -------
+        bool
+            True once `limit` entries are parsed and the rest is not needed
+        """
+        self._parser.feed(text)
+        for _, element in self._parser.read_events():
+            if element.tag != _ATOM + 'entry':
+                continue
+            if not self.done:
+                entry = self._entry(element)
+                if self.shorts or '/shorts/' not in entry['url']:
+                    self.entries.append(entry)
+            # drop the parsed subtree, only the dicts are kept
+            element.clear()
+        return self.done
+
+    @staticmethod
+    def stub(video_id: str) -> Dict[str, Any]:
+        """An entry known only by its id, as the HTML uploads page yields them"""
+        return {
+            'video_id': video_id,
+            'title': None,
+            'published': None,
+            'updated': None,
+            'views': None,
+            'thumbnail': None,
+            'url': f'https://www.youtube.com/watch?v={video_id}',
+        }
+
+    @classmethod
+    def _entry(cls, element) -> Dict[str, Any]:
+        entry = cls.stub(element.findtext(_YT + 'videoId'))
+        entry['title'] = element.findtext(_ATOM + 'title')
+        entry['published'] = element.findtext(_ATOM + 'published')
+        entry['updated'] = element.findtext(_ATOM + 'updated')
+        link = element.find(_ATOM + 'link')
+        if link is not None and link.get('href'):
+            entry['url'] = link.get('href')
+        thumbnail = element.find(f'{_MEDIA}group/{_MEDIA}thumbnail')
+        if thumbnail is not None:
+            entry['thumbnail'] = thumbnail.get('url')
+        statistics = element.find(f'{_MEDIA}group/{_MEDIA}community/{_MEDIA}statistics')
+        if statistics is not None and statistics.get('views', '').isdigit():
+            entry['views'] = int(statistics.get('views'))
+        return entry
@@ -1,9 +1,14 @@
-from .utils import request, parser
+from typing import Callable
+from .utils import request, arequest, scan, ascan, consume, aconsume, parser
 
 
 def channel_about(head: str) -> str:
     url = head + '/about'
-    return request(url)
+    return request(url, 'channel_about')
+
+async def achannel_about(head: str) -> str:
+    url = head + '/about'
+    return await arequest(url, 'channel_about')
 
 def video_count(channel_id: str) -> str:
     head = 'https://www.youtube.com/results?search_query='
@@ -11,60 +16,135 @@ def video_count(channel_id: str) -> str:
     url = head + channel_id + tail
     return request(url)
 
+async def avideo_count(channel_id: str) -> str:
+    head = 'https://www.youtube.com/results?search_query='
+    tail = '&sp=EgIQAg%253D%253D'
+    url = head + channel_id + tail
+    return await arequest(url)
+
 def uploads_data(head: str) -> str:
     url = head + '/videos'
-    return request(url)
+    return request(url, 'uploads_data')
+
+async def auploads_data(head: str) -> str:
+    url = head + '/videos'
+    return await arequest(url, 'uploads_data')
+
+def uploads_scan(head: str, required: dict, optional: dict = None) -> dict:
+    url = head + '/videos'
+    return scan(url, required, optional, 'uploads_data')
+
+async def auploads_scan(head: str, required: dict, optional: dict = None) -> dict:
+    url = head + '/videos'
+    return await ascan(url, required, optional, 'uploads_data')
+
+def channel_feed(channel_id: str, consumer: Callable[[str], bool]) -> None:
+    url = f'https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}'
+    consume(url, consumer, 'channel_feed')
+
+async def achannel_feed(channel_id: str, consumer: Callable[[str], bool]) -> None:
+    url = f'https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}'
+    await aconsume(url, consumer, 'channel_feed')
 
 def streams_data(head: str) -> str:
     url = head + '/streams'
-    return request(url)
+    return request(url, 'streams_data')
+
+async def astreams_data(head: str) -> str:
+    url = head + '/streams'
+    return await arequest(url, 'streams_data')
 
 def channel_playlists(head: str) -> str:
     url = head + '/playlists'
-    return request(url)
+    return request(url, 'channel_playlists')
+
+async def achannel_playlists(head: str) -> str:
+    url = head + '/playlists'
+    return await arequest(url, 'channel_playlists')
 
 # might be broken
 
 def upcoming_videos(head: str) -> str:
     url = head + '/videos?view=2&live_view=502'
-    return request(url)
+    return request(url, 'upcoming_videos')
+
+async def aupcoming_videos(head: str) -> str:
+    url = head + '/videos?view=2&live_view=502'
+    return await arequest(url, 'upcoming_videos')
 
 def video_data(video_id: str) -> str:
     url = f'https://www.youtube.com/watch?v={video_id}'
-    return request(url)
+    return request(url, 'video_data')
+
+async def avideo_data(video_id: str) -> str:
+    url = f'https://www.youtube.com/watch?v={video_id}'
+    return await arequest(url, 'video_data')
+
+def video_scan(video_id: str, required: dict, optional: dict = None) -> dict:
+    url = f'https://www.youtube.com/watch?v={video_id}'
+    return scan(url, required, optional, 'video_data', overlap=None)
+
+async def avideo_scan(video_id: str, required: dict, optional: dict = None) -> dict:
+    url = f'https://www.youtube.com/watch?v={video_id}'
+    return await ascan(url, required, optional, 'video_data', overlap=None)
 
 def playlist_data(playlist_id: str) -> str:
     url = 'https://www.youtube.com/playlist?list=' + playlist_id
-    return request(url)
+    return request(url, 'playlist_data')
+
+async def aplaylist_data(playlist_id: str) -> str:
+    url = 'https://www.youtube.com/playlist?list=' + playlist_id
+    return await arequest(url, 'playlist_data')
 
 
 def trending_videos() -> str:
     return request('https://www.youtube.com/feed/trending')
 
+async def atrending_videos() -> str:
+    return await arequest('https://www.youtube.com/feed/trending')
+
 
 def trending_songs() -> str:
     return request('https://www.youtube.com/feed/music')
 
+async def atrending_songs() -> str:
+    return await arequest('https://www.youtube.com/feed/music')
+
 
 def trending_games() -> str:
     return request('https://www.youtube.com/gaming')
 
+async def atrending_games() -> str:
+    return await arequest('https://www.youtube.com/gaming')
+
 
 def trending_feeds() -> str:
     return request('https://www.youtube.com/news')
 
+async def atrending_feeds() -> str:
+    return await arequest('https://www.youtube.com/news')
+
 
 def trending_streams() -> str:
     return request('https://www.youtube.com/live')
 
+async def atrending_streams() -> str:
+    return await arequest('https://www.youtube.com/live')
+
 
 def _get_trending_learning_videos() -> str:
     return request('https://www.youtube.com/learning')
 
+async def _aget_trending_learning_videos() -> str:
+    return await arequest('https://www.youtube.com/learning')
+
 
 def trending_sports() -> str:
     return request('https://www.youtube.com/sports')
 
+async def atrending_sports() -> str:
+    return await arequest('https://www.youtube.com/sports')
+
 
 def find_videos(query: str) -> str:
     head = 'https://www.youtube.com/results?search_query='
@@ -72,6 +152,12 @@ def find_videos(query: str) -> str:
     parsed_query = parser(query)
     return request(head + parsed_query + tail)
 
+async def afind_videos(query: str) -> str:
+    head = 'https://www.youtube.com/results?search_query='
+    tail = '&sp=EgIQAQ%253D%253D'
+    parsed_query = parser(query)
+    return await arequest(head + parsed_query + tail)
+
 
 def find_channels(query: str) -> str:
     head = 'https://www.youtube.com/results?search_query='
@@ -79,9 +165,21 @@ def find_channels(query: str) -> str:
     parsed_query = parser(query)
     return request(head + parsed_query + tail)
 
+async def afind_channels(query: str) -> str:
+    head = 'https://www.youtube.com/results?search_query='
+    tail = '&sp=EgIQAg%253D%253D'
+    parsed_query = parser(query)
+    return await arequest(head + parsed_query + tail)
+
 
 def find_playlists(query: str) -> str:
     head = 'https://www.youtube.com/results?search_query='
     tail = '&sp=EgIQAw%253D%253D'
     parsed_query = parser(query)
     return request(head + parsed_query + tail)
+
+async def afind_playlists(query: str) -> str:
+    head = 'https://www.youtube.com/results?search_query='
+    tail = '&sp=EgIQAw%253D%253D'
+    parsed_query = parser(query)
+    return await arequest(head + parsed_query + tail)
@@ -0,0 +1,257 @@
+import re
+import json
+from typing import Any, Dict, List, Optional, Set
+
+
+__all__ = ['JSONBlob', 'InitialData', 'PlayerResponse', 'find_json']
+
+
+_decoder = json.JSONDecoder()
+
+
+class BlobMatch:
+
+    def __init__(self, value: Dict[str, Any], start: int, end: int):
+        """The decoded object found by `JSONBlob.search`, shaped like a `re.Match`"""
+        self.value = value
+        self._start = start
+        self._end = end
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+
+class JSONBlob:
+
+    def __init__(self, name: str):
+        """
+        Locates the object a page script assigns to a global such as ytInitialData
+
+        Has the same `search(text, pos)` interface as a compiled pattern so it
+        can be handed to `aiotube.utils.scan` next to regular expressions.
+
+        Parameters
+        ----------
+        name : str
+            The name of the global, e.g. ytInitialData or ytInitialPlayerResponse
+        """
+        self.name = name
+        self._marker = re.compile(r'(?:var\s+|window\[["\'])%s(?:["\']\])?\s*=\s*(?={)' % re.escape(name))
+
+    def __repr__(self):
+        return f'<JSONBlob {self.name}>'
+
+    def search(self, text: str, pos: int = 0) -> Optional[BlobMatch]:
+        for marker in self._marker.finditer(text, pos):
+            if text.find('</script>', marker.end()) == -1:
+                # the script has not fully arrived yet
+                return None
+            try:
+                value, end = _decoder.raw_decode(text, marker.end())
+            except ValueError:
+                continue
+            if isinstance(value, dict):
+                return BlobMatch(value, marker.start(), end)
+        return None
+
+
+def find_json(page: str, name: str) -> Optional[Dict[str, Any]]:
+    """Decodes the object assigned to the global `name` in a page, or None if it is missing"""
+    match = JSONBlob(name).search(page)
+    return match.value if match else None
+
+
+def _first_values(obj: Any, keys: Set[str]) -> Dict[str, Any]:
+    """Walks a decoded document once, keeping the first value seen for each of `keys`"""
+    found = {}
+    stack = [obj]
+    while stack and len(found) < len(keys):
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in keys and key not in found:
+                    found[key] = value
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return found
+
+
+def _text(value: Any) -> Optional[str]:
+    """Flattens the several shapes YouTube uses for display text"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        if 'simpleText' in value:
+            return value['simpleText']
+        if 'content' in value:
+            return value['content']
+        if 'runs' in value:
+            return ''.join(run.get('text', '') for run in value['runs'])
+    return None
+
+
+def _pick_image(images: List[Dict[str, Any]], min_width: int = 0) -> Optional[str]:
+    """Returns the url of the smallest image at least `min_width` wide, else the largest one"""
+    if not images:
+        return None
+    ordered = sorted(images, key=lambda image: image.get('width') or 0)
+    for image in ordered:
+        if (image.get('width') or 0) >= min_width:
+            return image.get('url')
+    return ordered[-1].get('url')
+
+
+class InitialData:
+
+    _KEYS = {'channelMetadataRenderer', 'aboutChannelViewModel', 'banner'}
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Typed view over a channel page's decoded ytInitialData
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            The decoded ytInitialData object
+        """
+        self.raw = data
+        self._index = _first_values(data, self._KEYS)
+
+    @classmethod
+    def from_page(cls, page: str) -> Optional['InitialData']:
+        data = find_json(page, 'ytInitialData')
+        return cls(data) if data is not None else None
+
+    @property
+    def _metadata(self) -> Dict[str, Any]:
+        return self._index.get('channelMetadataRenderer') or {}
+
+    @property
+    def _about(self) -> Dict[str, Any]:
+        return self._index.get('aboutChannelViewModel') or {}
+
+    @property
+    def title(self) -> Optional[str]:
+        return self._metadata.get('title')
+
+    @property
+    def channel_id(self) -> Optional[str]:
+        return self._about.get('channelId') or self._metadata.get('externalId')
+
+    @property
+    def description(self) -> Optional[str]:
+        return _text(self._about.get('description')) or self._metadata.get('description')
+
+    @property
+    def country(self) -> Optional[str]:
+        return _text(self._about.get('country'))
+
+    @property
+    def canonical_url(self) -> Optional[str]:
+        return self._about.get('canonicalChannelUrl') or self._metadata.get('vanityChannelUrl')
+
+    @property
+    def subscriber_count_text(self) -> Optional[str]:
+        return _text(self._about.get('subscriberCountText'))
+
+    @property
+    def view_count_text(self) -> Optional[str]:
+        return _text(self._about.get('viewCountText'))
+
+    @property
+    def joined_date_text(self) -> Optional[str]:
+        return _text(self._about.get('joinedDateText'))
+
+    @property
+    def video_count_text(self) -> Optional[str]:
+        return _text(self._about.get('videoCountText'))
+
+    @property
+    def avatar(self) -> Optional[str]:
+        return _pick_image(self._metadata.get('avatar', {}).get('thumbnails'), min_width=100)
+
+    @property
+    def banner(self) -> Optional[str]:
+        banner = self._index.get('banner') or {}
+        images = banner.get('thumbnails') or banner.get('imageBannerViewModel', {}).get('image', {}).get('sources')
+        return _pick_image(images, min_width=1280)
+
+
+class PlayerResponse:
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Typed view over a watch page's decoded ytInitialPlayerResponse
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            The decoded ytInitialPlayerResponse object
+        """
+        self.raw = data
+        self._details = data.get('videoDetails') or {}
+        self._microformat = data.get('microformat', {}).get('playerMicroformatRenderer') or {}
+
+    @classmethod
+    def from_page(cls, page: str) -> Optional['PlayerResponse']:
+        data = find_json(page, 'ytInitialPlayerResponse')
+        return cls(data) if data is not None else None
+
+    @property
+    def video_id(self) -> Optional[str]:
+        return self._details.get('videoId')
+
+    @property
+    def title(self) -> Optional[str]:
+        return self._details.get('title')
+
+    @property
+    def view_count(self) -> Optional[int]:
+        views = self._details.get('viewCount')
+        return int(views) if views is not None else None
+
+    @property
+    def length_seconds(self) -> Optional[int]:
+        length = self._details.get('lengthSeconds')
+        return int(length) if length is not None else None
+
+    @property
+    def channel_id(self) -> Optional[str]:
+        return self._details.get('channelId')
+
+    @property
+    def author(self) -> Optional[str]:
+        return self._details.get('author')
+
+    @property
+    def is_live_content(self) -> bool:
+        return bool(self._details.get('isLiveContent'))
+
+    @property
+    def keywords(self) -> Optional[List[str]]:
+        return self._details.get('keywords')
+
+    @property
+    def description(self) -> Optional[str]:
+        return self._details.get('shortDescription')
+
+    @property
+    def thumbnails(self) -> Optional[List[Dict[str, Any]]]:
+        return self._details.get('thumbnail', {}).get('thumbnails')
+
+    @property
+    def upload_date(self) -> Optional[str]:
+        return self._microformat.get('uploadDate') or self._microformat.get('publishDate')
+
+    @property
+    def category(self) -> Optional[str]:
+        return self._microformat.get('category')
+
+    @property
+    def microformat_thumbnail(self) -> Optional[str]:
+        thumbnails = self._microformat.get('thumbnail', {}).get('thumbnails')
+        return thumbnails[0].get('url') if thumbnails else None
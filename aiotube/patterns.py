@@ -42,6 +42,7 @@ class _VideoPatterns:
     views = re.compile("videoViewCountRenderer\":{\"viewCount\":{\"simpleText\":\"(.*?)\"")
     likes = re.compile("toggledText\":{\"accessibility\":{\"accessibilityData\":{\"label\":\"(.*?) ")
     thumbnail = re.compile("playerMicroformatRenderer\":{\"thumbnail\":{\"thumbnails\":\[{\"url\":\"(.*?)\"")
+    like_count = re.compile("iconType\":\"LIKE\"},\"defaultText\":(.*?)}}")
 
 
 class _PlaylistPatterns:
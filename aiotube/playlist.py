@@ -1,7 +1,8 @@
 import re
 from .pool import collect
 from .utils import dup_filter
-from .https import playlist_data
+from .https import playlist_data, aplaylist_data
+from .transport import on_io_loop
 from .patterns import _PlaylistPatterns as Patterns
 from typing import List, Optional, Dict, Any
 
@@ -9,6 +10,18 @@ from typing import List, Optional, Dict, Any
 class Playlist:
 
     def __init__(self, playlist_id: str):
+        self._setup(playlist_id)
+        self._playlist_data = playlist_data(self.id)
+
+    @classmethod
+    @on_io_loop
+    async def fetch(cls, playlist_id: str) -> 'Playlist':
+        self = cls.__new__(cls)
+        self._setup(playlist_id)
+        self._playlist_data = await aplaylist_data(self.id)
+        return self
+
+    def _setup(self, playlist_id: str):
         pattern = re.compile('=(.+?)$|^PL(.+?)$')
         match = pattern.search(playlist_id)
         if not match:
@@ -18,8 +31,6 @@ class Playlist:
         elif match.group(2):
             self.id = 'PL' + match.group(2)
 
-        self._playlist_data = playlist_data(self.id)
-
     def __repr__(self):
         return f'<Playlist {self.url}>'
 
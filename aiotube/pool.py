@@ -1,8 +1,130 @@
+import os
+import asyncio
+import functools
+import threading
 import concurrent.futures
-from typing import Callable, List, Any, Union, Tuple
+from typing import Callable, List, Any, Union, Tuple, Optional, Iterable, AsyncIterator, Awaitable
 
 
-def collect(func: Callable, args: List[Any]) -> List[Any]:
-    max_workers = len(args) or 1
-    with concurrent.futures.ThreadPoolExecutor(max_workers) as exe:
-        return list(exe.map(func, args))
+__all__ = ['collect', 'acollect', 'amap_unordered', 'run', 'get_executor', 'configure', 'shutdown']
+
+
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_max_workers = min(8, (os.cpu_count() or 1) + 4)
+_lock = threading.Lock()
+
+
+def configure(max_workers: int):
+    """
+    Sets the size of the shared executor
+
+    Parameters
+    ----------
+    max_workers : int
+        The number of threads the shared executor may start; an existing
+        executor is replaced once its queued work has drained
+    """
+    global _max_workers, _executor
+    with _lock:
+        _max_workers = max_workers
+        old, _executor = _executor, None
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Returns the process-wide executor, creating it on first use"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(_max_workers, thread_name_prefix='aiotube')
+        return _executor
+
+
+def shutdown(wait: bool = True):
+    global _executor
+    with _lock:
+        old, _executor = _executor, None
+    if old is not None:
+        old.shutdown(wait=wait)
+
+
+def collect(func: Callable, args: List[Any], threaded: bool = False) -> List[Any]:
+    """
+    Applies `func` to every item of `args`, keeping their order
+
+    Parameters
+    ----------
+    func : Callable
+        The function to apply
+    args : List[Any]
+        The items to apply it to
+    threaded : bool
+        Spread the calls over the shared executor; only worth it when `func`
+        blocks on I/O, pure-Python work such as regex holds the GIL and runs
+        fastest inline
+
+    Returns
+    -------
+    List[Any]
+        The results in the order of `args`
+    """
+    if not threaded or len(args) < 2:
+        return [func(arg) for arg in args]
+    return list(get_executor().map(func, args))
+
+
+async def run(func: Callable, *args: Any) -> Any:
+    """Awaits `func(*args)` on the shared executor without blocking the running loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args))
+
+
+async def acollect(func: Callable, args: List[Any]) -> List[Any]:
+    """Async `collect`: runs every call on the shared executor and gathers the results in order"""
+    return list(await asyncio.gather(*(run(func, arg) for arg in args)))
+
+
+async def amap_unordered(
+        func: Callable[[Any], Awaitable],
+        items: Iterable[Any],
+        concurrency: int,
+        semaphore: Optional[asyncio.Semaphore] = None
+) -> AsyncIterator[Tuple[Any, Union[Any, Exception]]]:
+    """
+    Awaits `func(item)` for every item, at most `concurrency` at a time
+
+    Parameters
+    ----------
+    func : Callable[[Any], Awaitable]
+        The coroutine function to apply
+    items : Iterable[Any]
+        The items to apply it to
+    concurrency : int
+        The number of calls allowed in flight
+    semaphore : asyncio.Semaphore | None
+        A limit shared with other work, used instead of one sized `concurrency`
+
+    Yields
+    ------
+    Tuple[Any, Any | Exception]
+        (item, result) pairs in completion order; a call that raised yields
+        its exception as the result instead of stopping the others
+    """
+    semaphore = semaphore or asyncio.Semaphore(concurrency)
+
+    async def call(item):
+        async with semaphore:
+            try:
+                return item, await func(item)
+            except Exception as e:
+                return item, e
+
+    tasks = [asyncio.ensure_future(call(item)) for item in items]
+    try:
+        for future in asyncio.as_completed(tasks):
+            yield await future
+    finally:
+        # the consumer stopped early, nothing left should keep running
+        for task in tasks:
+            task.cancel()
@@ -4,7 +4,8 @@ from .channel import Channel
 from .playlist import Playlist
 from .patterns import _QueryPatterns as Patterns
 from typing import Optional, Dict, Any, List
-from .https import find_videos, find_channels, find_playlists
+from .transport import on_io_loop
+from .https import find_videos, find_channels, find_playlists, afind_videos, afind_channels, afind_playlists
 
 
 class Search:
@@ -35,3 +36,33 @@ class Search:
     @staticmethod
     def playlists(keywords: str, limit: int = 20) -> Optional[List[str]]:
         return dup_filter(Patterns.playlist_id.findall(find_playlists(keywords)), limit)
+
+    @staticmethod
+    async def avideo(keywords: str) -> Optional[Video]:
+        video_ids = await Search.avideos(keywords, 1)
+        return await Video.fetch(video_ids[0]) if video_ids else None
+
+    @staticmethod
+    async def achannel(keywords: str) -> Optional[Channel]:
+        channel_ids = await Search.achannels(keywords, 1)
+        return await Channel.fetch(channel_ids[0]) if channel_ids else None
+
+    @staticmethod
+    async def aplaylist(keywords: str) -> Optional[Playlist]:
+        playlist_ids = await Search.aplaylists(keywords, 1)
+        return await Playlist.fetch(playlist_ids[0]) if playlist_ids else None
+
+    @staticmethod
+    @on_io_loop
+    async def avideos(keywords: str, limit: int = 20) -> Optional[List[str]]:
+        return dup_filter(Patterns.video_id.findall(await afind_videos(keywords)), limit)
+
+    @staticmethod
+    @on_io_loop
+    async def achannels(keywords: str, limit: int = 20) -> Optional[List[str]]:
+        return dup_filter(Patterns.channel_id.findall(await afind_channels(keywords)), limit)
+
+    @staticmethod
+    @on_io_loop
+    async def aplaylists(keywords: str, limit: int = 20) -> Optional[List[str]]:
+        return dup_filter(Patterns.playlist_id.findall(await afind_playlists(keywords)), limit)
@@ -0,0 +1,241 @@
+import time
+import random
+import asyncio
+import contextlib
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Optional
+
+
+__all__ = ['HostLimiter', 'RateLimiter', 'retry_delay', 'THROTTLED']
+
+
+# statuses that mean the server is overloaded or limiting us: back off and retry
+THROTTLED = (429, 500, 502, 503, 504)
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header, given either as seconds or as an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(attempt: int, retry_after: Optional[str] = None, base: float = 0.5, cap: float = 60.0) -> float:
+    """
+    Seconds to wait before retrying a throttled request
+
+    Parameters
+    ----------
+    attempt : int
+        The number of retries already made, 0 for the first one
+    retry_after : str | None
+        The response's Retry-After header; honored when present, with a
+        little jitter on top so waiting requests do not return in lockstep
+    base : float
+        The first backoff step, doubled on every attempt
+    cap : float
+        The longest wait allowed
+
+    Returns
+    -------
+    float
+        A full-jitter exponential delay, or the server's requested delay
+    """
+    requested = _retry_after(retry_after)
+    if requested is not None:
+        return min(cap, requested + random.uniform(0, base))
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class HostLimiter:
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int,
+            max_concurrency: int,
+            max_rate: Optional[float] = None,
+            min_rate: float = 1.0,
+            min_concurrency: int = 1,
+            cooldown: float = 2.0
+    ):
+        """
+        Paces the requests sent to one host
+
+        A token bucket bounds the request rate and an AIMD window bounds the
+        requests in flight. Both grow additively while responses succeed and
+        are halved when the host answers 429 or 5xx, at most once per
+        `cooldown` so a burst of rejections counts as a single signal.
+
+        Parameters
+        ----------
+        rate : float
+            The starting number of requests per second
+        burst : int
+            The number of requests that may be sent back to back
+        max_concurrency : int
+            The upper bound of the in-flight window
+        max_rate : float | None
+            The upper bound of the request rate, `rate` by default
+        min_rate : float
+            The request rate is never lowered below this
+        min_concurrency : int
+            The in-flight window is never lowered below this
+        cooldown : float
+            Seconds after a decrease during which further rejections are ignored
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_rate = max_rate or rate
+        self.min_rate = min_rate
+        self.limit = float(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._decreased_at = 0.0
+        self._changed: Optional[asyncio.Condition] = None
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.decreases = 0
+        self.waited = 0.0
+
+    def _condition(self) -> asyncio.Condition:
+        # created on first use so it binds to the aiotube loop
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Waits for room in the in-flight window, a token and the end of any pause"""
+        started = time.monotonic()
+        changed = self._condition()
+        async with changed:
+            await changed.wait_for(lambda: self.in_flight < max(self.min_concurrency, int(self.limit)))
+            self.in_flight += 1
+        try:
+            while True:
+                now = time.monotonic()
+                if self.paused_until > now:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+            self.requests += 1
+            self.waited += time.monotonic() - started
+            yield
+        finally:
+            async with changed:
+                self.in_flight -= 1
+                changed.notify_all()
+
+    def observe(self, status: int):
+        """Adjusts the rate and the window after a response arrived"""
+        if status in THROTTLED:
+            self.throttled += 1
+            now = time.monotonic()
+            if now - self._decreased_at < self.cooldown:
+                return
+            self._decreased_at = now
+            self.decreases += 1
+            self.limit = max(self.min_concurrency, self.limit / 2)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+        elif status < 400:
+            # about +1 per window of successes, and +1 request/s per second of them
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self.rate = min(self.max_rate, self.rate + 1 / self.rate)
+
+    def pause(self, seconds: float):
+        """Holds back every request to the host, e.g. for the length of a Retry-After"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'rate': round(self.rate, 2),
+            'concurrency': int(self.limit),
+            'in_flight': self.in_flight,
+            'paused_for': round(max(0.0, self.paused_until - time.monotonic()), 2),
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'retries': self.retries,
+            'decreases': self.decreases,
+            'avg_wait': round(self.waited / self.requests, 4) if self.requests else 0.0,
+        }
+
+
+class RateLimiter:
+
+    def __init__(
+            self,
+            rate: float = 10.0,
+            max_rate: float = 40.0,
+            burst: int = 10,
+            max_concurrency: int = 6
+    ):
+        """
+        Process-wide registry of one `HostLimiter` per host
+
+        Parameters
+        ----------
+        rate : float
+            The starting requests per second for each host
+        max_rate : float
+            The requests per second a host's rate may grow to
+        burst : int
+            The number of requests that may be sent back to back
+        max_concurrency : int
+            The largest in-flight window per host
+        """
+        self.rate = rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self._hosts: Dict[str, HostLimiter] = {}
+
+    def host(self, host: str) -> HostLimiter:
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            limiter = HostLimiter(self.rate, self.burst, self.max_concurrency, self.max_rate)
+            self._hosts[host] = limiter
+        return limiter
+
+    def configure(
+            self,
+            rate: Optional[float] = None,
+            max_rate: Optional[float] = None,
+            burst: Optional[int] = None,
+            max_concurrency: Optional[int] = None
+    ):
+        """Changes the limits of every host, current and future"""
+        self.rate = rate if rate is not None else self.rate
+        self.max_rate = max(self.rate, max_rate if max_rate is not None else self.max_rate)
+        self.burst = burst if burst is not None else self.burst
+        self.max_concurrency = max_concurrency if max_concurrency is not None else self.max_concurrency
+        for limiter in self._hosts.values():
+            limiter.max_rate = self.max_rate
+            limiter.rate = min(self.rate if rate is not None else limiter.rate, self.max_rate)
+            limiter.burst = self.burst
+            limiter.max_concurrency = self.max_concurrency
+            limiter.limit = min(limiter.limit, self.max_concurrency) if max_concurrency is None else float(self.max_concurrency)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {host: limiter.stats() for host, limiter in self._hosts.items()}
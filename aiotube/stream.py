@@ -1,6 +1,6 @@
 import re
-from .pool import collect
 from .https import video_data
+from .initial_data import PlayerResponse
 from .patterns import _VideoPatterns as Patterns
 from typing import List, Optional, Dict, Any
 
@@ -27,33 +27,29 @@ class Video:
 
     @property
     def metadata(self) -> Dict[str, Any]:
-        patterns = [
-            Patterns.title,
-            Patterns.views,
-            Patterns.likes,
-            Patterns.duration,
-            Patterns.author_id,
-            Patterns.upload_date,
-            Patterns.thumbnail,
-            Patterns.tags,
-            Patterns.description,
-            Patterns.is_streamed,
-            Patterns.is_premiered
-        ]
-        ext = collect(lambda x: x.findall(self._video_data) or None, patterns)
-        data = [i[0] if i else i for i in ext]
+        player = PlayerResponse.from_page(self._video_data)
+        if player is None:
+            raise ValueError('could not find the player response on the watch page')
+        # views, likes and the premiere badge are only rendered in ytInitialData
+        views = Patterns.views.search(self._video_data)
+        likes = Patterns.likes.search(self._video_data)
+        # premiered, duration and author keep the values this dict always had:
+        # the matched badge text, seconds from approxDurationMs, the channelIds entry
+        premiered = Patterns.is_premiered.search(self._video_data)
+        duration = Patterns.duration.search(self._video_data)
+        author = Patterns.author_id.search(self._video_data)
         return {
-            'title': data[0],
+            'title': player.title,
             'id': self._matched_id,
-            'views': data[1][:-6] if data[1] else None,
-            'likes': data[2],
-            'streamed': data[9] is not None,
-            'premiered': data[10],
-            'duration': int(data[3]) / 1000 if data[3] else None,
-            'author': data[4],
-            'upload_date': data[5],
+            'views': views.group(1)[:-6] if views else None,
+            'likes': likes.group(1) if likes else None,
+            'streamed': Patterns.is_streamed.search(self._video_data) is not None,
+            'premiered': premiered.group(0) if premiered else None,
+            'duration': int(duration.group(1)) / 1000 if duration else None,
+            'author': author.group(1) if author else None,
+            'upload_date': player.upload_date,
             'url': self._url,
-            'thumbnail': data[6],
-            'tags': data[7].split(',') if data[7] else None,
-            'description': data[8].replace('\\n', '\n') if data[8] else None
+            'thumbnail': player.microformat_thumbnail,
+            'tags': player.keywords,
+            'description': player.description
         }
@@ -0,0 +1,669 @@
+import ssl
+import time
+import zlib
+import codecs
+import asyncio
+import functools
+import threading
+import contextlib
+from collections import deque
+from urllib.parse import urlsplit, urljoin
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from .errors import AIOError, BlockingCallError
+from .ratelimit import RateLimiter, THROTTLED, retry_delay
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+__all__ = [
+    'HTTPClient', 'ConnectionPool', 'Response', 'Stream', 'TransferStats', 'client',
+    'configure', 'pool_stats', 'transfer_stats', 'recent_transfers', 'limiter_stats',
+    'get_loop', 'run_sync', 'run_async', 'on_io_loop'
+]
+
+
+_REDIRECTS = (301, 302, 303, 307, 308)
+
+ACCEPT_ENCODING = 'gzip, deflate, br' if brotli else 'gzip, deflate'
+
+_Key = Tuple[str, str, int]
+
+
+class _Connection:
+
+    def __init__(self, key: _Key, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+
+    @property
+    def closed(self) -> bool:
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionPool:
+
+    def __init__(self, max_per_host: int = 6, idle_timeout: float = 30.0):
+        """
+        Keeps finished connections open per host so later requests skip the TCP + TLS handshake
+
+        Parameters
+        ----------
+        max_per_host : int
+            The number of connections allowed to one host at a time,
+            further requests wait for a free one
+        idle_timeout : float
+            Seconds an unused connection is kept before it is closed
+        """
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[_Key, List[_Connection]] = {}
+        self._limits: Dict[_Key, Tuple[int, asyncio.Semaphore]] = {}
+        self._reaper: Optional[asyncio.TimerHandle] = None
+        self.opened = 0
+        self.reused = 0
+        self.evicted = 0
+
+    @contextlib.asynccontextmanager
+    async def slot(self, key: _Key):
+        """Waits until fewer than `max_per_host` requests to `key` are in flight"""
+        size, semaphore = self._limits.get(key, (None, None))
+        if size != self.max_per_host:
+            # (re)created lazily so configure() takes effect for new requests
+            semaphore = asyncio.Semaphore(self.max_per_host)
+            self._limits[key] = (self.max_per_host, semaphore)
+        async with semaphore:
+            yield
+
+    def checkout(self, key: _Key) -> Optional[_Connection]:
+        """Returns the most recently used live connection to `key`, if any"""
+        idle = self._idle.get(key)
+        deadline = time.monotonic() - self.idle_timeout
+        while idle:
+            conn = idle.pop()
+            if conn.closed or conn.last_used < deadline:
+                conn.close()
+                self.evicted += 1
+                continue
+            self.reused += 1
+            return conn
+        return None
+
+    def checkin(self, conn: _Connection):
+        """Parks a connection whose response was fully read for reuse"""
+        if conn.closed:
+            return
+        conn.last_used = time.monotonic()
+        self._idle.setdefault(conn.key, []).append(conn)
+        if self._reaper is None:
+            self._reaper = asyncio.get_running_loop().call_later(self.idle_timeout, self._reap)
+
+    def _reap(self):
+        self._reaper = None
+        deadline = time.monotonic() - self.idle_timeout
+        for key, idle in list(self._idle.items()):
+            alive = []
+            for conn in idle:
+                if conn.closed or conn.last_used < deadline:
+                    conn.close()
+                    self.evicted += 1
+                else:
+                    alive.append(conn)
+            if alive:
+                self._idle[key] = alive
+            else:
+                del self._idle[key]
+        if self._idle:
+            self._reaper = asyncio.get_running_loop().call_later(self.idle_timeout, self._reap)
+
+    def close(self):
+        """Closes every idle connection"""
+        for idle in self._idle.values():
+            for conn in idle:
+                conn.close()
+        self._idle.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'opened': self.opened,
+            'reused': self.reused,
+            'evicted': self.evicted,
+            'idle': sum(len(idle) for idle in self._idle.values()),
+        }
+
+
+class _Decoder:
+
+    def __init__(self, encoding: str):
+        """Incrementally undoes a Content-Encoding"""
+        self.encoding = encoding
+        if encoding in ('', 'identity'):
+            self._obj = None
+        elif encoding in ('gzip', 'x-gzip'):
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            # servers disagree on zlib-wrapped vs raw deflate, sniffed on the first chunk
+            self._obj = zlib.decompressobj()
+            self._sniffed = False
+        elif encoding == 'br' and brotli:
+            self._obj = brotli.Decompressor()
+        else:
+            raise AIOError(f'unsupported content encoding: {encoding}')
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._obj is None:
+            return data
+        if self.encoding == 'br':
+            return self._obj.process(data)
+        if self.encoding == 'deflate' and not self._sniffed:
+            self._sniffed = True
+            try:
+                return self._obj.decompress(data)
+            except zlib.error:
+                self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._obj.decompress(data)
+
+    def flush(self) -> bytes:
+        if self._obj is None or self.encoding == 'br':
+            return b''
+        return self._obj.flush()
+
+
+class Stream:
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], raw: AsyncIterator[bytes]):
+        """
+        A response whose body has not been read yet
+
+        Parameters
+        ----------
+        url : str
+            The url the response came from
+        status : int
+            The HTTP status code
+        headers : Dict[str, str]
+            The response headers with lower-cased names
+        raw : AsyncIterator[bytes]
+            The body as it arrives on the wire, still content-encoded
+        """
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.encoding = headers.get('content-encoding', 'identity').strip().lower()
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self.complete = False
+        self._raw = raw
+        self._decoder = _Decoder(self.encoding)
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yields the decoded body piece by piece as it arrives"""
+        async for chunk in self._raw:
+            self.wire_bytes += len(chunk)
+            data = self._decoder.decompress(chunk)
+            if data:
+                self.body_bytes += len(data)
+                yield data
+        tail = self._decoder.flush()
+        if tail:
+            self.body_bytes += len(tail)
+            yield tail
+        self.complete = True
+
+    async def text_chunks(self, encoding: str = 'utf-8') -> AsyncIterator[str]:
+        """Yields the decoded body as text, never splitting a multi-byte character"""
+        decoder = codecs.getincrementaldecoder(encoding)()
+        async for chunk in self.chunks():
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+    async def read(self) -> bytes:
+        """Reads and decodes the rest of the body"""
+        return b''.join([chunk async for chunk in self.chunks()])
+
+    async def aclose(self):
+        await self._raw.aclose()
+
+
+class TransferStats:
+
+    def __init__(self, history: int = 256):
+        """
+        Counts bytes received on the wire against bytes after decompression
+
+        Parameters
+        ----------
+        history : int
+            The number of per-request records kept
+        """
+        self.requests = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self._recent = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def record(self, stream: Stream):
+        with self._lock:
+            self.requests += 1
+            self.wire_bytes += stream.wire_bytes
+            self.body_bytes += stream.body_bytes
+            self._recent.append({
+                'url': stream.url,
+                'status': stream.status,
+                'encoding': stream.encoding,
+                'wire_bytes': stream.wire_bytes,
+                'body_bytes': stream.body_bytes,
+                'complete': stream.complete,
+            })
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'wire_bytes': self.wire_bytes,
+                'body_bytes': self.body_bytes,
+                'saved_bytes': self.body_bytes - self.wire_bytes,
+                'ratio': self.wire_bytes / self.body_bytes if self.body_bytes else 1.0,
+            }
+
+    def recent(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._recent)
+
+
+class Response:
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes, wire_bytes: int = 0):
+        """
+        A fully read HTTP response
+
+        Parameters
+        ----------
+        url : str
+            The final url after following redirects
+        status : int
+            The HTTP status code
+        headers : Dict[str, str]
+            The response headers with lower-cased names
+        body : bytes
+            The decoded response body
+        wire_bytes : int
+            The size of the body as received, before decompression
+        """
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.wire_bytes = wire_bytes
+
+    def __repr__(self):
+        return f'<Response [{self.status}] {self.url}>'
+
+    def text(self, encoding: str = 'utf-8') -> str:
+        return self.body.decode(encoding)
+
+
+class HTTPClient:
+
+    user_agent = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/107.0.0.0 Safari/537.36"
+    )
+
+    def __init__(
+            self,
+            timeout: float = 30.0,
+            max_redirects: int = 5,
+            pool: Optional[ConnectionPool] = None,
+            limiter: Optional[RateLimiter] = None,
+            max_retries: int = 4
+    ):
+        """
+        A minimal HTTP/1.1 client with keep-alive built on asyncio streams
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds allowed for connecting and for each read
+        max_redirects : int
+            The number of redirects followed before giving up
+        pool : ConnectionPool | None
+            The pool connections are reused from, a new one by default
+        limiter : RateLimiter | None
+            Paces the requests sent to each host, a new one by default
+        max_retries : int
+            The number of times a 429 or 5xx response is retried after backing off
+        """
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.pool = pool or ConnectionPool()
+        self.limiter = limiter or RateLimiter(max_concurrency=self.pool.max_per_host)
+        self.max_retries = max_retries
+        self.stats = TransferStats()
+        self._ssl = ssl.create_default_context()
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Response:
+        """
+        Sends a GET request and reads the whole body, following redirects
+
+        Parameters
+        ----------
+        url : str
+            The absolute http(s) url to fetch
+        headers : Dict[str, str] | None
+            Extra request headers
+
+        Returns
+        -------
+        Response
+            The final response
+        """
+        async with self.open(url, headers) as stream:
+            body = await stream.read()
+            return Response(stream.url, stream.status, stream.headers, body, stream.wire_bytes)
+
+    @contextlib.asynccontextmanager
+    async def open(self, url: str, headers: Optional[Dict[str, str]] = None) -> AsyncIterator[Stream]:
+        """
+        Sends a GET request, following redirects, and yields the final response unread
+
+        429 and 5xx responses are retried up to `max_retries` times after a
+        jittered exponential backoff, or after the server's Retry-After, and
+        the last one is yielded if they keep coming. Leaving the block before
+        the body is fully read closes the connection instead of returning it
+        to the pool.
+
+        Parameters
+        ----------
+        url : str
+            The absolute http(s) url to fetch
+        headers : Dict[str, str] | None
+            Extra request headers
+        """
+        for attempt in range(self.max_retries + 1):
+            async with self._follow(url, headers) as stream:
+                if stream.status not in THROTTLED or attempt == self.max_retries:
+                    yield stream
+                    return
+                delay = retry_delay(attempt, stream.headers.get('retry-after'))
+                # error bodies are small, reading them keeps the connection reusable
+                await stream.read()
+            limiter = self.limiter.host(_split(stream.url)[1])
+            limiter.retries += 1
+            if stream.status == 429:
+                # the whole host is limiting us, not just this request
+                limiter.pause(delay)
+            await asyncio.sleep(delay)
+
+    @contextlib.asynccontextmanager
+    async def _follow(self, url: str, headers: Optional[Dict[str, str]]) -> AsyncIterator[Stream]:
+        for _ in range(self.max_redirects + 1):
+            async with self._exchange(url, headers) as stream:
+                location = stream.headers.get('location')
+                if stream.status in _REDIRECTS and location:
+                    await stream.read()
+                    url = urljoin(url, location)
+                    continue
+                yield stream
+                return
+        raise AIOError(f'too many redirects while fetching {url}')
+
+    async def _connect(self, scheme: str, host: str, port: int):
+        tls = self._ssl if scheme == 'https' else None
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=tls, server_hostname=host if tls else None),
+            self.timeout
+        )
+
+    @contextlib.asynccontextmanager
+    async def _exchange(self, url: str, headers: Optional[Dict[str, str]]) -> AsyncIterator[Stream]:
+        scheme, host, port, target = _split(url)
+        key = (scheme, host, port)
+        authority = host if port in (80, 443) else f'{host}:{port}'
+        payload = self._build_request(authority, target, headers, keep_alive=True)
+        host_limiter = self.limiter.host(host)
+        async with host_limiter.slot(), self.pool.slot(key):
+            while True:
+                conn = self.pool.checkout(key)
+                reused = conn is not None
+                if conn is None:
+                    conn = _Connection(key, *await self._connect(scheme, host, port))
+                    self.pool.opened += 1
+                try:
+                    conn.writer.write(payload)
+                    await conn.writer.drain()
+                    status, resp_headers = await self._read_head(conn.reader)
+                    host_limiter.observe(status)
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    conn.close()
+                    if reused:
+                        # the server dropped the idle connection, retry on another one
+                        continue
+                    raise
+            try:
+                stream = Stream(url, status, resp_headers, self._iter_body(conn.reader, status, resp_headers))
+            except BaseException:
+                conn.close()
+                raise
+            try:
+                yield stream
+            except BaseException:
+                conn.close()
+                raise
+            finally:
+                await stream.aclose()
+                self.stats.record(stream)
+            if stream.complete and _reusable(status, resp_headers):
+                self.pool.checkin(conn)
+            else:
+                conn.close()
+
+    def _build_request(self, host: str, target: str, headers: Optional[Dict[str, str]], keep_alive: bool) -> bytes:
+        lines = {
+            'Host': host,
+            'User-Agent': self.user_agent,
+            'Accept': '*/*',
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive' if keep_alive else 'close',
+        }
+        if headers:
+            lines.update(headers)
+        head = f'GET {target} HTTP/1.1\r\n' + ''.join(f'{k}: {v}\r\n' for k, v in lines.items())
+        return (head + '\r\n').encode('latin-1')
+
+    async def _readline(self, reader: asyncio.StreamReader) -> bytes:
+        return await asyncio.wait_for(reader.readline(), self.timeout)
+
+    async def _read_head(self, reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str]]:
+        status_line = await self._readline(reader)
+        if not status_line:
+            raise ConnectionResetError('connection closed before a response was received')
+        try:
+            status = int(status_line.split(None, 2)[1])
+        except (IndexError, ValueError):
+            raise AIOError(f'malformed status line: {status_line!r}') from None
+        headers = {}
+        while True:
+            line = await self._readline(reader)
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name = name.strip().lower()
+            value = value.strip()
+            headers[name] = f'{headers[name]}, {value}' if name in headers else value
+        return status, headers
+
+    async def _iter_body(self, reader: asyncio.StreamReader, status: int, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+        """Yields the raw body in the order it arrives on the wire"""
+        if status in (204, 304) or 100 <= status < 200:
+            return
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            while True:
+                size_line = await self._readline(reader)
+                size = int(size_line.split(b';', 1)[0].strip() or b'0', 16)
+                if size == 0:
+                    # drain optional trailers up to the terminating blank line
+                    while (await self._readline(reader)) not in (b'\r\n', b'\n', b''):
+                        pass
+                    return
+                yield await asyncio.wait_for(reader.readexactly(size), self.timeout)
+                await self._readline(reader)
+        elif 'content-length' in headers:
+            remaining = int(headers['content-length'])
+            while remaining > 0:
+                chunk = await asyncio.wait_for(reader.read(min(remaining, 65536)), self.timeout)
+                if not chunk:
+                    raise asyncio.IncompleteReadError(b'', remaining)
+                remaining -= len(chunk)
+                yield chunk
+        else:
+            while True:
+                chunk = await asyncio.wait_for(reader.read(65536), self.timeout)
+                if not chunk:
+                    return
+                yield chunk
+
+
+def _reusable(status: int, headers: Dict[str, str]) -> bool:
+    """Whether the connection can carry another request after this response"""
+    if 'close' in headers.get('connection', '').lower():
+        return False
+    if status in (204, 304) or 100 <= status < 200:
+        return True
+    return 'chunked' in headers.get('transfer-encoding', '').lower() or 'content-length' in headers
+
+
+def _split(url: str) -> Tuple[str, str, int, str]:
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise AIOError(f'unsupported url: {url}')
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    target = parts.path or '/'
+    if parts.query:
+        target += '?' + parts.query
+    return parts.scheme, parts.hostname, port, target
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+client = HTTPClient()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Returns the event loop that owns all aiotube network I/O, starting it on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='aiotube-io', daemon=True).start()
+        return _loop
+
+
+def _on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def run_sync(coro: Awaitable) -> Any:
+    """Blocks the calling thread until `coro` finishes on the aiotube loop"""
+    loop = get_loop()
+    if _on_loop_thread(loop):
+        coro.close()
+        # waiting here would deadlock the loop the call has to run on
+        raise BlockingCallError(
+            'a blocking aiotube call (a sync property or constructor) was made on the aiotube I/O loop; '
+            'await its async variant instead, e.g. Channel.ametadata() rather than Channel.metadata'
+        )
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def run_async(coro: Awaitable) -> Any:
+    """Awaits `coro` on the aiotube loop from any other running event loop"""
+    loop = get_loop()
+    if _on_loop_thread(loop):
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def on_io_loop(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+    """Makes a coroutine function run on the aiotube loop, whichever loop awaits it"""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_async(func(*args, **kwargs))
+    return wrapper
+
+
+def configure(
+        max_connections_per_host: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        timeout: Optional[float] = None,
+        requests_per_second: Optional[float] = None,
+        max_requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_retries: Optional[int] = None
+):
+    """
+    Tunes the process-wide client used by every aiotube request
+
+    Parameters
+    ----------
+    max_connections_per_host : int | None
+        The number of concurrent connections allowed to one host, which is
+        also the ceiling of the adaptive in-flight window
+    idle_timeout : float | None
+        Seconds an unused keep-alive connection is kept open
+    timeout : float | None
+        Seconds allowed for connecting and for each read
+    requests_per_second : float | None
+        The starting request rate per host
+    max_requests_per_second : float | None
+        The rate per host may grow to while responses keep succeeding
+    burst : int | None
+        The number of requests to one host that may be sent back to back
+    max_retries : int | None
+        The number of times a 429 or 5xx response is retried
+    """
+    if max_connections_per_host is not None:
+        client.pool.max_per_host = max_connections_per_host
+    client.limiter.configure(requests_per_second, max_requests_per_second, burst, max_connections_per_host)
+    if max_retries is not None:
+        client.max_retries = max_retries
+    if idle_timeout is not None:
+        client.pool.idle_timeout = idle_timeout
+    if timeout is not None:
+        client.timeout = timeout
+
+
+def pool_stats() -> Dict[str, int]:
+    """Returns how many connections were opened, reused, evicted and are idle right now"""
+    return client.pool.stats()
+
+
+def transfer_stats() -> Dict[str, Any]:
+    """Returns process-wide byte counters: bytes on the wire vs bytes after decompression"""
+    return client.stats.snapshot()
+
+
+def recent_transfers() -> List[Dict[str, Any]]:
+    """Returns the byte counters of the most recent requests, oldest first"""
+    return client.stats.recent()
+
+
+def limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Returns each host's current rate, in-flight window, pause and throttling counters"""
+    return client.limiter.stats()
@@ -1,31 +1,201 @@
-from urllib.request import Request, urlopen
 from collections import OrderedDict
-from urllib.error import HTTPError, URLError
+from typing import Callable, Dict, Optional, Pattern, Match
 from .errors import TooManyRequests, InvalidURL, AIOError
-from .pool import collect
+from .transport import client, run_sync, on_io_loop
+from .cache import get_cache
+from .pool import collect, run
 
 
-__all__ = ['dup_filter', 'parser', 'request']
+__all__ = ['dup_filter', 'parser', 'request', 'arequest', 'scan', 'ascan', 'consume', 'aconsume']
 
 
-def request(url: str):
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) " 
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36"
-        ),
-    }
-    req = Request(url, headers=headers)
+def _check_status(status: int, url: str):
+    # 429 and 5xx only get here once the client's retries are used up
+    if status == 404:
+        raise InvalidURL('can not find anything with the requested url')
+    if status == 429:
+        raise TooManyRequests('you are being rate-limited for sending too many requests')
+    if status >= 400:
+        raise AIOError(f'HTTP {status} while fetching {url}')
+
+
+async def _lookup(cache, url: str, endpoint: Optional[str]):
+    # sqlite reads and writes of the cache run on the shared executor, off the I/O loop
+    if not cache or not cache.ttl(endpoint):
+        return None
+    return await run(cache.get, url, endpoint)
+
+
+@on_io_loop
+async def arequest(url: str, endpoint: str = None):
+    cache = get_cache()
+    cached = await _lookup(cache, url, endpoint)
+    if cached and cached.fresh:
+        return cached.text
+    try:
+        async with client.open(url, cached.validators() if cached else None) as response:
+            if response.status == 304 and cached:
+                await run(cache.refresh, url)
+                return cached.text
+            _check_status(response.status, url)
+            text = ''.join([chunk async for chunk in response.text_chunks()])
+    except (InvalidURL, TooManyRequests, AIOError):
+        raise
+    except Exception as e:
+        raise AIOError(f'{e!r}') from None
+    if cache and cache.ttl(endpoint):
+        await run(cache.put, url, endpoint, text, response.headers.get('etag'), response.headers.get('last-modified'))
+    return text
+
+
+def request(url: str, endpoint: str = None):
+    return run_sync(arequest(url, endpoint))
+
+
+@on_io_loop
+async def ascan(
+        url: str,
+        required: Dict[str, Pattern],
+        optional: Optional[Dict[str, Pattern]] = None,
+        endpoint: str = None,
+        overlap: Optional[int] = 65536,
+        batch: int = 32768
+) -> Dict[str, Optional[Match]]:
+    """
+    Streams a page and stops downloading once every required pattern has matched
+
+    Parameters
+    ----------
+    url : str
+        The page to read
+    required : Dict[str, Pattern]
+        Patterns that must all match before the connection is closed early
+    optional : Dict[str, Pattern] | None
+        Patterns reported only if they match before the required ones complete
+    endpoint : str | None
+        The aiotube.https endpoint name, used to serve a fresh cached copy
+    overlap : int | None
+        Characters of already-scanned text searched again with each batch,
+        so matches spanning two batches are found (bounds a match's length);
+        None keeps and searches everything read so far, which whole JSON
+        blobs such as ytInitialPlayerResponse need
+    batch : int
+        Characters collected before the pending patterns are searched again
+
+    Returns
+    -------
+    Dict[str, Match | None]
+        The first match of every pattern, None if it was not seen
+    """
+    patterns = {**(optional or {}), **required}
+    cache = get_cache()
+    cached = await _lookup(cache, url, endpoint)
+    if cached and cached.fresh:
+        return {name: pattern.search(cached.text) for name, pattern in patterns.items()}
+    found = dict.fromkeys(patterns)
     try:
-        return urlopen(req).read().decode('utf-8')
-    except HTTPError as e:
-        if e.code == 404:
-            raise InvalidURL('can not find anything with the requested url')
-        if e.code == 429:
-            raise TooManyRequests('you are being rate-limited for sending too many requests')
+        async with client.open(url, cached.validators() if cached else None) as response:
+            if response.status == 304 and cached:
+                await run(cache.refresh, url)
+                return {name: pattern.search(cached.text) for name, pattern in patterns.items()}
+            _check_status(response.status, url)
+            buffer = ''
+            scanned = 0
+            async for text in response.text_chunks():
+                buffer += text
+                if len(buffer) - scanned < batch:
+                    continue
+                buffer, scanned = _scan_window(buffer, scanned, patterns, found, overlap)
+                if all(found[name] for name in required):
+                    # everything needed is in hand, the rest of the page is never read
+                    break
+            else:
+                _scan_window(buffer, scanned, patterns, found, overlap)
+    except (InvalidURL, TooManyRequests, AIOError):
+        raise
     except Exception as e:
         raise AIOError(f'{e!r}') from None
+    return found
+
+
+def scan(
+        url: str,
+        required: Dict[str, Pattern],
+        optional: Optional[Dict[str, Pattern]] = None,
+        endpoint: str = None,
+        overlap: Optional[int] = 65536
+):
+    return run_sync(ascan(url, required, optional, endpoint, overlap))
+
+
+@on_io_loop
+async def aconsume(url: str, consumer: Callable[[str], bool], endpoint: str = None) -> bool:
+    """
+    Hands a page to `consumer` piece by piece as it downloads
+
+    Parameters
+    ----------
+    url : str
+        The page to read
+    consumer : Callable[[str], bool]
+        Called with each decoded piece of text; returning True closes the
+        connection, the rest of the page is never read
+    endpoint : str | None
+        The aiotube.https endpoint name, used to serve and store a cached copy
+
+    Returns
+    -------
+    bool
+        Whether the consumer stopped early
+    """
+    cache = get_cache()
+    cached = await _lookup(cache, url, endpoint)
+    if cached and cached.fresh:
+        return bool(consumer(cached.text))
+    pieces = []
+    try:
+        async with client.open(url, cached.validators() if cached else None) as response:
+            if response.status == 304 and cached:
+                await run(cache.refresh, url)
+                return bool(consumer(cached.text))
+            _check_status(response.status, url)
+            async for text in response.text_chunks():
+                pieces.append(text)
+                if consumer(text):
+                    return True
+    except (InvalidURL, TooManyRequests, AIOError):
+        raise
+    except Exception as e:
+        raise AIOError(f'{e!r}') from None
+    # only a page read to the end is complete enough to be served from the cache
+    if cache and cache.ttl(endpoint):
+        await run(
+            cache.put, url, endpoint, ''.join(pieces),
+            response.headers.get('etag'), response.headers.get('last-modified')
+        )
+    return False
+
+
+def consume(url: str, consumer: Callable[[str], bool], endpoint: str = None) -> bool:
+    return run_sync(aconsume(url, consumer, endpoint))
+
+
+def _scan_window(
+        buffer: str,
+        scanned: int,
+        patterns: Dict[str, Pattern],
+        found: Dict[str, Optional[Match]],
+        overlap: Optional[int]
+):
+    """Searches the unscanned tail of `buffer` for pending patterns and trims what can not match anymore"""
+    start = 0 if overlap is None else max(0, scanned - overlap)
+    for name, pattern in patterns.items():
+        if found[name] is None:
+            found[name] = pattern.search(buffer, start)
+    if overlap is None:
+        return buffer, len(buffer)
+    keep = max(0, len(buffer) - overlap)
+    return buffer[keep:], len(buffer) - keep
 
 
 def dup_filter(iterable: list, limit: int = None) -> list:
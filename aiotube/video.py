@@ -1,14 +1,23 @@
 import re
 import json
-from .https import video_data
-from typing import Dict, Any
+from .https import video_data, avideo_data, video_scan, avideo_scan
+from .pool import run
+from .transport import on_io_loop
+from .patterns import _VideoPatterns as Patterns
+from .initial_data import JSONBlob, PlayerResponse
+from typing import Dict, Any, Optional, Match
 
 
 class Video:
 
     _HEAD = 'https://www.youtube.com/watch?v='
 
-    def __init__(self, video_id: str):
+    # what metadata needs from the watch page; likes live in ytInitialData
+    # further down and are only picked up in streaming mode if already read
+    _REQUIRED = {'player': JSONBlob('ytInitialPlayerResponse')}
+    _OPTIONAL = {'likes': Patterns.like_count}
+
+    def __init__(self, video_id: str, streaming: bool = False):
         """
         Represents a YouTube video
 
@@ -16,7 +25,53 @@ class Video:
         ----------
         video_id : str
             The id or url of the video
+        streaming : bool
+            Stop downloading the watch page as soon as the metadata is found
+            instead of reading all of it
+        """
+        self._setup(video_id)
+        if streaming:
+            self._meta = self._build_metadata(video_scan(self._matched_id, self._REQUIRED, self._OPTIONAL))
+        else:
+            self._video_data = video_data(self._matched_id)
+
+    @classmethod
+    @on_io_loop
+    async def fetch(cls, video_id: str, streaming: bool = False) -> 'Video':
+        """
+        Asynchronously creates a Video without blocking the calling event loop
+
+        Parameters
+        ----------
+        video_id : str
+            The id or url of the video
+        streaming : bool
+            Stop downloading the watch page as soon as the metadata is found
+
+        Returns
+        -------
+        Video
+            The video with its page downloaded
         """
+        self = cls.__new__(cls)
+        self._setup(video_id)
+        # the player response is decoded on the shared executor, neither on
+        # the I/O loop nor later on the caller's loop when metadata is read
+        if streaming:
+            self._meta = await run(
+                self._build_metadata, await avideo_scan(self._matched_id, self._REQUIRED, self._OPTIONAL)
+            )
+        else:
+            self._video_data = await avideo_data(self._matched_id)
+            try:
+                self._meta = await run(self._parse_page, self._video_data)
+            except ValueError:
+                # left for the metadata property to raise, as before
+                pass
+        return self
+
+    def _setup(self, video_id: str):
+        """Resolve the 11-character video id and the watch url"""
         pattern = re.compile(r'(?:youtu\.be/|youtube\.com/watch\?v=|youtube\.com/embed/|^)([A-Za-z0-9_-]{11})')
         match = pattern.search(video_id)
         
@@ -30,7 +85,8 @@ class Video:
                 raise ValueError('invalid video id or url')
                 
         self._url = self._HEAD + self._matched_id
-        self._video_data = video_data(self._matched_id)
+        self._video_data = None
+        self._meta = None
 
     def __repr__(self):
         return f'<Video {self._url}>'
@@ -46,35 +102,41 @@ class Video:
             Video metadata in a dict format containing keys: title, id, views, duration, author_id,
             upload_date, url, thumbnails, tags, description
         """
-        details_pattern = re.compile('videoDetails\":(.*?)\"isLiveContent\":.*?}')
-        upload_date_pattern = re.compile("<meta itemprop=\"uploadDate\" content=\"(.*?)\">")
-        genre_pattern = re.compile("<meta itemprop=\"genre\" content=\"(.*?)\">")
-        like_count_pattern = re.compile("iconType\":\"LIKE\"},\"defaultText\":(.*?)}}")
-        raw_details = details_pattern.search(self._video_data).group(0)
-        upload_date = upload_date_pattern.search(self._video_data).group(1)
-        metadata = json.loads(raw_details.replace('videoDetails\":', ''))
+        if self._meta is None:
+            self._meta = self._parse_page(self._video_data)
+        return self._meta
+
+    @classmethod
+    def _parse_page(cls, page: str) -> Dict[str, Any]:
+        return cls._build_metadata({
+            name: pattern.search(page)
+            for name, pattern in {**cls._REQUIRED, **cls._OPTIONAL}.items()
+        })
+
+    @staticmethod
+    def _build_metadata(matches: Dict[str, Optional[Match]]) -> Dict[str, Any]:
+        if matches is None or matches['player'] is None:
+            raise ValueError('could not find the player response on the watch page')
+        player = PlayerResponse(matches['player'].value)
         data = {
-            'title': metadata['title'],
-            'id': metadata['videoId'],
-            'views': metadata.get('viewCount'),
-            'streamed': metadata['isLiveContent'],
-            'duration': metadata['lengthSeconds'],
-            'author_id': metadata['channelId'],
-            'upload_date': upload_date,
-            'url': f"https://www.youtube.com/watch?v={metadata['videoId']}",
-            'thumbnails': metadata.get('thumbnail', {}).get('thumbnails'),
-            'tags': metadata.get('keywords'),
-            'description': metadata.get('shortDescription'),
+            'title': player.title,
+            'id': player.video_id,
+            'views': str(player.view_count) if player.view_count is not None else None,
+            'streamed': player.is_live_content,
+            'duration': str(player.length_seconds) if player.length_seconds is not None else None,
+            'author_id': player.channel_id,
+            'upload_date': player.upload_date,
+            'url': f"https://www.youtube.com/watch?v={player.video_id}",
+            'thumbnails': player.thumbnails,
+            'tags': player.keywords,
+            'description': player.description,
+            'genre': player.category,
         }
         try:
-            likes_count = like_count_pattern.search(self._video_data).group(1)
+            likes_count = matches['likes'].group(1)
             data['likes'] = json.loads(likes_count + '}}}')[
                 'accessibility'
             ]['accessibilityData']['label'].split(' ')[0].replace(',', '')
         except (AttributeError, KeyError, json.decoder.JSONDecodeError):
             data['likes'] = None
-        try:
-            data['genre'] = genre_pattern.search(self._video_data).group(1)
-        except AttributeError:
-            data['genre'] = None
         return data
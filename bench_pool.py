@@ -0,0 +1,63 @@
+"""Per-call overhead of aiotube.pool.collect, before and after the shared executor.
+
+Runs the same four-pattern regex extraction Playlist.metadata does over a
+synthetic page, once with the old executor-per-call implementation and
+once each with the inline and shared-executor paths of the new one.
+
+    python bench_pool.py [iterations]
+"""
+import re
+import sys
+import time
+import concurrent.futures
+
+from aiotube import pool
+
+PATTERNS = [
+    re.compile("{\"title\":\"(.*?)\""),
+    re.compile("stats\":\\[{\"runs\":\\[{\"text\":\"(.*?)\""),
+    re.compile("videoId\":\"(.*?)\""),
+    re.compile("og:image\" content=\"(.*?)\\?"),
+]
+
+
+def old_collect(func, args):
+    # the implementation before the shared executor
+    max_workers = len(args) or 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as exe:
+        return list(exe.map(func, args))
+
+
+def bench(name, collect, page, iterations, empty):
+    def extract(pattern):
+        return pattern.findall(page) or None
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        collect(extract, PATTERNS)
+    elapsed = time.perf_counter() - started
+    per_call = elapsed / iterations * 1e6
+    print(f"{name:<28} {per_call:>10.1f} us/call   overhead {per_call - empty:>9.1f} us")
+    return per_call
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    page = '{"title":"Playlist"}' + ''.join(f'"videoId":"{i:011d}",' for i in range(200))
+
+    # the regex work alone, to subtract from every variant
+    started = time.perf_counter()
+    for _ in range(iterations):
+        [p.findall(page) for p in PATTERNS]
+    empty = (time.perf_counter() - started) / iterations * 1e6
+
+    print(f"{iterations} calls, {len(PATTERNS)} patterns over a {len(page)} character page")
+    print(f"{'bare regex':<28} {empty:>10.1f} us/call")
+    bench('executor per call (old)', old_collect, page, iterations, empty)
+    bench('inline (new default)', pool.collect, page, iterations, empty)
+    bench('shared executor (new)', lambda f, a: pool.collect(f, a, threaded=True), page, iterations, empty)
+    pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+import time
+
+from PyQt6.QtCore import QAbstractListModel, QEvent, QModelIndex, QRect, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QCursor, QFont, QPainter, QPen
+from PyQt6.QtWidgets import QListView, QStyle, QStyledItemDelegate
+
+from thumbnails import thumbnail_url
+
+CARD_WIDTH = 340
+CARD_HEIGHT = 360
+CARD_SPACING = 30
+COLUMNS = 3
+THUMBNAIL_SIZE = QSize(320, 180)
+
+VideoRole = Qt.ItemDataRole.UserRole
+
+
+def _longest_increasing(values):
+    """Indexes into `values` of one longest strictly increasing subsequence."""
+    tails = []  # index of the smallest tail of an increasing run of each length
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        low, high = 0, len(tails)
+        while low < high:
+            middle = (low + high) // 2
+            if values[tails[middle]] < value:
+                low = middle + 1
+            else:
+                high = middle
+        previous[i] = tails[low - 1] if low else -1
+        if low == len(tails):
+            tails.append(i)
+        else:
+            tails[low] = i
+    result = []
+    i = tails[-1] if tails else -1
+    while i != -1:
+        result.append(i)
+        i = previous[i]
+    return result[::-1]
+
+
+def upload_text(upload_ts):
+    """'Uploaded N days ago' for an upload time in UTC epoch seconds."""
+    if upload_ts is None:
+        return "Upload date unknown"
+    days_difference = int(max(0, time.time() - upload_ts) // 86400)
+    return f"Uploaded {days_difference} days ago"
+
+
+class ChannelListModel(QAbstractListModel):
+    """The dashboard's channel rows, one video_data dict per card.
+
+    Thumbnails are not stored here: `thumbnail()` looks them up in the
+    ThumbnailLoader's memory cache and only asks for a download when a card
+    is actually painted, so off-screen rows never cost a request.
+    """
+
+    def __init__(self, thumbnail_loader, parent=None):
+        super().__init__(parent)
+        self.thumbnail_loader = thumbnail_loader
+        self._rows = []
+        self._requested = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        video_data = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return video_data['channel_name']
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return video_data['video_title']
+        if role == VideoRole:
+            return video_data
+        return None
+
+    def set_rows(self, rows):
+        self._cancel_thumbnails(rows)
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._requested.clear()
+        self.endResetModel()
+
+    def _cancel_thumbnails(self, rows):
+        """Drop queued thumbnail downloads of the cards that `rows` no longer shows."""
+        if self.thumbnail_loader is None:
+            return
+        gone = {video_data['video_id'] for video_data in self._rows}
+        gone.difference_update(video_data['video_id'] for video_data in rows)
+        if gone:
+            self.thumbnail_loader.cancel(thumbnail_url(video_id) for video_id in gone)
+
+    def apply_rows(self, rows):
+        """Turn the displayed rows into `rows` with as few row operations as possible.
+
+        Cards of removed channels are removed, new channels inserted,
+        changed cards updated in place, and only cards that are out of
+        order are moved; untouched cards keep their thumbnails and are
+        not repainted.
+        """
+        if not self._rows:
+            self.set_rows(rows)
+            return
+        self._cancel_thumbnails(rows)
+        fresh = {video_data['channel_id']: video_data for video_data in rows}
+        root = QModelIndex()
+        
+        for row in reversed(range(len(self._rows))):
+            if self._rows[row]['channel_id'] not in fresh:
+                self.beginRemoveRows(root, row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+        
+        for row, video_data in enumerate(self._rows):
+            updated = fresh[video_data['channel_id']]
+            if updated != video_data:
+                self._rows[row] = updated
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+        
+        # Cards whose relative order is unchanged stay put, the rest are moved
+        current = [video_data['channel_id'] for video_data in self._rows]
+        position = {channel_id: row for row, channel_id in enumerate(current)}
+        target = [video_data['channel_id'] for video_data in rows]
+        kept = [channel_id for channel_id in target if channel_id in position]
+        stable = {kept[i] for i in _longest_increasing([position[channel_id] for channel_id in kept])}
+        
+        for row, channel_id in enumerate(target):
+            while row >= len(current) or current[row] != channel_id:
+                if channel_id not in position:
+                    self.beginInsertRows(root, row, row)
+                    self._rows.insert(row, fresh[channel_id])
+                    self.endInsertRows()
+                    current.insert(row, channel_id)
+                    position[channel_id] = row
+                elif channel_id in stable and current[row] not in stable:
+                    # A card that belongs further down is in the way, park it at the end
+                    self._move(row, len(current), current)
+                else:
+                    self._move(current.index(channel_id, row), row, current)
+
+    def _move(self, source, destination, current):
+        root = QModelIndex()
+        self.beginMoveRows(root, source, source, root, destination)
+        insert_at = destination - 1 if destination > source else destination
+        self._rows.insert(insert_at, self._rows.pop(source))
+        current.insert(insert_at, current.pop(source))
+        self.endMoveRows()
+
+    def row_of(self, channel_id):
+        for row, video_data in enumerate(self._rows):
+            if video_data['channel_id'] == channel_id:
+                return row
+        return -1
+
+    def mark_watched(self, channel_id):
+        row = self.row_of(channel_id)
+        if row >= 0:
+            self._rows[row]['has_new_video'] = 0
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [VideoRole])
+
+    def thumbnail(self, index):
+        """The card's scaled thumbnail if it is in memory, else None after queueing it."""
+        video_id = self._rows[index.row()]['video_id']
+        url = thumbnail_url(video_id)
+        pixmap = self.thumbnail_loader.peek(url, THUMBNAIL_SIZE)
+        if pixmap is None and video_id not in self._requested:
+            self._requested.add(video_id)
+            # A failed load is forgotten, so the card asks again the next time it is painted
+            self.thumbnail_loader.load(
+                url, lambda _: self._thumbnail_ready(video_id), THUMBNAIL_SIZE,
+                on_error=lambda: self._requested.discard(video_id)
+            )
+        return pixmap
+
+    def _thumbnail_ready(self, video_id):
+        self._requested.discard(video_id)
+        for row, video_data in enumerate(self._rows):
+            if video_data['video_id'] == video_id:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+
+class VideoCardDelegate(QStyledItemDelegate):
+    """Paints a channel card and turns clicks into open/remove requests.
+
+    The look matches the old widget cards: thumbnail, channel name, title,
+    views, upload age and a remove button, highlighted green when the
+    channel has an unwatched video.
+    """
+
+    clicked = pyqtSignal(dict)
+    removeRequested = pyqtSignal(dict)
+
+    PADDING = 10
+
+    def sizeHint(self, option, index):
+        return QSize(CARD_WIDTH + CARD_SPACING, CARD_HEIGHT + CARD_SPACING)
+
+    def _card_rect(self, option):
+        return QRect(
+            option.rect.x() + CARD_SPACING // 2,
+            option.rect.y() + CARD_SPACING // 2,
+            CARD_WIDTH,
+            CARD_HEIGHT
+        )
+
+    def _button_rect(self, option):
+        card = self._card_rect(option)
+        return QRect(card.x() + self.PADDING, card.bottom() - self.PADDING - 30, CARD_WIDTH - 2 * self.PADDING, 30)
+
+    @staticmethod
+    def _font(pixel_size, bold=False):
+        font = QFont()
+        font.setPixelSize(pixel_size)
+        font.setBold(bold)
+        return font
+
+    def paint(self, painter, option, index):
+        video_data = index.data(VideoRole)
+        card = self._card_rect(option)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card background, green when there is an unwatched video
+        if int(video_data.get('has_new_video') or 0):
+            painter.setPen(QPen(QColor("#2e8b57"), 2))
+            painter.setBrush(QColor("#1a472a"))
+        else:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor("#3b3b3b"))
+        painter.drawRoundedRect(card, 8, 8)
+
+        # Thumbnail, or the placeholder until it is loaded
+        thumb_rect = QRect(card.x() + self.PADDING, card.y() + self.PADDING, THUMBNAIL_SIZE.width(), THUMBNAIL_SIZE.height())
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#1f1f1f"))
+        painter.drawRoundedRect(thumb_rect, 4, 4)
+        pixmap = index.model().thumbnail(index)
+        if pixmap is not None:
+            target = QRect(0, 0, pixmap.width(), pixmap.height())
+            target.moveCenter(thumb_rect.center())
+            painter.drawPixmap(target, pixmap)
+
+        # Text block under the thumbnail
+        painter.setPen(QColor("white"))
+        x = card.x() + self.PADDING
+        width = CARD_WIDTH - 2 * self.PADDING
+        y = thumb_rect.bottom() + 8
+        flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap
+        for text, font, height in (
+                (video_data['channel_name'], self._font(14, bold=True), 20),
+                (video_data['video_title'], self._font(12), 48),
+                (f"Views: {video_data['video_views']}", self._font(11), 16),
+                (upload_text(video_data.get('upload_ts')), self._font(11), 16)):
+            painter.setFont(font)
+            painter.drawText(QRect(x, y, width, height), flags, str(text))
+            y += height + 6
+
+        # Remove button, darker while the cursor is over it
+        button = self._button_rect(option)
+        hovered = False
+        if option.widget is not None and option.state & QStyle.StateFlag.State_MouseOver:
+            hovered = button.contains(option.widget.mapFromGlobal(QCursor.pos()))
+        painter.setBrush(QColor("#b71c1c" if hovered else "#d32f2f"))
+        painter.drawRoundedRect(button, 4, 4)
+        painter.setFont(self._font(12))
+        painter.drawText(button, Qt.AlignmentFlag.AlignCenter, "Remove Channel")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            position = event.position().toPoint()
+            video_data = index.data(VideoRole)
+            if self._button_rect(option).contains(position):
+                self.removeRequested.emit(video_data)
+                return True
+            if self._card_rect(option).contains(position):
+                self.clicked.emit(video_data)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class DashboardView(QListView):
+    """A wrapping grid of cards; only the visible ones are ever painted."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setGridSize(QSize(CARD_WIDTH + CARD_SPACING, CARD_HEIGHT + CARD_SPACING))
+        # Exactly COLUMNS cards per row, as the old grid layout had; the
+        # scroll bar is always shown so it never changes the usable width
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFixedWidth(
+            COLUMNS * (CARD_WIDTH + CARD_SPACING)
+            + 2 * self.frameWidth()
+            + self.verticalScrollBar().sizeHint().width()
+        )
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(40)
+        self.setMouseTracking(True)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        # Repaint the card under the cursor so its button hover state follows the mouse
+        index = self.indexAt(event.position().toPoint())
+        if index.isValid():
+            self.viewport().update(self.visualRect(index))
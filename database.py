@@ -1,40 +1,156 @@
+import asyncio
+import queue
 import sqlite3
 import threading
 import os
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from datetime import datetime, timezone
+
+
+def parse_timestamp(value):
+    """Turn an ISO upload date ('2024-01-15' or '2024-01-15T09:00:12-08:00') into UTC epoch seconds."""
+    if not value or value == 'N/A':
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def parse_views(value):
+    """'12,345' or '12345' -> 12345, None when the count is unknown."""
+    digits = re.sub(r'\D', '', str(value or ''))
+    return int(digits) if digits else None
+
 
 class Database:
+    # Serializes writers; readers never take it
     _lock = threading.Lock()
-    
-    def __init__(self):
-        # Get user's home directory
-        user_data_dir = os.path.expanduser('~/Library/Application Support/YouTube Channel Tracker')
-        
-        # Create directory if it doesn't exist
-        os.makedirs(user_data_dir, exist_ok=True)
-        
-        # Create database path
-        self.db_path = os.path.join(user_data_dir, 'youtube_channels.db')
-        
+
+    # Applied to every connection. WAL lets readers run alongside the writer,
+    # and synchronous=NORMAL is crash-safe under WAL without an fsync per commit
+    PRAGMAS = (
+        'PRAGMA journal_mode = WAL',
+        'PRAGMA synchronous = NORMAL',
+        'PRAGMA busy_timeout = 5000',
+        'PRAGMA cache_size = -8000',  # 8 MB page cache
+        'PRAGMA temp_store = MEMORY',
+    )
+
+    # Stored in PRAGMA user_version; bump it with every step added to _migrate
+    SCHEMA_VERSION = 3
+
+    # Columns every channel query returns
+    CHANNEL_COLUMNS = (
+        'channel_name, channel_id, video_id, video_title, video_views, '
+        'upload_date, upload_ts, view_count, has_new_video'
+    )
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            # Get user's home directory
+            user_data_dir = os.path.expanduser('~/Library/Application Support/YouTube Channel Tracker')
+
+            # Create directory if it doesn't exist
+            os.makedirs(user_data_dir, exist_ok=True)
+
+            # Create database path
+            db_path = os.path.join(user_data_dir, 'youtube_channels.db')
+        self.db_path = db_path
+
+        # One long-lived writer shared by all threads under _lock, and one
+        # reader per thread, created on first use
+        self._writer = self._connect()
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+
         # Initialize the database
         self._initialize_db()
-    
+
+    def _connect(self, autocommit=False):
+        # The sqlite3 module keeps up to `cached_statements` prepared statements
+        # per connection, so the fixed SQL below is compiled once
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=5.0,
+            check_same_thread=False,
+            cached_statements=128,
+            isolation_level=None if autocommit else 'DEFERRED'
+        )
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        # Rows are read by column name, not by position
+        conn.row_factory = sqlite3.Row
+        return conn
+
     @contextmanager
-    def get_connection(self):
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path, timeout=5.0)
-            yield conn
-        finally:
-            if conn:
+    def transaction(self):
+        """Run writes on the shared connection in one transaction, committed on success.
+
+        Inside batch() on the same thread this is a savepoint instead, so a
+        failing write is undone alone and the batch commits the rest.
+        """
+        if getattr(self._local, 'batch', False):
+            self._writer.execute('SAVEPOINT write')
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.execute('ROLLBACK TO write')
+                self._writer.execute('RELEASE write')
+                raise
+            self._writer.execute('RELEASE write')
+            return
+        with self._lock:
+            with self._writer:
+                yield self._writer
+
+    @contextmanager
+    def batch(self):
+        """Group every transaction this thread opens inside the block into one commit."""
+        with self._lock:
+            with self._writer:
+                # Explicit, so releasing the first savepoint does not commit
+                self._writer.execute('BEGIN')
+                self._local.batch = True
+                try:
+                    yield self._writer
+                finally:
+                    self._local.batch = False
+
+    def reader(self):
+        """This thread's read connection; it never waits for the writer."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit, so no read transaction stays open between queries
+            conn = self._connect(autocommit=True)
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def close(self):
+        with self._readers_lock:
+            for conn in self._readers:
                 conn.close()
-    
+            self._readers.clear()
+        self._local = threading.local()
+        with self._lock:
+            self._writer.close()
+
     def _initialize_db(self):
-        """Create the channels table if it doesn't exist."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
+        """Create the channels table if it doesn't exist and migrate older files."""
+        with self.transaction() as conn:
+            # sqlite3 only opens a transaction on its own before DML, so the
+            # schema changes would commit one by one; a migration that fails
+            # halfway must leave the file as it was
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('''
                 CREATE TABLE IF NOT EXISTS channels (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     channel_name TEXT NOT NULL,
@@ -47,103 +163,473 @@ class Database:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
-            conn.commit()
-    
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version < self.SCHEMA_VERSION:
+                self._migrate(conn, version)
+                conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+            self.full_text = self._create_search_index(conn)
+
+    # Full-text indexes over the channel and video tables, kept in sync by triggers.
+    # Both point at an INTEGER PRIMARY KEY, which unlike a plain rowid survives VACUUM
+    SEARCH_INDEX = (
+        '''CREATE VIRTUAL TABLE IF NOT EXISTS channels_fts USING fts5(
+               channel_name, video_title,
+               content='channels', content_rowid='id',
+               tokenize='unicode61 remove_diacritics 2', prefix='2 3')''',
+        '''CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5(
+               title,
+               content='videos', content_rowid='id',
+               tokenize='unicode61 remove_diacritics 2', prefix='2 3')''',
+        '''CREATE TRIGGER IF NOT EXISTS channels_fts_insert AFTER INSERT ON channels BEGIN
+               INSERT INTO channels_fts (rowid, channel_name, video_title)
+               VALUES (new.id, new.channel_name, new.video_title);
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS channels_fts_delete AFTER DELETE ON channels BEGIN
+               INSERT INTO channels_fts (channels_fts, rowid, channel_name, video_title)
+               VALUES ('delete', old.id, old.channel_name, old.video_title);
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS channels_fts_update AFTER UPDATE OF channel_name, video_title ON channels BEGIN
+               INSERT INTO channels_fts (channels_fts, rowid, channel_name, video_title)
+               VALUES ('delete', old.id, old.channel_name, old.video_title);
+               INSERT INTO channels_fts (rowid, channel_name, video_title)
+               VALUES (new.id, new.channel_name, new.video_title);
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS videos_fts_insert AFTER INSERT ON videos BEGIN
+               INSERT INTO videos_fts (rowid, title) VALUES (new.id, new.title);
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS videos_fts_delete AFTER DELETE ON videos BEGIN
+               INSERT INTO videos_fts (videos_fts, rowid, title) VALUES ('delete', old.id, old.title);
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS videos_fts_update AFTER UPDATE OF title ON videos BEGIN
+               INSERT INTO videos_fts (videos_fts, rowid, title) VALUES ('delete', old.id, old.title);
+               INSERT INTO videos_fts (rowid, title) VALUES (new.id, new.title);
+           END''',
+    )
+
+    def _create_search_index(self, conn):
+        """Create and fill the FTS5 index if missing; False when SQLite lacks FTS5."""
+        found = conn.execute(
+            "SELECT count(*) FROM sqlite_master WHERE name IN ('channels_fts', 'videos_fts')"
+        ).fetchone()[0]
+        if found == 2:
+            return True
+        try:
+            conn.execute('SAVEPOINT search_index')
+            for statement in self.SEARCH_INDEX:
+                conn.execute(statement)
+            # Index the rows written before the index existed
+            conn.execute("INSERT INTO channels_fts (channels_fts) VALUES ('rebuild')")
+            conn.execute("INSERT INTO videos_fts (videos_fts) VALUES ('rebuild')")
+            conn.execute('RELEASE search_index')
+            return True
+        except sqlite3.OperationalError as e:
+            conn.execute('ROLLBACK TO search_index')
+            conn.execute('RELEASE search_index')
+            print(f"Full-text search unavailable, falling back to LIKE: {e}")
+            return False
+
+    def _migrate(self, conn, version):
+        """Bring a database file written by an older version up to SCHEMA_VERSION."""
+        if version < 1:
+            # Typed copies of the display strings: the upload time as UTC epoch
+            # seconds and the view count as an integer, so SQL can sort and filter
+            columns = {column['name'] for column in conn.execute('PRAGMA table_info(channels)')}
+            if 'upload_ts' not in columns:
+                conn.execute('ALTER TABLE channels ADD COLUMN upload_ts INTEGER')
+            if 'view_count' not in columns:
+                conn.execute('ALTER TABLE channels ADD COLUMN view_count INTEGER')
+            rows = conn.execute('SELECT id, upload_date, video_views FROM channels').fetchall()
+            conn.executemany('UPDATE channels SET upload_ts = ?, view_count = ? WHERE id = ?', [
+                (parse_timestamp(row['upload_date']), parse_views(row['video_views']), row['id'])
+                for row in rows
+            ])
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_channels_upload_ts ON channels (upload_ts DESC)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_channels_new ON channels (has_new_video, upload_ts DESC)')
+            if rows:
+                print(f"Migrated {len(rows)} channels to schema version 1")
+        if version < 2:
+            # Every upload seen per channel, so several uploads between two checks
+            # are all noticed; the primary key index answers the seen-set lookups
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS videos (
+                    channel_id TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    title TEXT,
+                    published TEXT,
+                    published_ts INTEGER,
+                    view_count INTEGER,
+                    first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (channel_id, video_id)
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_videos_published ON videos (channel_id, published_ts DESC)')
+        if version < 3:
+            # Give videos a stable id for the full-text index; its old index is
+            # dropped here and rebuilt by _create_search_index
+            for trigger in ('videos_fts_insert', 'videos_fts_delete', 'videos_fts_update'):
+                conn.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+            conn.execute('DROP TABLE IF EXISTS videos_fts')
+            # Left behind by a version that did not migrate in one transaction
+            conn.execute('DROP TABLE IF EXISTS videos_v3')
+            conn.execute('''
+                CREATE TABLE videos_v3 (
+                    id INTEGER PRIMARY KEY,
+                    channel_id TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    title TEXT,
+                    published TEXT,
+                    published_ts INTEGER,
+                    view_count INTEGER,
+                    first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (channel_id, video_id)
+                )
+            ''')
+            conn.execute('''
+                INSERT INTO videos_v3
+                    (channel_id, video_id, title, published, published_ts, view_count, first_seen)
+                SELECT channel_id, video_id, title, published, published_ts, view_count, first_seen
+                FROM videos ORDER BY rowid
+            ''')
+            conn.execute('DROP TABLE videos')
+            conn.execute('ALTER TABLE videos_v3 RENAME TO videos')
+            conn.execute('CREATE INDEX idx_videos_published ON videos (channel_id, published_ts DESC)')
+
+    @staticmethod
+    def _values(channel_data):
+        """Parameters for the INSERT statements below, typed columns included."""
+        return (
+            channel_data['channel_name'],
+            channel_data['channel_id'],
+            channel_data['video_id'],
+            channel_data['video_title'],
+            channel_data['video_views'],
+            channel_data['upload_date'],
+            channel_data.get('has_new_video', 1),
+            parse_timestamp(channel_data['upload_date']),
+            parse_views(channel_data['video_views'])
+        )
+
     def add_channel(self, channel_data):
-        max_retries = 3
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            try:
-                with self._lock:
-                    with self.get_connection() as conn:
-                        cursor = conn.cursor()
-                        
-                        # Check if channel already exists
-                        cursor.execute('SELECT channel_id FROM channels WHERE channel_id = ?', 
-                                     (channel_data['channel_id'],))
-                        
-                        if cursor.fetchone() is None:
-                            sql = '''INSERT INTO channels 
-                                    (channel_name, channel_id, video_id, video_title, 
-                                     video_views, upload_date, has_new_video) 
-                                    VALUES (?, ?, ?, ?, ?, ?, ?)'''
-                            
-                            cursor.execute(sql, (
-                                channel_data['channel_name'],
-                                channel_data['channel_id'],
-                                channel_data['video_id'],
-                                channel_data['video_title'],
-                                channel_data['video_views'],
-                                channel_data['upload_date'],
-                                channel_data.get('has_new_video', 1)
-                            ))
-                            conn.commit()
-                            print(f"Successfully added channel: {channel_data['channel_name']}")
-                            return True
-                        else:
-                            print(f"Channel already exists: {channel_data['channel_name']}")
-                            return False
-                            
-            except sqlite3.OperationalError as e:
-                if 'database is locked' in str(e):
-                    retry_count += 1
-                    print(f"Database locked, retrying... ({retry_count}/{max_retries})")
-                    time.sleep(0.5)  # Reduced wait time
-                else:
-                    print(f"Database error: {e}")
-                    return False
-            except Exception as e:
-                print(f"Error adding channel: {e}")
-                return False
-        
-        print("Failed to add channel after maximum retries")
-        return False
-    
-    def get_all_channels(self):
-        with self._lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT * FROM channels')
-                return cursor.fetchall()
-    
+        try:
+            with self.transaction() as conn:
+                # The UNIQUE channel_id makes an existing channel a no-op
+                cursor = conn.execute('''INSERT OR IGNORE INTO channels
+                        (channel_name, channel_id, video_id, video_title,
+                         video_views, upload_date, has_new_video,
+                         upload_ts, view_count)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)''', self._values(channel_data))
+            if cursor.rowcount:
+                print(f"Successfully added channel: {channel_data['channel_name']}")
+                return True
+            print(f"Channel already exists: {channel_data['channel_name']}")
+            return False
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return False
+        except Exception as e:
+            print(f"Error adding channel: {e}")
+            return False
+
+    def get_all_channels(self, new_only=False):
+        """Tracked channels, most recent upload first and unknown dates last."""
+        where = 'WHERE has_new_video = 1 ' if new_only else ''
+        # NULLs sort lowest in SQLite, so DESC puts them last and still walks the index
+        return self.reader().execute(
+            f'SELECT {self.CHANNEL_COLUMNS} FROM channels {where}'
+            'ORDER BY upload_ts DESC'
+        ).fetchall()
+
+    @staticmethod
+    def _words(text):
+        return re.findall(r'\w+', text or '')
+
+    def search(self, text, limit=None):
+        """Tracked channels whose name, latest title or any recorded upload title match `text`.
+
+        Every word has to match the start of a word, best matches first,
+        with channel names weighted above titles. Without FTS5 it falls back
+        to substring matching, newest upload first. All matches are returned
+        unless a `limit` is given.
+        """
+        # SQLite reads a negative LIMIT as no limit
+        limit = -1 if limit is None else limit
+        words = self._words(text)
+        if not words:
+            return []
+        conn = self.reader()
+        if not self.full_text:
+            conditions = []
+            params = []
+            for word in words:
+                conditions.append(
+                    "(channel_name LIKE ? ESCAPE '!' OR video_title LIKE ? ESCAPE '!' OR channel_id IN "
+                    "(SELECT channel_id FROM videos WHERE title LIKE ? ESCAPE '!'))"
+                )
+                # A word can hold _, which LIKE would take as a wildcard
+                params += ['%' + word.replace('_', '!_') + '%'] * 3
+            return conn.execute(
+                f'SELECT {self.CHANNEL_COLUMNS} FROM channels WHERE {" AND ".join(conditions)} '
+                'ORDER BY upload_ts DESC LIMIT ?',
+                params + [limit]
+            ).fetchall()
+        # Quoted, so words like AND or NEAR are not read as operators
+        match = ' '.join(f'"{word}"*' for word in words)
+        return conn.execute(f'''
+            SELECT {self.CHANNEL_COLUMNS}, min(rank) AS rank FROM (
+                SELECT rowid AS id, bm25(channels_fts, 10.0, 2.0) AS rank
+                FROM channels_fts WHERE channels_fts MATCH :match
+                UNION ALL
+                SELECT channels.id, bm25(videos_fts)
+                FROM videos_fts
+                JOIN videos ON videos.rowid = videos_fts.rowid
+                JOIN channels ON channels.channel_id = videos.channel_id
+                WHERE videos_fts MATCH :match
+            ) AS hits JOIN channels USING (id)
+            GROUP BY id ORDER BY rank LIMIT :limit''', {'match': match, 'limit': limit}).fetchall()
+
     def update_channel(self, channel_data):
-        with self._lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                sql = '''UPDATE channels 
-                        SET video_id = ?, 
-                            video_title = ?, 
-                            video_views = ?, 
-                            upload_date = ?,
-                            has_new_video = ?
-                        WHERE channel_id = ?'''
-                
-                cursor.execute(sql, (
-                    channel_data['video_id'],
-                    channel_data['video_title'],
-                    channel_data['video_views'],
-                    channel_data['upload_date'],
-                    channel_data.get('has_new_video', 1),
-                    channel_data['channel_id']
-                ))
-                conn.commit()
-    
+        with self.transaction() as conn:
+            conn.execute('''UPDATE channels
+                    SET video_id = ?,
+                        video_title = ?,
+                        video_views = ?,
+                        upload_date = ?,
+                        has_new_video = ?,
+                        upload_ts = ?,
+                        view_count = ?
+                    WHERE channel_id = ?''', (
+                channel_data['video_id'],
+                channel_data['video_title'],
+                channel_data['video_views'],
+                channel_data['upload_date'],
+                channel_data.get('has_new_video', 1),
+                parse_timestamp(channel_data['upload_date']),
+                parse_views(channel_data['video_views']),
+                channel_data['channel_id']
+            ))
+
+    def seen_videos(self, channel_ids):
+        """{channel_id: set of video ids already recorded} for the given channels."""
+        seen = {channel_id: set() for channel_id in channel_ids}
+        ids = list(seen)
+        conn = self.reader()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            cursor = conn.execute(
+                f'SELECT channel_id, video_id FROM videos WHERE channel_id IN ({",".join("?" * len(chunk))})',
+                chunk
+            )
+            for row in cursor:
+                seen[row['channel_id']].add(row['video_id'])
+        return seen
+
+    @staticmethod
+    def _record_videos(conn, videos):
+        # Stub entries from the uploads tab carry only an id, keep what is known
+        conn.executemany('''INSERT INTO videos
+                (channel_id, video_id, title, published, published_ts, view_count)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(channel_id, video_id) DO UPDATE SET
+                    title = COALESCE(excluded.title, title),
+                    published = COALESCE(excluded.published, published),
+                    published_ts = COALESCE(excluded.published_ts, published_ts),
+                    view_count = COALESCE(excluded.view_count, view_count)''', [(
+            channel_id,
+            entry['video_id'],
+            entry.get('title'),
+            entry.get('published'),
+            parse_timestamp(entry.get('published')),
+            entry.get('views')
+        ) for channel_id, entry in videos])
+
+    def record_videos(self, videos):
+        """Remember (channel_id, feed entry) pairs as seen uploads."""
+        with self.transaction() as conn:
+            self._record_videos(conn, videos)
+
+    def apply_updates(self, rows, videos=()):
+        """Update many tracked channels in one transaction and return the rows that changed.
+
+        A row counts as changed when its video_id, video_title, video_views
+        or upload_date differ from what is stored; unchanged rows are not
+        written at all. `videos`, (channel_id, feed entry) pairs, are recorded
+        as seen uploads in the same transaction. Rows and videos of channels
+        that are not tracked, e.g. removed while a check was running, are
+        dropped rather than added back.
+        """
+        rows = list({row['channel_id']: row for row in rows}.values())
+        videos = list(videos)
+        if not rows and not videos:
+            return []
+        fields = ('video_id', 'video_title', 'video_views', 'upload_date')
+        with self.transaction() as conn:
+            stored = {}
+            ids = list({row['channel_id'] for row in rows} | {channel_id for channel_id, _ in videos})
+            # Stay well below SQLite's limit on bound parameters
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                cursor = conn.execute(
+                    'SELECT channel_id, video_id, video_title, video_views, upload_date '
+                    f'FROM channels WHERE channel_id IN ({",".join("?" * len(chunk))})',
+                    chunk
+                )
+                stored.update((found['channel_id'], tuple(found)[1:]) for found in cursor)
+            self._record_videos(conn, [(channel_id, entry) for channel_id, entry in videos if channel_id in stored])
+            changed = [
+                row for row in rows
+                if row['channel_id'] in stored
+                and stored[row['channel_id']] != tuple(row[field] for field in fields)
+            ]
+            conn.executemany('''UPDATE channels
+                    SET video_id = ?,
+                        video_title = ?,
+                        video_views = ?,
+                        upload_date = ?,
+                        has_new_video = ?,
+                        upload_ts = ?,
+                        view_count = ?
+                    WHERE channel_id = ?''', [(
+                row['video_id'],
+                row['video_title'],
+                row['video_views'],
+                row['upload_date'],
+                row.get('has_new_video', 1),
+                parse_timestamp(row['upload_date']),
+                parse_views(row['video_views']),
+                row['channel_id']
+            ) for row in changed])
+        return changed
+
     def remove_channel(self, channel_id):
-        with self._lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM channels WHERE channel_id = ?', (channel_id,))
-                conn.commit()
-    
+        with self.transaction() as conn:
+            conn.execute('DELETE FROM channels WHERE channel_id = ?', (channel_id,))
+            conn.execute('DELETE FROM videos WHERE channel_id = ?', (channel_id,))
+
     def mark_video_as_watched(self, channel_id):
         try:
-            self.cursor.execute("""
-                UPDATE channels 
-                SET has_new_video = 0 
-                WHERE channel_id = ?
-            """, (channel_id,))
-            self.conn.commit()
+            with self.transaction() as conn:
+                conn.execute("""
+                    UPDATE channels
+                    SET has_new_video = 0
+                    WHERE channel_id = ?
+                """, (channel_id,))
         except Exception as e:
             print(f"Error marking video as watched: {str(e)}")
-  
\ No newline at end of file
+
+
+class AsyncDatabase:
+    """Database for the qasync event loop: every method returns an awaitable.
+
+    Writes are queued to one writer thread that commits whatever has piled
+    up in a single transaction, each write in its own savepoint; reads run
+    on a reader thread with its own connection, which WAL lets proceed
+    while the writer works. The GUI thread never touches SQLite, and a
+    write's awaitable resolves only once it is committed.
+    """
+
+    def __init__(self, db_path=None, max_batch=256):
+        self.db = Database(db_path)
+        self.max_batch = max_batch
+        self._commands = queue.Queue()
+        self._reads = ThreadPoolExecutor(max_workers=1, thread_name_prefix='database-reader')
+        self._writer = threading.Thread(target=self._write_loop, name='database-writer', daemon=True)
+        self._writer.start()
+        self.batches = 0
+        self.writes = 0
+
+    @property
+    def db_path(self):
+        return self.db.db_path
+
+    def _submit(self, method, *args):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._commands.put((method, args, loop, future))
+        return future
+
+    def _read(self, method, *args):
+        return asyncio.get_running_loop().run_in_executor(self._reads, method, *args)
+
+    def _write_loop(self):
+        stopping = False
+        while not stopping:
+            command = self._commands.get()
+            if command is None:
+                break
+            # Take everything queued meanwhile into the same commit
+            commands = [command]
+            while len(commands) < self.max_batch:
+                try:
+                    command = self._commands.get_nowait()
+                except queue.Empty:
+                    break
+                if command is None:
+                    stopping = True
+                    break
+                commands.append(command)
+            outcomes = []
+            try:
+                with self.db.batch():
+                    for method, args, loop, future in commands:
+                        try:
+                            outcomes.append((loop, future, method(*args), None))
+                        except Exception as e:
+                            outcomes.append((loop, future, None, e))
+            except sqlite3.Error as e:
+                print(f"Database error: {e}")
+                outcomes = [(loop, future, None, e) for _, _, loop, future in commands]
+            self.batches += 1
+            self.writes += len(commands)
+            for loop, future, result, error in outcomes:
+                try:
+                    loop.call_soon_threadsafe(self._settle, future, result, error)
+                except RuntimeError:
+                    # The event loop is already closed, nobody is waiting
+                    pass
+
+    @staticmethod
+    def _settle(future, result, error):
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def close(self):
+        """Commit the queued writes, then close every connection."""
+        self._commands.put(None)
+        self._writer.join()
+        self._reads.shutdown(wait=True)
+        self.db.close()
+
+    # Reads
+
+    def get_all_channels(self, new_only=False):
+        return self._read(self.db.get_all_channels, new_only)
+
+    def seen_videos(self, channel_ids):
+        return self._read(self.db.seen_videos, list(channel_ids))
+
+    def search(self, text, limit=None):
+        return self._read(self.db.search, text, limit)
+
+    # Writes
+
+    def add_channel(self, channel_data):
+        return self._submit(self.db.add_channel, channel_data)
+
+    def update_channel(self, channel_data):
+        return self._submit(self.db.update_channel, channel_data)
+
+    def apply_updates(self, rows, videos=()):
+        return self._submit(self.db.apply_updates, list(rows), list(videos))
+
+    def record_videos(self, videos):
+        return self._submit(self.db.record_videos, list(videos))
+
+    def remove_channel(self, channel_id):
+        return self._submit(self.db.remove_channel, channel_id)
+
+    def mark_video_as_watched(self, channel_id):
+        return self._submit(self.db.mark_video_as_watched, channel_id)
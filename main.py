@@ -1,18 +1,28 @@
 import sys
+import os
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QLineEdit, QPushButton, QGridLayout, 
+                            QHBoxLayout, QLineEdit, QPushButton, 
                             QLabel, QScrollArea, QFrame, QDialog, QTextEdit)
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QUrl
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkProxy, QSslConfiguration, QSsl
-from PyQt6.QtGui import QPixmap, QDesktopServices
+from PyQt6.QtGui import QDesktopServices
 import asyncio
 # import aiotube  # Remove or comment out this line
 from aiotube import Channel, Search, Video  # Add this line instead
-from database import Database
+from aiotube.cache import enable_cache
+from aiotube.transport import configure as configure_transport
+from database import AsyncDatabase, parse_timestamp
+from updater import UpdateEngine
+from scheduler import ChannelScheduler
+from thumbnails import ThumbnailLoader
+from dashboard import ChannelListModel, DashboardView, VideoCardDelegate
 import qasync
-import webbrowser
-import requests
-from datetime import datetime
+
+# Number of channels checked concurrently by "Update All Channels"
+UPDATE_CONCURRENCY = 16
+SCHEDULER_TICK = 30  # seconds between looks at the check schedule
+THUMBNAIL_DOWNLOADS = 6  # thumbnails downloaded at the same time
+SEARCH_DELAY = 150  # ms of typing pause before the tracked channels are filtered
 
 class UpdateDialog(QDialog):
     def __init__(self, parent=None):
@@ -58,7 +68,7 @@ class LoadingDialog(QDialog):
         layout = QVBoxLayout()
         
         # Loading message
-        self.message = QLabel("Loading YouTube Channel Dashboard... Please wait up to 10 seconds!")
+        self.message = QLabel("Loading YouTube Channel Dashboard...")
         self.message.setWordWrap(True)  # Enable text wrapping
         self.message.setStyleSheet("""
             color: white;
@@ -107,24 +117,13 @@ class ChannelInfoWindow(QWidget):
             avatar_label = QLabel()
             avatar_label.setFixedSize(50, 50)
             if 'avatar' in channel_data and channel_data['avatar']:
-                try:
-                    # Add https: scheme if URL starts with //
-                    avatar_url = channel_data['avatar']
-                    if avatar_url.startswith('//'):
-                        avatar_url = 'https:' + avatar_url
-                    
-                    # Download and set avatar image
-                    response = requests.get(avatar_url)
-                    pixmap = QPixmap()
-                    if pixmap.loadFromData(response.content):
-                        scaled_pixmap = pixmap.scaled(
-                            50, 50,
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation
-                        )
-                        avatar_label.setPixmap(scaled_pixmap)
-                except Exception as e:
-                    print(f"Error loading avatar: {e}")
+                # Add https: scheme if URL starts with //
+                avatar_url = channel_data['avatar']
+                if avatar_url.startswith('//'):
+                    avatar_url = 'https:' + avatar_url
+                
+                # Served from the image cache when this channel was seen before
+                self.parent.thumbnail_loader.load(avatar_url, avatar_label.setPixmap, avatar_label.size())
             
             # Create vertical layout for name and subscribers
             info_layout = QVBoxLayout()
@@ -212,7 +211,7 @@ class ChannelInfoWindow(QWidget):
             dialog.append_text("Fetching channel metadata...")
             await asyncio.sleep(0.1)  # Add small delay for UI update
             
-            channel = Channel(channel_data['channel_id'])
+            channel = await Channel.fetch(channel_data['channel_id'])
             metadata = channel.metadata
             dialog.append_text(" Done ✓\n")
             await asyncio.sleep(0.1)  # Add small delay for UI update
@@ -221,7 +220,7 @@ class ChannelInfoWindow(QWidget):
             dialog.append_text("Fetching latest video ID...")
             await asyncio.sleep(0.1)  # Add small delay for UI update
             
-            latest_video_id = channel.last_uploaded
+            latest_video_id = await channel.alast_uploaded()
             if not latest_video_id:
                 dialog.append_text(" Failed! Could not fetch latest video ID\n")
                 await asyncio.sleep(0.1)  # Add small delay for UI update
@@ -234,7 +233,7 @@ class ChannelInfoWindow(QWidget):
                 dialog.append_text("Fetching video details...")
                 await asyncio.sleep(0.1)  # Add small delay for UI update
                 
-                video = Video(latest_video_id)
+                video = await Video.fetch(latest_video_id)
                 video_metadata = video.metadata
                 dialog.append_text(" Done ✓\n")
                 await asyncio.sleep(0.1)  # Add small delay for UI update
@@ -253,7 +252,7 @@ class ChannelInfoWindow(QWidget):
                 dialog.append_text("\nSaving channel data to database...")
                 await asyncio.sleep(0.1)  # Add small delay for UI update
                 
-                self.parent.db.add_channel(channel_data)
+                await self.parent.db.add_channel(channel_data)
                 dialog.append_text(" Done ✓\n")
                 await asyncio.sleep(0.1)  # Add small delay for UI update
                 
@@ -275,219 +274,6 @@ class ChannelInfoWindow(QWidget):
             await asyncio.sleep(0.1)  # Add small delay for UI update
             print(f"Error in add_channel: {str(e)}")
 
-class VideoCard(QWidget):
-    clicked = pyqtSignal()
-    removed = pyqtSignal(str)  # New signal for removal
-    
-    def __init__(self, video_data, parent=None):
-        super().__init__()
-        self.video_data = video_data
-        self.parent = parent
-        
-        # Create a frame to handle the background and border
-        self.frame = QFrame(self)
-        self.frame.setObjectName("card")
-        self.frame.setMinimumSize(340, 360)
-        self.frame.setMaximumSize(340, 360)
-        
-        # Main layout for the frame
-        main_layout = QVBoxLayout(self)
-        main_layout.addWidget(self.frame)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Layout for the frame's contents
-        layout = QVBoxLayout(self.frame)
-        layout.setSpacing(16)  # Increase overall spacing between elements
-        layout.setContentsMargins(10, 10, 10, 10)
-        
-        # Set the background color based on has_new_video
-        try:
-            has_new_video = int(video_data.get('has_new_video', '0'))
-            if has_new_video:
-                print(f"Card {video_data['channel_name']} has new video, applying highlight")
-                self.frame.setStyleSheet("""
-                    QFrame#card {
-                        background-color: #1a472a;
-                        border: 2px solid #2e8b57;
-                        border-radius: 8px;
-                    }
-                """)
-            else:
-                self.frame.setStyleSheet("""
-                    QFrame#card {
-                        background-color: #3b3b3b;
-                        border-radius: 8px;
-                    }
-                """)
-        except Exception as e:
-            print(f"Error applying highlight: {e}")
-
-        # Create thumbnail label without padding
-        self.thumbnail = QLabel()
-        self.thumbnail.setFixedSize(320, 180)  # 16:9 aspect ratio
-        self.thumbnail.setStyleSheet("background-color: #1f1f1f; border-radius: 4px;")
-        layout.addWidget(self.thumbnail)
-
-        # Create and add labels for video information
-        channel_name = QLabel(video_data['channel_name'])
-        channel_name.setStyleSheet("color: white; font-weight: bold; font-size: 14px;")
-        channel_name.setWordWrap(True)
-        layout.addWidget(channel_name)
-        
-        # Load thumbnail
-        self.load_thumbnail(video_data['video_id'])
-        
-        video_title = QLabel(video_data['video_title'])
-        video_title.setStyleSheet("color: white; font-size: 12px;")
-        video_title.setWordWrap(True)
-        layout.addWidget(video_title)
-        
-        video_views = QLabel(f"Views: {video_data['video_views']}")
-        video_views.setStyleSheet("color: white; font-size: 11px;")
-        video_views.setWordWrap(True)
-        layout.addWidget(video_views)
-        
-        # Calculate days since upload
-        try:
-            upload_date_str = video_data['upload_date']
-            print(upload_date_str)
-
-            # Convert the string to a datetime object, considering the timezone offset
-            given_time = datetime.strptime(upload_date_str[:-6], "%Y-%m-%dT%H:%M:%S")
-            # Calculate the current time
-            current_time = datetime.now()
-
-            # Calculate the difference in days
-            time_difference = current_time - given_time
-            days_difference = time_difference.days
-
-            upload_text = f"Uploaded {days_difference} days ago"
-        except Exception as e:
-            print(f"Error calculating days: {e}")
-            upload_text = "Upload date unknown"
-        
-        upload_date = QLabel(upload_text)
-        upload_date.setStyleSheet("color: white; font-size: 11px;")
-        layout.addWidget(upload_date)
-        
-        # Set layout properties
-        layout.setSpacing(8)  # Space between widgets
-        layout.setContentsMargins(10, 10, 10, 10)  # Left, Top, Right, Bottom margins
-        
-        # Add remove button
-        remove_button = QPushButton("Remove Channel")
-        remove_button.setStyleSheet("""
-            QPushButton {
-                background-color: #d32f2f;
-                color: white;
-                padding: 5px;
-                border-radius: 4px;
-                margin-top: 5px;
-            }
-            QPushButton:hover {
-                background-color: #b71c1c;
-            }
-        """)
-        remove_button.clicked.connect(lambda: asyncio.create_task(self.remove_channel()))
-        layout.addWidget(remove_button)
-        
-        # Set the layout
-        self.setLayout(layout)
-        
-        # Make the widget accept mouse events
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setMouseTracking(True)
-        
-        # Store the video URL
-        self.video_url = f"https://www.youtube.com/watch?v={video_data['video_id']}"
-
-    def load_thumbnail(self, video_id):
-        try:
-            # Use requests to download the thumbnail
-            url = f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg"
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8"
-            }
-            response = requests.get(url, headers=headers, verify=True)
-            response.raise_for_status()  # Raise an exception for bad status codes
-            
-            # Create QPixmap from the downloaded data
-            pixmap = QPixmap()
-            if pixmap.loadFromData(response.content):
-                scaled_pixmap = pixmap.scaled(
-                    self.thumbnail.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.thumbnail.setPixmap(scaled_pixmap)
-                print(f"Successfully loaded thumbnail for video {video_id}")
-            else:
-                print(f"Failed to create pixmap from thumbnail data for video {video_id}")
-                
-        except Exception as e:
-            print(f"Error loading thumbnail for video {video_id}: {str(e)}")
-        
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            # Open URL in default browser
-            QDesktopServices.openUrl(QUrl(self.video_url))
-            # Update has_new_video status in database
-            try:
-                self.parent.db.mark_video_as_watched(self.video_data['channel_id'])
-                # Update the UI for this specific card
-                self.frame.setStyleSheet("""
-                    QFrame#card {
-                        background-color: #3b3b3b;
-                        border-radius: 8px;
-                    }
-                """)
-            except Exception as e:
-                print(f"Error marking video as watched: {str(e)}")
-            event.accept()
-        else:
-            super().mousePressEvent(event)
-
-    def open_video(self):
-        video_url = f"https://www.youtube.com/watch?v={self.video_data['video_id']}"
-        webbrowser.open(video_url)
-
-    async def remove_channel(self):
-        # Create and show update dialog
-        dialog = UpdateDialog(self)
-        dialog.setWindowTitle("Removing Channel")
-        dialog.show()
-        
-        # Force the dialog to be displayed immediately
-        await asyncio.sleep(0.1)
-        
-        try:
-            dialog.append_text(f"Removing channel: {self.video_data['channel_name']}\n")
-            await asyncio.sleep(0.1)
-            
-            dialog.append_text("Removing from database...")
-            await asyncio.sleep(0.1)
-            
-            # Remove from database
-            self.parent.db.remove_channel(self.video_data['channel_id'])
-            dialog.append_text(" Done ✓\n")
-            await asyncio.sleep(0.1)
-            
-            dialog.append_text("\nUpdating dashboard...")
-            await asyncio.sleep(0.1)
-            
-            # Reload the channels display
-            await self.parent.load_channels()
-            dialog.append_text(" Done ✓\n")
-            await asyncio.sleep(0.1)
-            
-            dialog.append_text("\n=== Channel Removed Successfully ===")
-            
-        except Exception as e:
-            dialog.append_text(f"\nError removing channel: {str(e)}")
-            await asyncio.sleep(0.1)
-            print(f"Error removing channel: {str(e)}")
-
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -502,10 +288,18 @@ class MainWindow(QMainWindow):
         # Create search section
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search YouTube Channel")
+        self.search_input.setPlaceholderText("Filter your channels, or search YouTube")
         self.search_button = QPushButton("Search")
         self.search_button.clicked.connect(lambda: asyncio.create_task(self.search_channel()))
         
+        # Typing filters the dashboard from the local full-text index; only the
+        # Search button goes to YouTube
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY)
+        self.search_timer.timeout.connect(lambda: asyncio.ensure_future(self.load_channels()))
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
+        
         search_layout.addWidget(self.search_input)
         search_layout.addWidget(self.search_button)
         main_layout.addLayout(search_layout)
@@ -515,16 +309,45 @@ class MainWindow(QMainWindow):
         self.update_button.clicked.connect(lambda: asyncio.create_task(self.update_all_channels()))
         main_layout.addWidget(self.update_button)
 
-        # Create scrollable grid for channel videos
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_content = QWidget()
-        self.grid_layout = QGridLayout(scroll_content)
-        scroll.setWidget(scroll_content)
-        main_layout.addWidget(scroll)
+        # Grid of channel cards; only the visible ones are painted
+        self.channel_view = DashboardView()
+        main_layout.addWidget(self.channel_view, alignment=Qt.AlignmentFlag.AlignHCenter)
 
-        # Initialize database
-        self.db = Database()
+        # Initialize database; queries run on its own threads, never on the GUI thread
+        self.db = AsyncDatabase()
+        
+        # Keep fetched YouTube pages next to the database so repeated checks
+        # (and re-adding a channel) are served without a download
+        enable_cache(os.path.join(os.path.dirname(self.db.db_path), 'http_cache.db'))
+        
+        # Checks channels for new uploads with bounded concurrency
+        # Let the bulk update keep as many connections to YouTube open as it runs checks
+        configure_transport(max_connections_per_host=UPDATE_CONCURRENCY)
+        self.update_engine = UpdateEngine(max_concurrency=UPDATE_CONCURRENCY)
+        # False, or which sweep is running: 'scheduled' or 'manual'
+        self._update_running = False
+        # Update All clicked during a scheduled check, run once it finishes
+        self._manual_update_queued = False
+        
+        # Decides which channels are due for a background check, from their upload cadence
+        self.scheduler = ChannelScheduler()
+        
+        # Fetches card thumbnails and avatars in the background so the grid paints
+        # immediately; images already seen are served from memory or disk
+        self.thumbnail_loader = ThumbnailLoader(
+            max_in_flight=THUMBNAIL_DOWNLOADS,
+            cache_dir=os.path.join(os.path.dirname(self.db.db_path), 'images'),
+            parent=self
+        )
+        
+        self.channel_model = ChannelListModel(self.thumbnail_loader, self)
+        self.card_delegate = VideoCardDelegate(self.channel_view)
+        self.card_delegate.clicked.connect(self.open_video)
+        self.card_delegate.removeRequested.connect(
+            lambda video_data: asyncio.create_task(self.remove_channel(video_data))
+        )
+        self.channel_view.setModel(self.channel_model)
+        self.channel_view.setItemDelegate(self.card_delegate)
         
         # Don't load channels here anymore
         # asyncio.create_task(self.load_channels())
@@ -532,10 +355,10 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle the window close event"""
         try:
-            # Close the database connection
-            self.db.conn.close()
-        except:
-            pass
+            # Close the database connections
+            self.db.close()
+        except Exception as e:
+            print(f"Error closing database: {str(e)}")
         event.accept()
 
     async def search_channel(self):
@@ -545,15 +368,22 @@ class MainWindow(QMainWindow):
 
         try:
             print(f"Searching for channel: {query}")
-            channels = Search.channels(query, 3)  # Get top 3 channels
+            channels = await Search.achannels(query, 3)  # Get top 3 channels
             if not channels:
                 print("No channels found")
                 return
 
+            # Fetch every hit's about page concurrently
+            fetched = await asyncio.gather(
+                *(Channel.fetch(channel_id) for channel_id in channels),
+                return_exceptions=True
+            )
+
             search_results = []
-            for channel_id in channels:
+            for channel_id, channel in zip(channels, fetched):
                 try:
-                    channel = Channel(channel_id)
+                    if isinstance(channel, Exception):
+                        raise channel
                     metadata = channel.metadata
                     print(metadata)
                     
@@ -577,104 +407,200 @@ class MainWindow(QMainWindow):
             print(f"Search error: {str(e)}")
 
     async def load_channels(self):
-        # Clear existing grid
-        for i in reversed(range(self.grid_layout.count())): 
-            self.grid_layout.itemAt(i).widget().setParent(None)
-        
-        # Get channels from database
-        channels = self.db.get_all_channels()
-        
-        # Sort channels by upload date
-        def parse_upload_date(channel):
-            try:
-                upload_date_str = channel[6]  # Assuming upload_date is at index 6
-                # Parse the ISO format date string
-                upload_date = datetime.strptime(upload_date_str[:-6], "%Y-%m-%dT%H:%M:%S")
-                print(upload_date)
-                return upload_date
-            except Exception as e:
-                print(f"Error parsing date for channel {channel[1]}: {e}")
-                return datetime.min  # Return earliest possible date for invalid dates
-        
-        channels = sorted(channels, key=parse_upload_date, reverse=True)  # reverse=True for newest first
-        print(channels)
-        for c in channels:
-            print(c[6])
-        # Add channels to grid
-        row = 0
-        col = 0
-        max_cols = 3
+        # Get channels from database, only the matching ones while a filter is typed
+        query = self.search_input.text().strip()
+        if query:
+            channels = await self.db.search(query)
+        else:
+            channels = await self.db.get_all_channels()
+        
+        # Already ordered by the database: best match, or newest upload first
+        rows = [
+            {
+                'channel_name': channel['channel_name'],
+                'channel_id': channel['channel_id'],
+                'video_id': channel['video_id'],
+                'video_title': channel['video_title'],
+                'video_views': channel['video_views'],
+                'upload_date': channel['upload_date'],
+                'upload_ts': channel['upload_ts'],
+                'has_new_video': channel['has_new_video'] or 0
+            }
+            for channel in channels
+        ]
+        # Only the cards that changed are touched
+        self.channel_model.apply_rows(rows)
+
+    def open_video(self, video_data):
+        # Open URL in default browser
+        QDesktopServices.openUrl(QUrl(f"https://www.youtube.com/watch?v={video_data['video_id']}"))
+        # Update the card right away; the database write is queued behind it
+        self.channel_model.mark_watched(video_data['channel_id'])
+        asyncio.ensure_future(self.mark_watched(video_data['channel_id']))
+
+    async def mark_watched(self, channel_id):
+        try:
+            await self.db.mark_video_as_watched(channel_id)
+        except Exception as e:
+            print(f"Error marking video as watched: {str(e)}")
+
+    async def remove_channel(self, video_data):
+        # Create and show update dialog
+        dialog = UpdateDialog(self)
+        dialog.setWindowTitle("Removing Channel")
+        dialog.show()
         
-        # Set larger spacing between cards
-        self.grid_layout.setSpacing(30)
-        self.grid_layout.setContentsMargins(30, 30, 30, 30)
+        # Force the dialog to be displayed immediately
+        await asyncio.sleep(0.1)
         
-        for channel in channels:
-            video_data = {
-                'channel_name': channel[1],
-                'channel_id': channel[2],
-                'video_id': channel[3],
-                'video_title': channel[4],
-                'video_views': channel[5],
-                'upload_date': channel[6],
-                'has_new_video': int(channel[8]) if channel[8] is not None else 0  # Changed index from 7 to 8
-            }
+        try:
+            dialog.append_text(f"Removing channel: {video_data['channel_name']}\n")
+            await asyncio.sleep(0.1)
+            
+            dialog.append_text("Removing from database...")
+            await asyncio.sleep(0.1)
+            
+            # Remove from database
+            await self.db.remove_channel(video_data['channel_id'])
+            dialog.append_text(" Done ✓\n")
+            await asyncio.sleep(0.1)
+            
+            dialog.append_text("\nUpdating dashboard...")
+            await asyncio.sleep(0.1)
+            
+            # Reload the channels display
+            await self.load_channels()
+            dialog.append_text(" Done ✓\n")
+            await asyncio.sleep(0.1)
+            
+            dialog.append_text("\n=== Channel Removed Successfully ===")
             
-            video_card = VideoCard(video_data, self)
-            self.grid_layout.addWidget(video_card, row, col)
+        except Exception as e:
+            dialog.append_text(f"\nError removing channel: {str(e)}")
+            await asyncio.sleep(0.1)
+            print(f"Error removing channel: {str(e)}")
+
+    def record_check(self, result):
+        """Feed a check result back into the schedule so the channel's next check is set."""
+        upload_times = [parse_timestamp(published) for published in result['published']]
+        if result['channel_data']:
+            upload_times.append(parse_timestamp(result['channel_data']['upload_date']))
+        self.scheduler.reschedule(result['channel_id'], upload_times)
+
+    async def check_due_channels(self):
+        """Quietly check the channels whose scheduled time has come."""
+        if self._update_running:
+            return
+        self._update_running = 'scheduled'
+        pending = set()
+        try:
+            channels = await self.db.get_all_channels()
+            self.scheduler.sync([(channel['channel_id'], channel['upload_ts']) for channel in channels])
+            pending = set(self.scheduler.due())
+            if not pending:
+                return
+            checked = len(pending)
             
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+            new_rows = []
+            videos = []
+            found = []
+            seen = await self.db.seen_videos(pending)
+            try:
+                async for result in self.update_engine.run([c for c in channels if c['channel_id'] in pending], seen):
+                    pending.discard(result['channel_id'])
+                    if result['status'] == 'new':
+                        if result['channel_data']:
+                            new_rows.append(result['channel_data'])
+                        found.extend(
+                            f"{result['channel_name']}: {self.update_engine.video_label(video)}"
+                            for video in result['new_videos']
+                        )
+                    videos.extend((result['channel_id'], entry) for entry in result['videos'])
+                    self.record_check(result)
+            finally:
+                # One transaction for the whole run, even if it stopped early
+                changed = await self.db.apply_updates(new_rows, videos)
+            
+            if found:
+                print("New videos:\n" + "\n".join(found))
+                self.statusBar().showMessage(
+                    f"{len(found)} new videos: " + "; ".join(found) if len(found) > 1 else f"New video: {found[0]}"
+                )
+            else:
+                # The request volume the learned cadences add up to
+                self.statusBar().showMessage(
+                    f"Checked {checked} channels, no new videos "
+                    f"(about {self.scheduler.checks_per_hour():.0f} checks per hour scheduled)"
+                )
+            if changed:
+                await self.load_channels()
+        finally:
+            # Channels whose check never finished still need a next check
+            for channel_id in pending:
+                self.scheduler.reschedule(channel_id)
+            self._update_running = False
+            if self._manual_update_queued:
+                self._manual_update_queued = False
+                asyncio.ensure_future(self.update_all_channels())
 
     async def update_all_channels(self):
+        # A manual click and the periodic task must not run two sweeps at once
+        if self._update_running == 'scheduled':
+            self._manual_update_queued = True
+            self.statusBar().showMessage("Update All will start as soon as the scheduled check finishes")
+            return
+        if self._update_running:
+            self.statusBar().showMessage("An update is already running")
+            return
+        self._update_running = 'manual'
+        dialog = None
         try:
             # Create and show the update dialog
             dialog = UpdateDialog(self)
             dialog.show()
             
-            channels = self.db.get_all_channels()
+            channels = await self.db.get_all_channels()
+            self.scheduler.sync([(channel['channel_id'], channel['upload_ts']) for channel in channels])
             updated_channels = []
             no_updates = []
-            
-            dialog.append_text("Starting channel updates...\n")
-            
-            for channel in channels:
-                channel_id = channel[2]
-                channel_name = channel[1]
-                
-                dialog.append_text(f"Checking {channel_name}...")
-                
-                # Get channel and latest video data
-                channel_obj = Channel(channel_id)
-                latest_video_id = channel_obj.last_uploaded
-                
-                if latest_video_id and latest_video_id != channel[3]:
-                    # Get new video details
-                    video = Video(latest_video_id)
-                    video_metadata = video.metadata
-                    
-                    # Update channel data
-                    channel_data = {
-                        'channel_name': channel_name,
-                        'channel_id': channel_id,
-                        'video_id': latest_video_id,
-                        'video_title': video_metadata.get('title', 'Video information unavailable'),
-                        'video_views': str(video_metadata.get('views', 'N/A')),
-                        'upload_date': str(video_metadata.get('upload_date', 'N/A'))
-                    }
+            failed = []
+            
+            dialog.append_text(
+                f"Starting channel updates ({len(channels)} channels, "
+                f"{self.update_engine.max_concurrency} at a time)...\n"
+            )
+            
+            # Results arrive in completion order while the other checks keep fetching
+            checked = 0
+            new_rows = []
+            videos = []
+            seen = await self.db.seen_videos([channel['channel_id'] for channel in channels])
+            try:
+                # A manual update must not be answered from pages cached minutes ago
+                async for result in self.update_engine.run(channels, seen, revalidate=True):
+                    checked += 1
+                    channel_name = result['channel_name']
+                    prefix = f"[{checked}/{len(channels)}] {channel_name}"
+                    self.record_check(result)
+                    videos.extend((result['channel_id'], entry) for entry in result['videos'])
                     
-                    # Update in database
-                    self.db.update_channel(channel_data)
-                    updated_channels.append(channel_name)
-                    dialog.append_text(" New video found! ✓\n")
-                else:
-                    no_updates.append(channel_name)
-                    dialog.append_text(" No new videos\n")
-                
-                # Allow UI to update
-                await asyncio.sleep(0.1)
+                    if result['status'] == 'new':
+                        if result['channel_data']:
+                            new_rows.append(result['channel_data'])
+                        updated_channels.append(channel_name)
+                        count = len(result['new_videos'])
+                        dialog.append_text(f"{prefix}: {count} new videos found! ✓" if count > 1 else f"{prefix}: New video found! ✓")
+                        for video in result['new_videos']:
+                            dialog.append_text(f"    • {self.update_engine.video_label(video)}")
+                    elif result['status'] == 'error':
+                        failed.append(channel_name)
+                        dialog.append_text(f"{prefix}: Error - {result['error']}")
+                    else:
+                        no_updates.append(channel_name)
+                        dialog.append_text(f"{prefix}: No new videos")
+            finally:
+                # Write every new video in one transaction, even if the run stopped early
+                await self.db.apply_updates(new_rows, videos)
             
             # Print final summary
             dialog.append_text("\n=== Update Complete ===\n")
@@ -688,6 +614,11 @@ class MainWindow(QMainWindow):
                 dialog.append_text("\nChannels with no new videos:")
                 for name in no_updates:
                     dialog.append_text(f"- {name}")
+            
+            if failed:
+                dialog.append_text("\nChannels that could not be checked:")
+                for name in failed:
+                    dialog.append_text(f"✗ {name}")
                     
             if not channels:
                 dialog.append_text("\nNo channels in database to update!")
@@ -699,6 +630,8 @@ class MainWindow(QMainWindow):
             if dialog:
                 dialog.append_text(f"\nError updating channels: {str(e)}")
             print(f"Error updating channels: {str(e)}")
+        finally:
+            self._update_running = False
 
 async def main():
     app = QApplication(sys.argv)
@@ -728,17 +661,17 @@ async def main():
     # Connect the quit signal
     app.lastWindowClosed.connect(quit_app)
     
-    # Create periodic update task
-    async def periodic_update():
+    # Check channels as they come due instead of sweeping all of them every hour
+    async def scheduled_checks():
         while True:
             try:
-                await asyncio.sleep(3600)  # Check for updates every hour
-                await window.update_all_channels()
+                await asyncio.sleep(SCHEDULER_TICK)
+                await window.check_due_channels()
             except Exception as e:
-                pass
+                print(f"Scheduled check error: {str(e)}")
 
-    # Start periodic update
-    update_task = asyncio.create_task(periodic_update())
+    # Start scheduled checks
+    update_task = asyncio.create_task(scheduled_checks())
     
     try:
         await loop.run_forever()
@@ -0,0 +1,110 @@
+import heapq
+import random
+import time
+from statistics import median
+
+
+class ChannelScheduler:
+    """Decides when each tracked channel is checked next.
+
+    Every channel gets its own polling interval learned from its recent
+    upload times: a fraction of its typical gap between uploads, stretched
+    further for channels that have gone quiet, and clamped between
+    `min_interval` and `max_interval`. Next-check times are kept in a heap
+    and jittered so checks trickle out over time; `due()` additionally caps
+    how many are handed out per tick.
+    """
+
+    # Poll a channel this many times per typical gap between its uploads
+    CHECKS_PER_GAP = 48
+
+    def __init__(self, min_interval=5 * 60, max_interval=24 * 3600, default_interval=3600,
+                 max_per_tick=20, jitter=0.2):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.max_per_tick = max_per_tick
+        self.jitter = jitter
+        self._heap = []
+        self._due = {}
+        self._interval = {}
+
+    def __len__(self):
+        return len(self._due)
+
+    def interval(self, channel_id):
+        return self._interval.get(channel_id, self.default_interval)
+
+    def learn(self, channel_id, upload_times, now=None):
+        """Derive a channel's polling interval from its upload timestamps (epoch seconds)."""
+        now = now or time.time()
+        times = sorted((t for t in upload_times if t), reverse=True)
+        if not times:
+            return self.interval(channel_id)
+        gaps = [newer - older for newer, older in zip(times, times[1:]) if newer > older]
+        since_last = max(0.0, now - times[0])
+        # One known upload only tells us how long the channel has been quiet
+        gap = median(gaps) if gaps else max(since_last, self.default_interval * self.CHECKS_PER_GAP)
+        # A channel silent for much longer than usual has probably slowed down
+        if since_last > 3 * gap:
+            gap = since_last / 3
+        interval = min(self.max_interval, max(self.min_interval, gap / self.CHECKS_PER_GAP))
+        self._interval[channel_id] = interval
+        return interval
+
+    def _push(self, channel_id, due):
+        self._due[channel_id] = due
+        heapq.heappush(self._heap, (due, channel_id))
+
+    def sync(self, channels, now=None):
+        """Track exactly the given (channel_id, upload_ts) pairs, seeding new ones."""
+        now = now or time.time()
+        wanted = dict(channels)
+        for channel_id in list(self._due):
+            if channel_id not in wanted:
+                # Its heap entry is dropped lazily in due()
+                del self._due[channel_id]
+                self._interval.pop(channel_id, None)
+        for channel_id, upload_ts in wanted.items():
+            if channel_id in self._due:
+                continue
+            interval = self.learn(channel_id, [upload_ts], now)
+            # Spread first checks uniformly over one interval instead of all at once
+            self._push(channel_id, now + random.uniform(0, interval))
+
+    def reschedule(self, channel_id, upload_times=None, now=None):
+        """Schedule a channel's next check after it was just checked."""
+        now = now or time.time()
+        if channel_id not in self._due:
+            return
+        if upload_times:
+            self.learn(channel_id, upload_times, now)
+        interval = self.interval(channel_id)
+        self._push(channel_id, now + interval * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def due(self, now=None, limit=None):
+        """Pop the channels whose check time has come, at most `limit` (max_per_tick)."""
+        now = now or time.time()
+        limit = limit or self.max_per_tick
+        ready = []
+        while self._heap and len(ready) < limit:
+            due, channel_id = self._heap[0]
+            if self._due.get(channel_id) != due:
+                # Stale entry of a removed or rescheduled channel
+                heapq.heappop(self._heap)
+                continue
+            if due > now:
+                break
+            heapq.heappop(self._heap)
+            ready.append(channel_id)
+        return ready
+
+    def next_due(self):
+        """Epoch seconds of the earliest scheduled check, or None."""
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def checks_per_hour(self):
+        """Expected request volume with the current intervals."""
+        return sum(3600 / self.interval(channel_id) for channel_id in self._due)
@@ -0,0 +1,96 @@
+import asyncio
+import contextlib
+import os
+import sys
+
+import pytest
+
+# The application modules live at the repository root, next to aiotube/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class LocalServer:
+    """A keep-alive HTTP/1.1 server on 127.0.0.1 that answers with a scripted handler.
+
+    `handler(request, writer)` is awaited for every request head read, with
+    request = {'target', 'headers', 'connection', 'number'}; it writes the raw
+    response and returns False to close the connection afterwards.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.connections = 0
+        self.requests = []
+        self._server = None
+        self._writers = set()
+        self.url = None
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        connection = self.connections
+        self._writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                headers = {}
+                while (header := await reader.readline()) not in (b'\r\n', b''):
+                    name, _, value = header.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                request = {
+                    'target': line.split()[1].decode(),
+                    'headers': headers,
+                    'connection': connection,
+                    'number': len(self.requests) + 1,
+                }
+                self.requests.append(request)
+                if await self.handler(request, writer) is False:
+                    return
+                await writer.drain()
+        except ConnectionError:
+            # The client hung up early, e.g. a scan that found its pattern
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._serve, '127.0.0.1', 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        self.url = f'http://{host}:{port}'
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        # Idle keep-alive connections would otherwise hold wait_closed() open
+        for writer in list(self._writers):
+            writer.close()
+        with contextlib.suppress(Exception):
+            await self._server.wait_closed()
+
+
+def response(status=200, body=b'', headers=None):
+    """A raw HTTP/1.1 response with a Content-Length."""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    head = {'Content-Length': str(len(body))}
+    head.update(headers or {})
+    reason = {200: 'OK', 302: 'Found', 304: 'Not Modified'}.get(status, 'Status')
+    lines = ''.join(f'{name}: {value}\r\n' for name, value in head.items())
+    return f'HTTP/1.1 {status} {reason}\r\n{lines}\r\n'.encode('latin-1') + body
+
+
+def chunked(*pieces, headers=None):
+    """A raw HTTP/1.1 200 response sending each of `pieces` as its own chunk."""
+    head = {'Transfer-Encoding': 'chunked'}
+    head.update(headers or {})
+    lines = ''.join(f'{name}: {value}\r\n' for name, value in head.items())
+    body = b''.join(b'%x\r\n%s\r\n' % (len(piece), piece) for piece in pieces)
+    return f'HTTP/1.1 200 OK\r\n{lines}\r\n'.encode('latin-1') + body + b'0\r\n\r\n'
+
+
+@pytest.fixture
+def http_server():
+    """The LocalServer class, entered with `async with http_server(handler) as server`."""
+    return LocalServer
@@ -0,0 +1,90 @@
+import asyncio
+import random
+import time
+import zlib
+
+import pytest
+
+from aiotube.cache import ResponseCache, disable_cache, enable_cache
+from aiotube.utils import arequest
+from conftest import response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    yield enable_cache(str(tmp_path / 'http_cache.db'), ttls={'page': 60})
+    disable_cache()
+
+
+def versioned(body='hello', etag='"v1"'):
+    """Serves `body` with an ETag and answers a matching If-None-Match with 304."""
+    async def handler(request, writer):
+        if request['headers'].get('if-none-match') == etag:
+            writer.write(response(304, headers={'ETag': etag}))
+        else:
+            writer.write(response(body=body, headers={'ETag': etag}))
+    return handler
+
+
+def fetch_twice(http_server, handler, between=lambda url: None):
+    async def main():
+        async with http_server(handler) as server:
+            url = server.url + '/page'
+            first = await arequest(url, 'page')
+            between(url)
+            return server, first, await arequest(url, 'page')
+    return asyncio.run(main())
+
+
+def test_fresh_page_is_served_without_a_request(cache, http_server):
+    server, first, second = fetch_twice(http_server, versioned())
+    assert first == second == 'hello'
+    assert len(server.requests) == 1
+    assert cache.stats()['hits'] == 1
+
+
+def test_stale_page_is_revalidated_and_keeps_its_body(cache, http_server):
+    cache.ttls['page'] = 0.5
+    server, first, second = fetch_twice(http_server, versioned(), between=lambda url: time.sleep(0.6))
+    assert first == second == 'hello'
+    assert [request['headers'].get('if-none-match') for request in server.requests] == [None, '"v1"']
+    assert cache.stats()['revalidated'] == 1
+    # The 304 made the stored copy fresh again, body untouched
+    stored = cache.get(server.url + '/page', 'page')
+    assert stored.fresh and stored.text == 'hello'
+
+
+def test_expire_forces_revalidation_of_a_fresh_page(cache, http_server):
+    server, first, second = fetch_twice(http_server, versioned(), between=lambda url: cache.expire('page'))
+    assert second == 'hello'
+    assert len(server.requests) == 2
+    assert server.requests[1]['headers'].get('if-none-match') == '"v1"'
+    assert cache.stats()['revalidated'] == 1
+
+
+def test_expire_leaves_other_endpoints_fresh(cache):
+    cache.put('https://example.com/feed', 'page', 'feed')
+    cache.put('https://example.com/about', 'channel_about', 'about')
+    cache.expire('page')
+    assert not cache.get('https://example.com/feed', 'page').fresh
+    assert cache.get('https://example.com/about', 'channel_about').fresh
+
+
+def test_least_recently_used_pages_are_evicted_past_the_budget(tmp_path):
+    rng = random.Random(1)
+    # Random hex only compresses to about half, so every page costs the same
+    pages = [''.join(rng.choice('0123456789abcdef') for _ in range(10000)) for _ in range(5)]
+    size = len(zlib.compress(pages[0].encode()))
+    store = ResponseCache(str(tmp_path / 'lru.db'), max_bytes=int(size * 3.5), ttls={'page': 60})
+    urls = [f'https://example.com/{i}' for i in range(5)]
+    for url, page in list(zip(urls, pages))[:3]:
+        store.put(url, 'page', page)
+    # Reading the oldest page makes the second one the least recently used
+    time.sleep(0.01)
+    assert store.get(urls[0], 'page').text == pages[0]
+    store.put(urls[3], 'page', pages[3])
+    assert store.get(urls[1], 'page') is None
+    assert [store.get(url, 'page') is not None for url in (urls[0], urls[2], urls[3])] == [True] * 3
+    assert store.stats()['evictions'] == 1
+    assert store.stats()['bytes'] <= store.max_bytes
+    store.close()
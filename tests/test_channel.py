@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from aiotube.channel import Channel
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Replaces the uploads tab download with one released by the test."""
+    state = {'count': 0, 'release': None, 'error': None}
+
+    async def fetch(url):
+        state['count'] += 1
+        await state['release'].wait()
+        if state['error']:
+            raise state['error']
+        return f'<page of {url}>'
+
+    pages = dict(Channel._PAGES)
+    pages['uploads'] = (None, fetch)
+    monkeypatch.setattr(Channel, '_PAGES', pages)
+    return state
+
+
+def test_cancelled_first_caller_does_not_cancel_the_shared_download(downloads):
+    async def main():
+        downloads['release'] = asyncio.Event()
+        channel = Channel('UCabc')
+        first = asyncio.ensure_future(channel._apage('uploads'))
+        second = asyncio.ensure_future(channel._apage('uploads'))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        downloads['release'].set()
+        page = await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return channel, page
+
+    channel, page = asyncio.run(main())
+    assert page == '<page of https://www.youtube.com/channel/UCabc>'
+    assert downloads['count'] == 1
+    assert channel._pending == {}
+    # Stored for the next caller even though the caller that started it left
+    assert channel._cached_page('uploads') == page
+
+
+def test_failed_download_reaches_every_caller_and_is_not_stored(downloads):
+    async def main():
+        downloads['release'] = asyncio.Event()
+        downloads['error'] = ConnectionError('gone')
+        channel = Channel('UCabc')
+        waiters = [asyncio.ensure_future(channel._apage('uploads')) for _ in range(2)]
+        await asyncio.sleep(0)
+        downloads['release'].set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        return channel, results
+
+    channel, results = asyncio.run(main())
+    assert [type(result) for result in results] == [ConnectionError, ConnectionError]
+    assert downloads['count'] == 1
+    assert channel._pending == {}
+    assert channel._cached_page('uploads') is None
@@ -0,0 +1,202 @@
+import random
+import sys
+import types
+
+try:
+    import PyQt6  # noqa: F401
+except ImportError:
+    # Just enough of PyQt6 to import dashboard.py: every name is a class whose
+    # attributes are classes again, and instances accept any call
+    class _Meta(type):
+        def __getattr__(cls, name):
+            if name.startswith('__'):
+                raise AttributeError(name)
+            return _Meta(name, (_Qt,), {})
+
+    class _Qt(metaclass=_Meta):
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __call__(self, *args, **kwargs):
+            return _Qt()
+
+        def __getattr__(self, name):
+            if name.startswith('__'):
+                raise AttributeError(name)
+            return _Qt()
+
+    # super() skips __getattr__, so the model notifications are spelled out
+    for _name in ('beginResetModel', 'endResetModel', 'beginRemoveRows', 'endRemoveRows',
+                  'beginInsertRows', 'endInsertRows', 'beginMoveRows', 'endMoveRows'):
+        setattr(_Qt, _name, lambda self, *args: True)
+
+    package = types.ModuleType('PyQt6')
+    for name in ('QtCore', 'QtGui', 'QtWidgets', 'QtNetwork'):
+        module = types.ModuleType(f'PyQt6.{name}')
+        module.__getattr__ = lambda attribute: _Meta(attribute, (_Qt,), {})
+        setattr(package, name, module)
+        sys.modules[module.__name__] = module
+    sys.modules['PyQt6'] = package
+
+import pytest
+
+from dashboard import ChannelListModel, _longest_increasing
+from thumbnails import thumbnail_url
+
+
+class RecordingModel(ChannelListModel):
+    """Replays every row operation on a shadow list, as a view would."""
+
+    def __init__(self):
+        super().__init__(thumbnail_loader=None)
+        self.shadow = []
+        self.ops = 0
+
+    def endResetModel(self):
+        super().endResetModel()
+        self.shadow = list(self._rows)
+
+    def beginRemoveRows(self, parent, first, last):
+        super().beginRemoveRows(parent, first, last)
+        self.ops += 1
+        del self.shadow[first:last + 1]
+
+    def beginInsertRows(self, parent, first, last):
+        super().beginInsertRows(parent, first, last)
+        self.ops += 1
+        self._inserting = first
+
+    def endInsertRows(self):
+        super().endInsertRows()
+        self.shadow.insert(self._inserting, self._rows[self._inserting])
+
+    def beginMoveRows(self, source_parent, first, last, destination_parent, destination):
+        # Qt refuses moves onto the rows themselves
+        assert not first <= destination <= last + 1, (first, last, destination)
+        result = super().beginMoveRows(source_parent, first, last, destination_parent, destination)
+        self.ops += 1
+        row = self.shadow.pop(first)
+        self.shadow.insert(destination - 1 if destination > first else destination, row)
+        return result
+
+
+def ids(rows):
+    return [row['channel_id'] for row in rows]
+
+
+@pytest.mark.parametrize('values', [[], [5], [1, 2, 3], [3, 2, 1], [2, 5, 1, 3, 4, 0], [0, 8, 4, 12, 2, 10, 6, 14]])
+def test_longest_increasing_is_increasing_and_longest(values):
+    indexes = _longest_increasing(values)
+    picked = [values[i] for i in indexes]
+    assert indexes == sorted(indexes)
+    assert all(a < b for a, b in zip(picked, picked[1:]))
+    # Patience sorting: the number of piles is the LIS length
+    piles = []
+    for value in values:
+        for i, top in enumerate(piles):
+            if value <= top:
+                piles[i] = value
+                break
+        else:
+            piles.append(value)
+    assert len(indexes) == len(piles)
+
+
+def test_apply_rows_matches_random_edits_with_few_operations():
+    rng = random.Random(3)
+    for trial in range(2000):
+        rows = [{'channel_id': f'c{i}', 'version': 0} for i in range(rng.randint(1, 60))]
+        model = RecordingModel()
+        model.apply_rows(rows)
+        fresh = [dict(row) for row in rows]
+        changes = 0
+        for step in range(rng.randint(0, 4)):
+            kind = rng.random()
+            if kind < 0.3 and fresh:
+                fresh.pop(rng.randrange(len(fresh)))
+            elif kind < 0.6:
+                fresh.insert(rng.randint(0, len(fresh)), {'channel_id': f'n{trial}_{step}', 'version': 0})
+            elif fresh:
+                moved = fresh.pop(rng.randrange(len(fresh)))
+                moved['version'] = 1
+                fresh.insert(rng.randint(0, len(fresh)), moved)
+            else:
+                continue
+            changes += 1
+        model.ops = 0
+        model.apply_rows(fresh)
+        assert model._rows == fresh
+        assert ids(model.shadow) == ids(fresh)
+        assert model.ops <= 3 * changes
+
+
+def test_apply_rows_leaves_unchanged_rows_alone():
+    rows = [{'channel_id': f'c{i}', 'version': 0} for i in range(5000)]
+    model = RecordingModel()
+    model.apply_rows(rows)
+    fresh = [dict(row) for row in rows]
+    fresh.append(fresh.pop(0))
+    fresh.insert(0, {'channel_id': 'new', 'version': 0})
+    del fresh[2500]
+    model.ops = 0
+    model.apply_rows(fresh)
+    assert ids(model.shadow) == ids(fresh)
+    assert model.ops == 3
+
+
+class FailingLoader:
+    """Reports every image as failed, as ThumbnailLoader does on a network error."""
+
+    def __init__(self):
+        self.loads = 0
+
+    def peek(self, url, size):
+        return None
+
+    def load(self, url, callback, size, on_error=None):
+        self.loads += 1
+        on_error()
+
+
+def test_failed_thumbnail_is_requested_again():
+    loader = FailingLoader()
+    model = ChannelListModel(thumbnail_loader=loader)
+    model.set_rows([{'channel_id': 'c1', 'video_id': 'v1'}])
+    # thumbnail() only reads the row of the index
+    first = types.SimpleNamespace(row=lambda: 0)
+    model.thumbnail(first)
+    assert model._requested == set()
+    model.thumbnail(first)
+    assert loader.loads == 2
+
+
+class QueueingLoader:
+    """Keeps every load queued, like ThumbnailLoader while downloads are busy."""
+
+    def __init__(self):
+        self.errbacks = {}
+        self.cancelled = []
+
+    def peek(self, url, size):
+        return None
+
+    def load(self, url, callback, size, on_error=None):
+        self.errbacks[url] = on_error
+
+    def cancel(self, urls):
+        for url in urls:
+            self.cancelled.append(url)
+            self.errbacks.pop(url)()
+
+
+def test_removed_and_replaced_cards_drop_their_queued_thumbnails():
+    loader = QueueingLoader()
+    model = ChannelListModel(thumbnail_loader=loader)
+    rows = [{'channel_id': f'c{i}', 'video_id': f'v{i}'} for i in range(3)]
+    model.set_rows(rows)
+    for row in range(3):
+        model.thumbnail(types.SimpleNamespace(row=lambda row=row: row))
+    # c0 is removed and c1 has a newer upload; c2 is unchanged
+    model.apply_rows([{'channel_id': 'c1', 'video_id': 'v1b'}, rows[2]])
+    assert sorted(loader.cancelled) == [thumbnail_url('v0'), thumbnail_url('v1')]
+    assert model._requested == {'v2'}
@@ -0,0 +1,356 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from database import AsyncDatabase, Database, parse_timestamp, parse_views
+
+# The table as created before upload times and view counts were typed
+BASELINE_SCHEMA = '''
+    CREATE TABLE channels (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        channel_name TEXT NOT NULL,
+        channel_id TEXT NOT NULL UNIQUE,
+        video_id TEXT,
+        video_title TEXT,
+        video_views TEXT,
+        upload_date TEXT,
+        has_new_video INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+
+def channel(channel_id, upload_date='2024-01-01T00:00:00+00:00', **fields):
+    row = {
+        'channel_name': f'Channel {channel_id}',
+        'channel_id': channel_id,
+        'video_id': f'{channel_id}-video',
+        'video_title': f'Video of {channel_id}',
+        'video_views': '1,000',
+        'upload_date': upload_date,
+    }
+    row.update(fields)
+    return row
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / 'youtube_channels.db'))
+    yield database
+    database.close()
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-01-15T09:00:12-08:00', 1705338012),
+    ('2024-01-15T17:00:12+00:00', 1705338012),
+    ('2024-03-01', 1709251200),
+    ('N/A', None),
+    ('', None),
+    (None, None),
+    ('yesterday', None),
+])
+def test_parse_timestamp(value, expected):
+    assert parse_timestamp(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('12,345', 12345),
+    ('12345', 12345),
+    (678, 678),
+    ('N/A', None),
+    (None, None),
+])
+def test_parse_views(value, expected):
+    assert parse_views(value) == expected
+
+
+def test_baseline_file_is_migrated(tmp_path):
+    path = str(tmp_path / 'youtube_channels.db')
+    conn = sqlite3.connect(path)
+    conn.execute(BASELINE_SCHEMA)
+    conn.executemany(
+        'INSERT INTO channels (channel_name, channel_id, video_id, video_title, video_views, upload_date, has_new_video) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)', [
+            ('Old', 'UC1', 'v1', 'First', '1,234', '2024-01-15T09:00:12-08:00', 1),
+            ('Unknown', 'UC2', 'v2', 'Second', 'N/A', 'N/A', 0),
+            ('New', 'UC3', 'v3', 'Third', '99', '2024-03-01', 0),
+        ])
+    conn.commit()
+    conn.close()
+
+    db = Database(path)
+    try:
+        conn = db.reader()
+        assert conn.execute('PRAGMA user_version').fetchone()[0] == Database.SCHEMA_VERSION
+        rows = {row['channel_id']: row for row in db.get_all_channels()}
+        assert (rows['UC1']['upload_ts'], rows['UC1']['view_count']) == (1705338012, 1234)
+        assert (rows['UC2']['upload_ts'], rows['UC2']['view_count']) == (None, None)
+        assert (rows['UC3']['upload_ts'], rows['UC3']['view_count']) == (1709251200, 99)
+        # The display strings are kept as they were
+        assert rows['UC1']['video_views'] == '1,234'
+        # Newest first, unknown upload dates last
+        assert [row['channel_id'] for row in db.get_all_channels()] == ['UC3', 'UC1', 'UC2']
+        assert [row['channel_id'] for row in db.get_all_channels(new_only=True)] == ['UC1']
+        indexes = {row['name'] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {'idx_channels_upload_ts', 'idx_channels_new'} <= indexes
+    finally:
+        db.close()
+
+
+def test_migrated_file_opens_again_unchanged(tmp_path):
+    path = str(tmp_path / 'youtube_channels.db')
+    db = Database(path)
+    db.add_channel(channel('UC1'))
+    db.close()
+    db = Database(path)
+    try:
+        assert db.reader().execute('PRAGMA user_version').fetchone()[0] == Database.SCHEMA_VERSION
+        assert [row['channel_id'] for row in db.get_all_channels()] == ['UC1']
+    finally:
+        db.close()
+
+
+def test_writes_fill_the_typed_columns(db):
+    db.add_channel(channel('UC1', upload_date='2024-01-15T17:00:12+00:00', video_views='5,000'))
+    row, = db.get_all_channels()
+    assert (row['upload_ts'], row['view_count']) == (1705338012, 5000)
+
+
+def test_apply_updates_returns_only_changed_rows(db):
+    for channel_id in ('UC1', 'UC2'):
+        db.add_channel(channel(channel_id))
+    same = channel('UC1')
+    moved = channel('UC2', video_id='UC2-next', video_title='Next', upload_date='2024-02-01T00:00:00+00:00')
+    assert db.apply_updates([same, moved]) == [moved]
+    rows = {row['channel_id']: row for row in db.get_all_channels()}
+    assert rows['UC2']['video_id'] == 'UC2-next'
+    assert rows['UC2']['upload_ts'] == parse_timestamp('2024-02-01T00:00:00+00:00')
+    assert rows['UC2']['has_new_video'] == 1
+    assert db.apply_updates([moved]) == []
+
+
+def test_apply_updates_does_not_bring_back_removed_channels(db):
+    db.add_channel(channel('UC1'))
+    db.add_channel(channel('UC2'))
+    db.remove_channel('UC2')
+    update = channel('UC2', video_id='UC2-next')
+    assert db.apply_updates([update], [('UC2', {'video_id': 'UC2-next', 'title': 'Next'})]) == []
+    assert [row['channel_id'] for row in db.get_all_channels()] == ['UC1']
+    assert db.seen_videos(['UC2']) == {'UC2': set()}
+
+
+def test_apply_updates_handles_many_rows_in_one_call(db):
+    rows = [channel(f'UC{i}') for i in range(1200)]
+    for row in rows:
+        db.add_channel(row)
+    updates = [dict(row, video_id='changed') for row in rows[::3]]
+    # Later rows for the same channel win
+    assert len(db.apply_updates(rows + updates)) == len(updates)
+    changed = [row['channel_id'] for row in db.get_all_channels() if row['video_id'] == 'changed']
+    assert len(changed) == len(updates)
+
+
+def test_seen_videos_lists_recorded_uploads_per_channel(db):
+    db.add_channel(channel('UC1'))
+    db.add_channel(channel('UC2'))
+    db.record_videos([('UC1', {'video_id': 'a', 'title': 'A'}), ('UC1', {'video_id': 'b'})])
+    db.apply_updates([], [('UC2', {'video_id': 'c', 'title': 'C'}), ('UC1', {'video_id': 'a'})])
+    assert db.seen_videos(['UC1', 'UC2', 'UC3']) == {'UC1': {'a', 'b'}, 'UC2': {'c'}, 'UC3': set()}
+    # A stub entry does not erase what the feed told us before
+    title, = db.reader().execute("SELECT title FROM videos WHERE video_id = 'a'").fetchone()
+    assert title == 'A'
+    db.remove_channel('UC1')
+    assert db.seen_videos(['UC1']) == {'UC1': set()}
+
+
+@pytest.fixture
+def async_db(tmp_path):
+    database = AsyncDatabase(str(tmp_path / 'youtube_channels.db'))
+    yield database
+    database.close()
+
+
+def test_async_writes_queued_together_share_a_commit(async_db):
+    async def scenario():
+        # Keep the writer from committing until every write is queued
+        with async_db.db._lock:
+            pending = [async_db.add_channel(channel(f'UC{i}')) for i in range(300)]
+        return await asyncio.gather(*pending), await async_db.get_all_channels()
+    added, rows = asyncio.run(scenario())
+    assert all(added)
+    assert len(rows) == 300
+    assert async_db.writes == 300
+    # At most the first write alone, then max_batch (256) at a time
+    assert async_db.batches <= 3
+
+
+def test_async_failing_write_is_rolled_back_alone(async_db):
+    async def scenario():
+        await async_db.add_channel(channel('UC1'))
+        bad = async_db.apply_updates([{'channel_id': 'UC1'}], [('UC1', {'video_id': 'x'})])  # no video fields
+        good = async_db.add_channel(channel('UC2'))
+        return await asyncio.gather(bad, good, return_exceptions=True)
+    bad, good = asyncio.run(scenario())
+    assert isinstance(bad, KeyError)
+    assert good is True
+    assert sorted(row['channel_id'] for row in async_db.db.get_all_channels()) == ['UC1', 'UC2']
+    # The video recorded before the failure went with its savepoint
+    assert async_db.db.seen_videos(['UC1']) == {'UC1': set()}
+
+
+def test_async_write_resolves_after_commit(async_db):
+    async def scenario():
+        await async_db.add_channel(channel('UC1'))
+        await async_db.mark_video_as_watched('UC1')
+        # The reader thread has its own connection and must see the commit
+        return await async_db.get_all_channels(new_only=True), await async_db.seen_videos(['UC1'])
+    unwatched, seen = asyncio.run(scenario())
+    assert unwatched == []
+    assert seen == {'UC1': set()}
+
+
+def test_async_close_commits_queued_writes(tmp_path):
+    path = str(tmp_path / 'youtube_channels.db')
+    async_db = AsyncDatabase(path)
+
+    async def queue_without_waiting():
+        return [async_db.add_channel(channel(f'UC{i}')) for i in range(20)]
+    asyncio.run(queue_without_waiting())
+    async_db.close()
+    db = Database(path)
+    try:
+        assert len(db.get_all_channels()) == 20
+    finally:
+        db.close()
+
+
+@pytest.fixture(params=['fts5', 'like'])
+def search_db(request, db):
+    db.add_channel(channel('UC1', channel_name='Linus Tech Tips', video_title='Building a PC'))
+    db.add_channel(channel('UC2', channel_name='Veritasium', video_title='Why tech fails',
+                           upload_date='2024-02-01T00:00:00+00:00'))
+    db.add_channel(channel('UC3', channel_name='my_channel', video_title='Cooking'))
+    db.record_videos([('UC2', {'video_id': 'old', 'title': 'Éclipse über Physik'})])
+    if request.param == 'like':
+        db.full_text = False
+    return db
+
+
+def found(db, text):
+    return sorted(row['channel_id'] for row in db.search(text))
+
+
+def test_search_matches_names_titles_and_past_uploads(search_db):
+    assert found(search_db, 'tech') == ['UC1', 'UC2']
+    assert found(search_db, 'linus tech') == ['UC1']
+    assert found(search_db, 'physik') == ['UC2']
+    assert found(search_db, 'cooking') == ['UC3']
+    assert found(search_db, 'my_channel') == ['UC3']
+    assert found(search_db, 'nothing') == []
+    assert found(search_db, '  ') == []
+
+
+def test_search_follows_updates_and_removals(search_db):
+    search_db.apply_updates([channel('UC1', channel_name='Linus Tech Tips', video_title='Gravity explained')])
+    assert found(search_db, 'building') == []
+    assert found(search_db, 'gravity') == ['UC1']
+    search_db.remove_channel('UC2')
+    assert found(search_db, 'physik') == []
+    assert found(search_db, 'tech') == ['UC1']
+
+
+def test_search_returns_every_match_unless_limited(search_db):
+    for i in range(80):
+        search_db.add_channel(channel(f'X{i}', channel_name=f'Cooking show {i}'))
+    assert len(search_db.search('cooking')) == 81
+    assert len(search_db.search('cooking', limit=10)) == 10
+
+
+def test_full_text_search_prefers_prefixes_and_names(db):
+    assert db.full_text
+    db.add_channel(channel('UC1', channel_name='Physics Girl', video_title='Stars'))
+    db.add_channel(channel('UC2', channel_name='Veritasium', video_title='Physics of flight'))
+    assert found(db, 'phys') == ['UC1', 'UC2']
+    assert found(db, 'eclipse') == []
+    # Diacritics are folded and operators are taken literally
+    db.record_videos([('UC2', {'video_id': 'e', 'title': 'Éclipse'})])
+    assert found(db, 'eclipse') == ['UC2']
+    assert found(db, 'AND') == []
+    assert db.search('physics')[0]['channel_id'] == 'UC1'
+
+
+def test_full_text_index_survives_vacuum(db):
+    for i in range(50):
+        db.add_channel(channel(f'UC{i}'))
+        db.record_videos([(f'UC{i}', {'video_id': f'v{i}', 'title': f'episode{i}'})])
+    for i in range(0, 50, 2):
+        db.remove_channel(f'UC{i}')
+    db._writer.execute('VACUUM')
+    assert found(db, 'episode7') == ['UC7']
+    assert found(db, 'episode8') == []
+    db._writer.execute("INSERT INTO videos_fts (videos_fts) VALUES ('integrity-check')")
+
+
+def downgrade_to_version_2(path, not_null='NOT NULL'):
+    """Rewrite a current file in the version 2 layout, videos keyed by (channel_id, video_id) only."""
+    conn = sqlite3.connect(path)
+    conn.executescript(f'''
+        DROP TRIGGER videos_fts_insert; DROP TRIGGER videos_fts_delete; DROP TRIGGER videos_fts_update;
+        DROP TABLE videos_fts;
+        CREATE TABLE videos_v2 (
+            channel_id TEXT {not_null}, video_id TEXT NOT NULL, title TEXT, published TEXT,
+            published_ts INTEGER, view_count INTEGER, first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (channel_id, video_id));
+        INSERT INTO videos_v2 SELECT channel_id, video_id, title, published, published_ts, view_count, first_seen FROM videos;
+        DROP TABLE videos;
+        ALTER TABLE videos_v2 RENAME TO videos;
+        PRAGMA user_version = 2;
+    ''')
+    conn.close()
+
+
+def test_upload_history_is_kept_when_videos_get_an_id(tmp_path):
+    path = str(tmp_path / 'youtube_channels.db')
+    db = Database(path)
+    db.add_channel(channel('UC1'))
+    db.record_videos([('UC1', {'video_id': 'a', 'title': 'Alpha'}), ('UC1', {'video_id': 'b', 'title': 'Beta'})])
+    db.close()
+    downgrade_to_version_2(path)
+    db = Database(path)
+    try:
+        assert db.seen_videos(['UC1']) == {'UC1': {'a', 'b'}}
+        columns = [column['name'] for column in db.reader().execute('PRAGMA table_info(videos)')]
+        assert columns[0] == 'id'
+        assert found(db, 'beta') == ['UC1']
+    finally:
+        db.close()
+
+
+def test_interrupted_migration_leaves_the_file_as_it_was(tmp_path):
+    path = str(tmp_path / 'youtube_channels.db')
+    db = Database(path)
+    db.add_channel(channel('UC1'))
+    db.record_videos([('UC1', {'video_id': 'a', 'title': 'Alpha'})])
+    db.close()
+    downgrade_to_version_2(path, not_null='')
+    # A row the version 3 table refuses makes the copy step fail halfway
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO videos (channel_id, video_id, title) VALUES (NULL, 'b', 'Broken')")
+    conn.commit()
+    conn.close()
+    with pytest.raises(sqlite3.IntegrityError):
+        Database(path)
+    conn = sqlite3.connect(path)
+    assert conn.execute('PRAGMA user_version').fetchone()[0] == 2
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert 'videos_v3' not in tables
+    conn.execute('DELETE FROM videos WHERE channel_id IS NULL')
+    conn.commit()
+    conn.close()
+    db = Database(path)
+    try:
+        assert db.seen_videos(['UC1']) == {'UC1': {'a'}}
+        assert found(db, 'alpha') == ['UC1']
+    finally:
+        db.close()
@@ -0,0 +1,29 @@
+from aiotube.feed import FeedParser
+
+
+def feed(*entries):
+    body = ''.join(
+        f'<entry><yt:videoId>{video_id}</yt:videoId><title>{video_id}</title>'
+        f'<link rel="alternate" href="https://www.youtube.com/{path}"/></entry>'
+        for video_id, path in entries
+    )
+    return (
+        '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+        f'xmlns="http://www.w3.org/2005/Atom">{body}</feed>'
+    )
+
+
+PAGE = feed(('v3', 'shorts/v3'), ('v2', 'watch?v=v2'), ('v1', 'watch?v=v1'))
+
+
+def test_shorts_are_skipped_and_do_not_count_towards_the_limit():
+    parser = FeedParser(limit=1)
+    assert parser.feed(PAGE)
+    assert [entry['video_id'] for entry in parser.entries] == ['v2']
+
+
+def test_shorts_are_kept_on_request():
+    parser = FeedParser(shorts=True)
+    parser.feed(PAGE)
+    assert [entry['video_id'] for entry in parser.entries] == ['v3', 'v2', 'v1']
+    assert parser.entries[0]['url'] == 'https://www.youtube.com/shorts/v3'
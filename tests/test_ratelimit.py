@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+import pytest
+
+import aiotube.transport
+import aiotube.utils
+from aiotube.errors import AIOError
+from aiotube.ratelimit import HostLimiter, RateLimiter
+from aiotube.transport import HTTPClient
+from aiotube.utils import arequest
+from conftest import response
+
+
+def new_client(**kwargs):
+    return HTTPClient(timeout=5.0, limiter=RateLimiter(rate=1000, max_rate=1000, burst=1000), **kwargs)
+
+
+def test_429_pauses_the_host_for_retry_after_then_succeeds(http_server):
+    sent = []
+
+    async def handler(request, writer):
+        sent.append(time.monotonic())
+        if request['number'] == 1:
+            writer.write(response(429, 'slow down', {'Retry-After': '1'}))
+        else:
+            writer.write(response(body='ok'))
+
+    async def main():
+        async with http_server(handler) as server:
+            client = new_client()
+            return client, await client.get(server.url + '/')
+
+    client, result = asyncio.run(main())
+    assert result.status == 200
+    assert result.text() == 'ok'
+    assert sent[1] - sent[0] >= 1.0
+    stats = client.limiter.host('127.0.0.1').stats()
+    assert (stats['throttled'], stats['retries'], stats['decreases']) == (1, 1, 1)
+
+
+def test_window_halves_once_per_cooldown_and_grows_back():
+    limiter = HostLimiter(rate=8, burst=8, max_concurrency=8, cooldown=0.05)
+    # A burst of rejections is one congestion signal
+    for status in (429, 503, 500):
+        limiter.observe(status)
+    assert (limiter.limit, limiter.rate, limiter.decreases) == (4, 4, 1)
+    assert limiter.throttled == 3
+    time.sleep(0.06)
+    limiter.observe(503)
+    assert (limiter.limit, limiter.rate, limiter.decreases) == (2, 2, 2)
+    # Additive increase: about one more slot per window of successes
+    limiter.observe(200)
+    assert limiter.limit == 2.5
+    for _ in range(100):
+        limiter.observe(200)
+    assert (limiter.limit, limiter.rate) == (8, 8)
+    # Client errors say nothing about congestion
+    limiter.observe(404)
+    assert (limiter.limit, limiter.decreases) == (8, 2)
+
+
+def test_persistent_server_error_raises_after_max_retries(http_server, monkeypatch):
+    async def handler(request, writer):
+        writer.write(response(500, 'broken'))
+
+    monkeypatch.setattr(aiotube.utils, 'client', new_client(max_retries=2))
+    monkeypatch.setattr(aiotube.transport, 'retry_delay', lambda attempt, retry_after=None: 0)
+
+    async def main():
+        async with http_server(handler) as server:
+            with pytest.raises(AIOError, match='HTTP 500'):
+                await arequest(server.url + '/')
+            return server
+
+    server = asyncio.run(main())
+    assert len(server.requests) == 3
+    assert aiotube.utils.client.limiter.host('127.0.0.1').retries == 2
@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from scheduler import ChannelScheduler
+
+NOW = 1_700_000_000
+DAY = 24 * 3600
+
+
+@pytest.fixture(autouse=True)
+def seeded_random():
+    random.seed(1234)
+
+
+def test_learn_uses_a_fraction_of_the_median_gap():
+    scheduler = ChannelScheduler()
+    uploads = [NOW - 3600 - i * DAY for i in range(10)]  # daily, latest an hour ago
+    assert scheduler.learn('UC1', uploads, now=NOW) == pytest.approx(DAY / ChannelScheduler.CHECKS_PER_GAP)
+
+
+def test_learn_stretches_the_interval_of_a_quiet_channel():
+    scheduler = ChannelScheduler()
+    uploads = [NOW - 30 * DAY - i * DAY for i in range(10)]  # daily until a month ago
+    assert scheduler.learn('UC1', uploads, now=NOW) == pytest.approx(30 * DAY / 3 / ChannelScheduler.CHECKS_PER_GAP)
+
+
+def test_learn_clamps_to_the_configured_bounds():
+    scheduler = ChannelScheduler(min_interval=600, max_interval=7200)
+    assert scheduler.learn('fast', [NOW - 60 * i for i in range(10)], now=NOW) == 600
+    assert scheduler.learn('slow', [NOW - 400 * DAY - i * 30 * DAY for i in range(5)], now=NOW) == 7200
+
+
+def test_learn_without_upload_times_keeps_the_default():
+    scheduler = ChannelScheduler(default_interval=1800)
+    assert scheduler.learn('UC1', [None], now=NOW) == 1800
+
+
+def test_sync_seeds_new_channels_within_one_interval():
+    scheduler = ChannelScheduler()
+    scheduler.sync([('UC1', NOW - DAY), ('UC2', None)], now=NOW)
+    assert len(scheduler) == 2
+    for channel_id in ('UC1', 'UC2'):
+        assert NOW <= scheduler._due[channel_id] <= NOW + scheduler.interval(channel_id)
+
+
+def test_sync_drops_channels_no_longer_tracked():
+    scheduler = ChannelScheduler()
+    scheduler.sync([('UC1', None), ('UC2', None)], now=NOW)
+    scheduler.sync([('UC2', None)], now=NOW)
+    assert len(scheduler) == 1
+    assert scheduler.due(now=NOW + 10 * DAY) == ['UC2']
+
+
+def test_due_returns_ready_channels_up_to_the_limit():
+    scheduler = ChannelScheduler(max_per_tick=3)
+    scheduler.sync([(f'UC{i}', None) for i in range(10)], now=NOW)
+    later = NOW + 10 * DAY
+    first = scheduler.due(now=later)
+    assert len(first) == 3
+    rest = scheduler.due(now=later, limit=100)
+    assert len(rest) == 7
+    assert not set(first) & set(rest)
+    assert scheduler.due(now=later) == []
+
+
+def test_due_skips_channels_not_yet_due():
+    scheduler = ChannelScheduler()
+    scheduler.sync([('UC1', None)], now=NOW)
+    assert scheduler.due(now=NOW - 1) == []
+
+
+def test_reschedule_jitters_around_the_interval():
+    scheduler = ChannelScheduler(jitter=0.2)
+    scheduler.sync([('UC1', None)], now=NOW)
+    assert scheduler.due(now=NOW + 10 * DAY) == ['UC1']
+    scheduler.reschedule('UC1', now=NOW)
+    interval = scheduler.interval('UC1')
+    assert NOW + 0.8 * interval <= scheduler.next_due() <= NOW + 1.2 * interval
+
+
+def test_reschedule_ignores_untracked_channels():
+    scheduler = ChannelScheduler()
+    scheduler.reschedule('UC1', now=NOW)
+    assert len(scheduler) == 0
+    assert scheduler.next_due() is None
+
+
+def test_next_due_skips_stale_heap_entries():
+    scheduler = ChannelScheduler()
+    scheduler.sync([('UC1', None), ('UC2', None)], now=NOW)
+    earliest = min(scheduler._due, key=scheduler._due.get)
+    scheduler.sync([(channel_id, None) for channel_id in scheduler._due if channel_id != earliest], now=NOW)
+    remaining, = scheduler._due
+    assert scheduler.next_due() == scheduler._due[remaining]
+
+
+def test_checks_per_hour_sums_the_learned_intervals():
+    scheduler = ChannelScheduler(min_interval=600, max_interval=7200)
+    scheduler.sync([('fast', None), ('slow', None)], now=NOW)
+    scheduler.learn('fast', [NOW - 60 * i for i in range(10)], now=NOW)
+    scheduler.learn('slow', [NOW - 400 * DAY - i * 30 * DAY for i in range(5)], now=NOW)
+    assert scheduler.checks_per_hour() == pytest.approx(3600 / 600 + 3600 / 7200)
@@ -0,0 +1,130 @@
+import asyncio
+import zlib
+
+import pytest
+
+from aiotube.errors import BlockingCallError
+from aiotube.ratelimit import RateLimiter
+from aiotube.transport import HTTPClient, run_sync
+from conftest import chunked, response
+
+
+def new_client(**kwargs):
+    # A limiter generous enough that pacing never shows up in the tests
+    return HTTPClient(timeout=5.0, limiter=RateLimiter(rate=1000, max_rate=1000, burst=1000), **kwargs)
+
+
+def test_keep_alive_connection_is_reused(http_server):
+    async def handler(request, writer):
+        writer.write(response(body=f'page {request["number"]}'))
+
+    async def main():
+        async with http_server(handler) as server:
+            client = new_client()
+            first = await client.get(server.url + '/a')
+            second = await client.get(server.url + '/b')
+            return server, client, first, second
+
+    server, client, first, second = asyncio.run(main())
+    assert (first.text(), second.text()) == ('page 1', 'page 2')
+    assert server.connections == 1
+    assert client.pool.stats()['opened'] == 1
+    assert client.pool.stats()['reused'] == 1
+
+
+def test_dropped_reused_connection_is_retried_on_a_new_one(http_server):
+    async def handler(request, writer):
+        if request['connection'] == 1 and request['number'] == 2:
+            # The server gave up on the idle connection: no answer, just EOF
+            return False
+        writer.write(response(body='fresh'))
+
+    async def main():
+        async with http_server(handler) as server:
+            client = new_client()
+            await client.get(server.url + '/')
+            return server, await client.get(server.url + '/')
+
+    server, second = asyncio.run(main())
+    assert second.status == 200
+    assert second.text() == 'fresh'
+    assert server.connections == 2
+    assert [request['connection'] for request in server.requests] == [1, 1, 2]
+
+
+def test_chunked_body_keeps_characters_split_across_chunks(http_server):
+    text = 'café — 日本'
+    encoded = text.encode('utf-8')
+    # Every multi-byte character is cut in the middle
+    pieces = [encoded[:4], encoded[4:7], encoded[7:11], encoded[11:]]
+
+    async def handler(request, writer):
+        writer.write(chunked(*pieces))
+
+    async def main():
+        async with http_server(handler) as server:
+            client = new_client()
+            async with client.open(server.url + '/') as stream:
+                parts = [part async for part in stream.text_chunks()]
+            return client, parts, stream
+
+    client, parts, stream = asyncio.run(main())
+    assert ''.join(parts) == text
+    assert stream.complete
+    # The whole body was read, so the connection went back to the pool
+    assert client.pool.stats()['idle'] == 1
+
+
+def test_redirect_is_followed(http_server):
+    async def handler(request, writer):
+        if request['target'] == '/old':
+            writer.write(response(302, headers={'Location': '/new?page=1'}))
+        else:
+            writer.write(response(body='moved here'))
+
+    async def main():
+        async with http_server(handler) as server:
+            return server, await new_client().get(server.url + '/old')
+
+    server, result = asyncio.run(main())
+    assert result.status == 200
+    assert result.url.endswith('/new?page=1')
+    assert result.text() == 'moved here'
+    assert [request['target'] for request in server.requests] == ['/old', '/new?page=1']
+
+
+def test_run_sync_on_the_io_loop_raises_instead_of_deadlocking():
+    async def blocking_call():
+        run_sync(asyncio.sleep(0))
+
+    with pytest.raises(BlockingCallError, match='async variant'):
+        run_sync(blocking_call())
+    # Outside the I/O loop the same call simply runs
+    assert run_sync(asyncio.sleep(0, result='done')) == 'done'
+
+
+@pytest.mark.parametrize('encoding, wbits', [('gzip', 16 + 15), ('deflate', -15)])
+def test_compressed_body_is_decoded_and_counted(http_server, encoding, wbits):
+    text = '<feed>' + 'entry ' * 2000 + '</feed>'
+    compressor = zlib.compressobj(wbits=wbits)
+    wire = compressor.compress(text.encode()) + compressor.flush()
+
+    async def handler(request, writer):
+        writer.write(response(body=wire, headers={'Content-Encoding': encoding}))
+
+    async def main():
+        async with http_server(handler) as server:
+            client = new_client()
+            async with client.open(server.url + '/') as stream:
+                body = ''.join([part async for part in stream.text_chunks()])
+            return server, client, stream, body
+
+    server, client, stream, body = asyncio.run(main())
+    assert body == text
+    assert 'gzip' in server.requests[0]['headers']['accept-encoding']
+    assert stream.encoding == encoding
+    assert (stream.wire_bytes, stream.body_bytes) == (len(wire), len(text))
+    totals = client.stats.snapshot()
+    assert (totals['wire_bytes'], totals['body_bytes']) == (len(wire), len(text))
+    assert totals['saved_bytes'] == len(text) - len(wire)
+    assert client.stats.recent()[-1]['complete']
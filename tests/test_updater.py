@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+import updater
+from updater import UpdateEngine
+
+
+def entry(video_id, title=None, published='2024-02-01T00:00:00+00:00'):
+    return {'video_id': video_id, 'title': title or f'Title {video_id}', 'published': published, 'views': 10}
+
+
+def row(channel_id, video_id):
+    return {'channel_name': f'Channel {channel_id}', 'channel_id': channel_id, 'video_id': video_id}
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """Channel id -> recent uploads served instead of the network, newest first."""
+    served = {}
+
+    async def recent_uploads(ids, limit, concurrency, semaphore=None):
+        for channel_id in ids:
+            yield channel_id, served[channel_id]
+
+    monkeypatch.setattr(updater.Channel, 'aiter_recent_uploads', recent_uploads)
+    return served
+
+
+def check(channels, seen):
+    async def collect():
+        return {result['channel_id']: result async for result in UpdateEngine().run(channels, seen)}
+    return asyncio.run(collect())
+
+
+def test_unseen_is_the_set_difference_in_feed_order():
+    entries = [entry('v3'), entry('v2'), entry('v1')]
+    assert [e['video_id'] for e in UpdateEngine.unseen(row('UC1', 'v1'), entries, {'v1'})] == ['v3', 'v2']
+    assert UpdateEngine.unseen(row('UC1', 'v3'), entries, {'v1', 'v2', 'v3'}) == []
+
+
+def test_unseen_without_history_only_compares_the_latest_upload():
+    entries = [entry('v3'), entry('v2'), entry('v1')]
+    assert UpdateEngine.unseen(row('UC1', 'v3'), entries, set()) == []
+    assert [e['video_id'] for e in UpdateEngine.unseen(row('UC1', 'v1'), entries, set())] == ['v3']
+    assert UpdateEngine.unseen(row('UC1', 'v1'), [], set()) == []
+
+
+def test_run_reports_every_upload_since_the_last_check(pages):
+    pages['UC1'] = [entry('v3'), entry('v2'), entry('v1')]
+    result = check([row('UC1', 'v1')], {'UC1': {'v1'}})['UC1']
+    assert result['status'] == 'new'
+    assert [video['video_id'] for video in result['new_videos']] == ['v3', 'v2']
+    assert result['channel_data']['video_id'] == 'v3'
+    assert result['channel_data']['video_title'] == 'Title v3'
+    assert len(result['videos']) == 3
+
+
+def test_run_reports_missed_older_uploads_without_changing_the_card(pages):
+    pages['UC1'] = [entry('v3'), entry('v2'), entry('v1')]
+    result = check([row('UC1', 'v3')], {'UC1': {'v3', 'v1'}})['UC1']
+    assert result['status'] == 'new'
+    assert [video['video_id'] for video in result['new_videos']] == ['v2']
+    assert result['channel_data'] is None
+
+
+def test_run_reports_unchanged_and_errors(pages):
+    pages['UC1'] = [entry('v1')]
+    pages['UC2'] = RuntimeError('feed unavailable')
+    results = check([row('UC1', 'v1'), row('UC2', 'v9')], {'UC1': {'v1'}})
+    assert results['UC1']['status'] == 'unchanged'
+    assert results['UC1']['new_videos'] == []
+    assert results['UC2']['status'] == 'error'
+    assert results['UC2']['error'] == 'feed unavailable'
+
+
+def test_video_label_falls_back_to_the_watch_url():
+    assert UpdateEngine.video_label(entry('v1', title='Hello')) == 'Hello'
+    assert UpdateEngine.video_label({'video_id': 'v1', 'title': None}) == 'https://www.youtube.com/watch?v=v1'
+
+
+def test_run_revalidates_cached_feeds_on_request(pages, tmp_path):
+    from aiotube.cache import enable_cache, disable_cache
+    cache = enable_cache(str(tmp_path / 'http_cache.db'))
+    try:
+        feed = 'https://www.youtube.com/feeds/videos.xml?channel_id=UC1'
+        cache.put(feed, 'channel_feed', '<feed/>', etag='"1"')
+        about = 'https://www.youtube.com/channel/UC1/about'
+        cache.put(about, 'channel_about', '<html/>')
+        pages['UC1'] = [entry('v1')]
+
+        check([row('UC1', 'v1')], {'UC1': {'v1'}})
+        assert cache.get(feed, 'channel_feed').fresh
+
+        async def collect():
+            return [result async for result in UpdateEngine().run([row('UC1', 'v1')], {'UC1': {'v1'}}, revalidate=True)]
+        asyncio.run(collect())
+        stale = cache.get(feed, 'channel_feed')
+        assert not stale.fresh
+        assert stale.validators() == {'If-None-Match': '"1"'}
+        assert cache.get(about, 'channel_about').fresh
+    finally:
+        disable_cache()
+
+
+def test_feeds_and_watch_pages_share_the_concurrency_limit(monkeypatch):
+    in_flight = peak = 0
+
+    async def request():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+
+    async def recent_uploads(self, limit):
+        await request()
+        # No title: the watch page has to be fetched for the details
+        return [entry(f'new_{id(self)}', title='', published=None)]
+
+    class Watched:
+        metadata = {'title': 'T', 'views': 1, 'upload_date': '2024-02-01'}
+
+    async def fetch(cls, video_id, streaming=False):
+        await request()
+        return Watched()
+
+    monkeypatch.setattr(updater.Channel, 'arecent_uploads', recent_uploads)
+    monkeypatch.setattr(updater.Video, 'fetch', classmethod(fetch))
+    channels = [row(f'UC{i}', 'old') for i in range(40)]
+
+    async def collect():
+        return [result async for result in UpdateEngine(max_concurrency=4).run(channels)]
+    results = asyncio.run(collect())
+    assert [result['status'] for result in results] == ['new'] * 40
+    assert peak == 4
@@ -0,0 +1,130 @@
+import asyncio
+import re
+
+import pytest
+
+import aiotube.https
+import aiotube.utils
+from aiotube.errors import AIOError, InvalidURL, TooManyRequests
+from aiotube.ratelimit import RateLimiter
+from aiotube.transport import HTTPClient
+from aiotube.utils import arequest, ascan
+from conftest import chunked, response
+
+MARKER = re.compile(r'MARKER="(\w+)"')
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A private client for aiotube.utils, so its stats belong to one test."""
+    fresh = HTTPClient(timeout=5.0, limiter=RateLimiter(rate=1000, max_rate=1000, burst=1000))
+    monkeypatch.setattr(aiotube.utils, 'client', fresh)
+    return fresh
+
+
+def test_scan_stops_reading_once_the_pattern_matched(http_server, client):
+    page = ('<head>' + 'x' * 50000 + 'MARKER="found"' + 'y' * 4000000).encode()
+
+    async def handler(request, writer):
+        writer.write(response(body=page))
+
+    async def main():
+        async with http_server(handler) as server:
+            return await ascan(server.url + '/', {'marker': MARKER})
+
+    found = asyncio.run(main())
+    assert found['marker'].group(1) == 'found'
+    transfer = client.stats.recent()[-1]
+    assert transfer['complete'] is False
+    assert transfer['wire_bytes'] < len(page) // 10
+    # A connection left mid-body can not be reused
+    assert client.pool.stats()['idle'] == 0
+
+
+@pytest.mark.parametrize('overlap', [None, 16])
+def test_scan_finds_a_marker_split_across_chunks(http_server, client, overlap):
+    page = ('x' * 95 + 'MARKER="abc"' + 'y' * 100).encode()
+    # 10-byte chunks: the marker starts in one and ends two chunks later
+    pieces = [page[i:i + 10] for i in range(0, len(page), 10)]
+
+    async def handler(request, writer):
+        writer.write(chunked(*pieces))
+
+    async def main():
+        async with http_server(handler) as server:
+            return await ascan(server.url + '/', {'marker': MARKER}, overlap=overlap, batch=10)
+
+    found = asyncio.run(main())
+    assert found['marker'].group(1) == 'abc'
+
+
+def test_optional_patterns_are_reported_only_if_seen_first(http_server, client):
+    page = ('TITLE="early" ' + 'x' * 100 + 'MARKER="late"' + 'z' * 100 + 'TAIL="never"').encode()
+    pieces = [page[i:i + 10] for i in range(0, len(page), 10)]
+
+    async def handler(request, writer):
+        writer.write(chunked(*pieces))
+
+    async def main():
+        async with http_server(handler) as server:
+            return await ascan(
+                server.url + '/', {'marker': MARKER},
+                {'title': re.compile(r'TITLE="(\w+)"'), 'tail': re.compile(r'TAIL="(\w+)"')},
+                batch=10
+            )
+
+    found = asyncio.run(main())
+    assert found['marker'].group(1) == 'late'
+    assert found['title'].group(1) == 'early'
+    assert found['tail'] is None
+
+
+def test_video_and_uploads_scans_read_the_right_page(monkeypatch):
+    calls = []
+
+    async def fake_ascan(url, required, optional=None, endpoint=None, overlap=65536):
+        calls.append((url, endpoint, overlap))
+        return {}
+
+    monkeypatch.setattr(aiotube.https, 'ascan', fake_ascan)
+    asyncio.run(aiotube.https.avideo_scan('abc', {'m': MARKER}))
+    asyncio.run(aiotube.https.auploads_scan('https://www.youtube.com/channel/UC1', {'m': MARKER}))
+    assert calls == [
+        # the player response is one JSON blob, so the watch page keeps everything read
+        ('https://www.youtube.com/watch?v=abc', 'video_data', None),
+        ('https://www.youtube.com/channel/UC1/videos', 'uploads_data', 65536),
+    ]
+
+
+@pytest.mark.parametrize('status, error', [
+    (404, InvalidURL),
+    (429, TooManyRequests),
+    (403, AIOError),
+    (503, AIOError),
+])
+def test_error_statuses_raise_instead_of_returning_the_error_page(http_server, client, status, error):
+    # Retries are covered in test_ratelimit.py; here the first answer is final
+    client.max_retries = 0
+
+    async def handler(request, writer):
+        writer.write(response(status, '<html>error page</html>'))
+
+    async def main():
+        async with http_server(handler) as server:
+            with pytest.raises(error) as raised:
+                await arequest(server.url + '/')
+            return raised.value
+
+    raised = asyncio.run(main())
+    assert type(raised) is error
+
+
+def test_success_returns_the_page(http_server, client):
+    async def handler(request, writer):
+        writer.write(response(200, 'the page'))
+
+    async def main():
+        async with http_server(handler) as server:
+            return await arequest(server.url + '/')
+
+    assert asyncio.run(main()) == 'the page'
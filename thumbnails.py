@@ -0,0 +1,346 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict, deque
+
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, Qt, QUrl, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+
+USER_AGENT = (
+    b"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    b"(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+def thumbnail_url(video_id):
+    return f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg"
+
+
+class _DecodeSignals(QObject):
+    # url, raw bytes (None if the cache file could not be read),
+    # {(width, height): QImage} or None, source, seconds spent
+    decoded = pyqtSignal(str, object, object, str, float)
+
+
+class DecodeJob(QRunnable):
+    """Decodes image bytes and scales them to every requested size on a worker thread.
+
+    Only QImage is used here, which unlike QPixmap is safe off the GUI
+    thread; the GUI thread just wraps the finished images. Given a `path`
+    instead of `data`, the bytes are read from the disk cache here too.
+    """
+
+    def __init__(self, url, data, sizes, source, signals, path=None):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.sizes = sizes
+        self.source = source
+        self.signals = signals
+        self.path = path
+
+    def run(self):
+        started = time.perf_counter()
+        if self.data is None and self.path is not None:
+            self.data = DiskImageStore.read(self.path)
+        image = QImage()
+        images = None
+        if self.data is not None and image.loadFromData(self.data):
+            images = {
+                (width, height): image.scaled(
+                    width, height,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                for width, height in self.sizes
+            }
+        self.signals.decoded.emit(self.url, self.data, images, self.source, time.perf_counter() - started)
+
+
+class PixmapLRU:
+    """Scaled pixmaps kept in memory, least recently used dropped past `max_bytes`."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def get(self, key):
+        pixmap = self._items.get(key)
+        if pixmap is not None:
+            self._items.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= self._cost(old)
+        self._items[key] = pixmap
+        self.bytes += self._cost(pixmap)
+        while self.bytes > self.max_bytes and len(self._items) > 1:
+            _, evicted = self._items.popitem(last=False)
+            self.bytes -= self._cost(evicted)
+
+
+class DiskImageStore:
+    """Downloaded image bytes kept in a directory, oldest used removed past `max_bytes`."""
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        # file name -> size, ordered from least to most recently used
+        self._files = OrderedDict()
+        entries = []
+        for entry in os.scandir(directory):
+            if entry.is_file() and entry.name.endswith('.img'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._files[name] = size
+        self.bytes = sum(self._files.values())
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._files)
+
+    @staticmethod
+    def _name(url):
+        return hashlib.sha1(url.encode()).hexdigest() + '.img'
+
+    def locate(self, url):
+        """The path of the stored image, marked as just used, or None; nothing is read yet."""
+        name = self._name(url)
+        if name not in self._files:
+            return None
+        self._files.move_to_end(name)
+        return os.path.join(self.directory, name)
+
+    @staticmethod
+    def read(path):
+        """The bytes at `path`, or None if the file is gone; safe off the GUI thread."""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # mtime doubles as last use, so the order survives restarts
+        except OSError:
+            return None
+        return data
+
+    def discard(self, url):
+        """Forget an image whose file could not be read."""
+        size = self._files.pop(self._name(url), None)
+        if size is not None:
+            self.bytes -= size
+
+    def put(self, url, data):
+        name = self._name(url)
+        path = os.path.join(self.directory, name)
+        try:
+            # Write aside and rename so a crash never leaves a truncated image
+            with open(path + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            print(f"Error caching image {url}: {e}")
+            return
+        self.bytes += len(data) - self._files.pop(name, 0)
+        self._files[name] = len(data)
+        while self.bytes > self.max_bytes and len(self._files) > 1:
+            evicted, size = self._files.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(os.path.join(self.directory, evicted))
+            except OSError:
+                pass
+
+
+class ThumbnailLoader(QObject):
+    """Loads images for the GUI without blocking it, from memory, disk or the network.
+
+    Scaled pixmaps are served from an in-memory LRU, raw image bytes from
+    an on-disk store when a `cache_dir` is given, and only misses in both
+    are downloaded. Downloads run on the Qt event loop; requests beyond
+    `max_in_flight` wait in a FIFO queue, and several widgets asking for
+    the same URL share one download. Decoding and scaling run as
+    DecodeJobs on a thread pool, so the GUI thread only sets finished
+    images.
+    """
+
+    def __init__(self, max_in_flight=6, cache_dir=None, memory_bytes=64 * 1024 * 1024,
+                 disk_bytes=256 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.max_in_flight = max_in_flight
+        self.manager = QNetworkAccessManager(self)
+        self.manager.finished.connect(self._on_finished)
+        self.memory = PixmapLRU(memory_bytes)
+        self.disk = DiskImageStore(cache_dir, disk_bytes) if cache_dir else None
+        self._queue = deque()
+        self._callbacks = {}
+        self._errbacks = {}
+        self._in_flight = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+        # Leave a core for the GUI thread
+        self.decoders = QThreadPool(self)
+        self.decoders.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
+        self._signals = _DecodeSignals(self)
+        self._signals.decoded.connect(self._on_decoded)
+        self.decode_timings = deque(maxlen=256)  # (url, milliseconds) of recent decodes
+        self.decode_failures = 0
+
+    def load(self, url, callback, size, on_error=None):
+        """Call `callback(pixmap)` with the image at `url` scaled to fit `size` (a QSize).
+
+        `on_error()` is called instead if the image will not arrive: the
+        download or decode failed, or the request was cancelled.
+        """
+        key = (url, size.width(), size.height())
+        pixmap = self.memory.get(key)
+        if pixmap is not None:
+            self.memory_hits += 1
+            callback(pixmap)
+            return
+        if on_error is not None:
+            self._errbacks.setdefault(url, []).append(on_error)
+        if url in self._callbacks:
+            # Already queued, downloading or decoding, just wait for the same image
+            self._callbacks[url].append((callback, size))
+            return
+        self._callbacks[url] = [(callback, size)]
+        path = self.disk.locate(url) if self.disk else None
+        if path is not None:
+            # The file is read by the DecodeJob, not on the GUI thread; it
+            # only counts as a disk hit once it decoded
+            self._decode(url, None, 'disk', path)
+            return
+        self.misses += 1
+        self._queue.append(url)
+        self._pump()
+
+    def peek(self, url, size):
+        """The scaled pixmap if it is already in memory, without loading or counting a lookup."""
+        return self.memory.get((url, size.width(), size.height()))
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        timings = [ms for _, ms in self.decode_timings]
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            'memory_items': len(self.memory),
+            'memory_bytes': self.memory.bytes,
+            'disk_items': len(self.disk) if self.disk else 0,
+            'disk_bytes': self.disk.bytes if self.disk else 0,
+            'disk_evictions': self.disk.evictions if self.disk else 0,
+            'decodes': len(timings),
+            'decode_failures': self.decode_failures,
+            'decode_avg_ms': sum(timings) / len(timings) if timings else 0.0,
+            'decode_max_ms': max(timings) if timings else 0.0,
+        }
+
+    def _decode(self, url, data, source, path=None):
+        sizes = {(size.width(), size.height()) for _, size in self._callbacks.get(url, [])}
+        self.decoders.start(DecodeJob(url, data, sizes, source, self._signals, path))
+
+    def _on_decoded(self, url, data, images, source, elapsed):
+        """Runs on the GUI thread once a DecodeJob finished."""
+        if images is None:
+            if source == 'disk':
+                if data is None:
+                    # The cache file went missing
+                    self.disk.discard(url)
+                else:
+                    self.decode_failures += 1
+                # A damaged or missing cache file, fetch the image again
+                self.misses += 1
+                self._queue.append(url)
+                self._pump()
+                return
+            self.decode_failures += 1
+            print(f"Failed to decode image data for {url}")
+            self._fail(url)
+            return
+        self.decode_timings.append((url, elapsed * 1000))
+        if source == 'disk':
+            self.disk_hits += 1
+        if source == 'network' and self.disk:
+            self.disk.put(url, data)
+        
+        missing = []
+        for callback, size in self._callbacks.pop(url, []):
+            dims = (size.width(), size.height())
+            pixmap = self.memory.get((url, *dims))
+            if pixmap is None:
+                if dims not in images:
+                    # Asked for at a new size while the job was running
+                    missing.append((callback, size))
+                    continue
+                pixmap = QPixmap.fromImage(images[dims])
+                self.memory.put((url, *dims), pixmap)
+            try:
+                callback(pixmap)
+            except RuntimeError:
+                # The widget was deleted while its image was loading
+                pass
+        if missing:
+            self._callbacks[url] = missing
+            self._decode(url, data, 'memory')
+        else:
+            self._errbacks.pop(url, None)
+
+    def cancel(self, urls):
+        """Drop the queued downloads of `urls`, e.g. for removed cards; started ones still finish."""
+        dropped = set(urls).intersection(self._queue)
+        if not dropped:
+            return
+        self._queue = deque(url for url in self._queue if url not in dropped)
+        for url in dropped:
+            self._fail(url)
+
+    def _fail(self, url):
+        """Drop every request for `url` and tell the callers that asked to know."""
+        self._callbacks.pop(url, None)
+        for on_error in self._errbacks.pop(url, []):
+            try:
+                on_error()
+            except RuntimeError:
+                # The widget was deleted while its image was loading
+                pass
+
+    def _pump(self):
+        while self._queue and self._in_flight < self.max_in_flight:
+            url = self._queue.popleft()
+            request = QNetworkRequest(QUrl(url))
+            request.setRawHeader(b"User-Agent", USER_AGENT)
+            request.setRawHeader(b"Accept", b"image/webp,image/apng,image/*,*/*;q=0.8")
+            reply = self.manager.get(request)
+            reply.setProperty("image_url", url)
+            self._in_flight += 1
+
+    def _on_finished(self, reply):
+        self._in_flight -= 1
+        url = reply.property("image_url")
+        try:
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                print(f"Error loading image {url}: {reply.errorString()}")
+                self._fail(url)
+                return
+            if url in self._callbacks:
+                self._decode(url, bytes(reply.readAll()), 'network')
+        finally:
+            reply.deleteLater()
+            self._pump()
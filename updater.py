@@ -0,0 +1,149 @@
+import asyncio
+
+from aiotube import Channel, Video
+from aiotube.cache import get_cache
+from aiotube.pool import run as run_in_pool
+
+
+class UpdateEngine:
+    """Checks tracked channels for new uploads with bounded concurrency.
+
+    Every check awaits the async aiotube API, whose network I/O and page
+    parsing run on aiotube's own I/O thread, so the qasync event loop stays
+    free to repaint the GUI. Results are yielded in completion order so
+    callers can report them as they land.
+    """
+
+    # Feed entries read per channel; their publish times feed the scheduler
+    RECENT_UPLOADS = 15
+
+    def __init__(self, max_concurrency=16):
+        self.max_concurrency = max_concurrency
+
+    @staticmethod
+    def _result(channel, status='unchanged', channel_data=None, error=None, published=None,
+                videos=None, new_videos=None):
+        return {
+            'channel_name': channel['channel_name'],
+            'channel_id': channel['channel_id'],
+            'status': status,
+            'channel_data': channel_data,
+            'error': error,
+            'published': published or [],
+            'videos': videos or [],
+            'new_videos': new_videos or []
+        }
+
+    @staticmethod
+    def video_label(entry):
+        """A feed entry's title, or its id for entries from the uploads tab."""
+        return entry.get('title') or f"https://www.youtube.com/watch?v={entry['video_id']}"
+
+    @staticmethod
+    def unseen(channel, entries, seen):
+        """The entries whose video ids are not in `seen`, newest first.
+
+        A channel without any recorded uploads yet (just added, or tracked
+        before uploads were recorded) only compares its latest upload, so its
+        back catalogue is taken as already known instead of reported as new.
+        """
+        if not seen:
+            return entries[:1] if entries and entries[0]['video_id'] != channel['video_id'] else []
+        return [entry for entry in entries if entry['video_id'] not in seen]
+
+    @classmethod
+    async def fetch_video(cls, channel, latest_video_id, published=None, **history):
+        """Build the 'new' result for a row whose latest upload changed."""
+        try:
+            # Only the details block is needed, stop reading the page once it is found
+            video = await Video.fetch(latest_video_id, streaming=True)
+            video_metadata = video.metadata
+        except Exception as e:
+            return cls._result(channel, 'error', error=str(e), published=published)
+        return cls._result(channel, 'new', published=published, **history, channel_data={
+            'channel_name': channel['channel_name'],
+            'channel_id': channel['channel_id'],
+            'video_id': latest_video_id,
+            'video_title': video_metadata.get('title', 'Video information unavailable'),
+            'video_views': str(video_metadata.get('views', 'N/A')),
+            'upload_date': str(video_metadata.get('upload_date', 'N/A'))
+        })
+
+    @classmethod
+    def feed_result(cls, channel, entry, published=None, **history):
+        """Build the 'new' result straight from a feed entry."""
+        return cls._result(channel, 'new', published=published, **history, channel_data={
+            'channel_name': channel['channel_name'],
+            'channel_id': channel['channel_id'],
+            'video_id': entry['video_id'],
+            'video_title': entry['title'],
+            'video_views': str(entry['views'] if entry['views'] is not None else 'N/A'),
+            'upload_date': entry['published']
+        })
+
+    async def run(self, channels, seen=None, revalidate=False):
+        """Check every channel row, yielding each result as soon as it finishes.
+
+        `seen` maps channel ids to the video ids already recorded for them
+        (Database.seen_videos); every result lists the channel's recent uploads
+        in 'videos' and the ones not seen before in 'new_videos'. With
+        `revalidate` the cached feeds and uploads tabs are asked again even if
+        they are younger than their cache TTL, so a manual update right after
+        another one still sees a video published in between.
+        """
+        rows = {channel['channel_id']: channel for channel in channels}
+        seen = seen or {}
+        cache = get_cache()
+        if revalidate and cache:
+            # Kept as stale copies: an unchanged feed still costs only a 304
+            await run_in_pool(cache.expire, 'channel_feed', 'uploads_data')
+        results = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        details = []
+
+        async def bounded_fetch(channel, latest_video_id, published, history):
+            async with semaphore:
+                await results.put(await self.fetch_video(channel, latest_video_id, published, **history))
+
+        async def scan():
+            try:
+                await check_all()
+            finally:
+                await results.put(None)
+
+        async def check_all():
+            # Each channel's Atom feed is read, falling back to its uploads tab;
+            # the about page is never downloaded. Feed reads and watch page
+            # fetches take slots from one semaphore, so together they never
+            # exceed max_concurrency.
+            async for channel_id, entries in Channel.aiter_recent_uploads(
+                    rows, self.RECENT_UPLOADS, self.max_concurrency, semaphore):
+                channel = rows[channel_id]
+                if isinstance(entries, Exception):
+                    await results.put(self._result(channel, 'error', error=str(entries)))
+                    continue
+                published = [entry['published'] for entry in entries if entry['published']]
+                history = {'videos': entries, 'new_videos': self.unseen(channel, entries, seen.get(channel_id))}
+                if not history['new_videos']:
+                    await results.put(self._result(channel, published=published, **history))
+                elif entries[0]['video_id'] == channel['video_id']:
+                    # Only older uploads that were missed: new, but the card keeps its video
+                    await results.put(self._result(channel, 'new', published=published, **history))
+                elif entries[0]['title'] and entries[0]['published']:
+                    # The feed already carries title and date, no watch page needed
+                    await results.put(self.feed_result(channel, entries[0], published, **history))
+                else:
+                    details.append(asyncio.ensure_future(
+                        bounded_fetch(channel, entries[0]['video_id'], published, history)))
+            await asyncio.gather(*details)
+
+        scanner = asyncio.ensure_future(scan())
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            await scanner
+        finally:
+            # Stop outstanding checks if the consumer goes away early
+            scanner.cancel()
+            for task in details:
+                task.cancel()